@@ -0,0 +1,91 @@
+"""Hatch build hook persisting snapshots of the package metadata and OpenAPI schemas into the wheel.
+
+- The metadata snapshot is read by template_demo.utils._constants on import instead of parsing the dist-info.
+- The OpenAPI snapshot is read by template_demo.utils._openapi instead of generating the schemas.
+    Generating it imports the API, so it is skipped with a warning if the build environment lacks
+    the dependencies, e.g. in isolated builds. Build with --no-build-isolation to include it.
+- Editable installs get no snapshots, so changes take effect without rebuilding.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+SNAPSHOT_PATH = "template_demo/utils/_metadata_snapshot.py"
+OPENAPI_SNAPSHOT_PATH = "template_demo/_openapi_snapshot"
+_WRITE_OPENAPI_SNAPSHOT = (
+    "import sys; from pathlib import Path; from template_demo.utils._openapi import write_openapi_snapshot; "
+    "write_openapi_snapshot(Path(sys.argv[1]))"
+)
+
+
+class SnapshotBuildHook(BuildHookInterface):  # type: ignore[type-arg]
+    """Build hook generating snapshots of the package metadata and OpenAPI schemas in wheels."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        """Generate the snapshots and add them to the wheel.
+
+        Args:
+            version: Version of the target, e.g. standard or editable.
+            build_data: Build data to amend.
+        """
+        if self.target_name != "wheel" or version == "editable":
+            return
+        core = self.metadata.core
+        author = next((author for author in core.authors if author.get("email")), None)
+        snapshot = {
+            "version": self.metadata.version,
+            "author_name": author.get("name") if author else None,
+            "author_email": author["email"] if author else None,
+            "urls": dict(core.urls),
+        }
+        self._snapshot_dir = Path(tempfile.mkdtemp())
+        path = self._snapshot_dir / "_metadata_snapshot.py"
+        path.write_text(
+            f'"""Package metadata generated at build time by hatch_build.py."""\n\nSNAPSHOT = {snapshot!r}\n',
+            encoding="utf-8",
+        )
+        build_data["force_include"][str(path)] = SNAPSHOT_PATH
+        self._add_openapi_snapshot(build_data)
+
+    def _add_openapi_snapshot(self, build_data: dict[str, Any]) -> None:
+        """Generate the OpenAPI schemas in a separate interpreter and add them to the wheel.
+
+        Args:
+            build_data: Build data to amend.
+        """
+        directory = self._snapshot_dir / "openapi"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(Path(self.root) / "src"), os.getenv("PYTHONPATH", "")])}
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _WRITE_OPENAPI_SNAPSHOT, str(directory)],
+            capture_output=True,
+            check=False,
+            env=env,
+            text=True,
+        )
+        if result.returncode != 0:
+            last_line = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+            self.app.display_warning(f"Skipping OpenAPI snapshot, as the API cannot be imported: {last_line}")
+            return
+        for path in sorted(directory.glob("*.json")):
+            build_data["force_include"][str(path)] = f"{OPENAPI_SNAPSHOT_PATH}/{path.name}"
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:  # noqa: ARG002
+        """Remove the generated snapshots.
+
+        Args:
+            version: Version of the target.
+            build_data: Build data.
+            artifact_path: Path of the built artifact.
+        """
+        snapshot_dir = getattr(self, "_snapshot_dir", None)
+        if snapshot_dir is not None:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
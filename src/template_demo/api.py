@@ -2,21 +2,40 @@
 
 - Provides a versioned API
 - Automatically registers APIs of modules and mounts them to the main API.
+- Apps are created by create_app, importing this module does not create one.
+    The app configured via environment, api, is created on first access.
 """
 
+import asyncio
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import Annotated
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .constants import API_VERSIONS
 from .utils import (
+    AdmissionMiddleware,
+    CachedOpenAPI,
+    CompressionMiddleware,
+    RateLimitMiddleware,
+    TimingMiddleware,
     VersionedAPIRouter,
     __author_email__,
     __author_name__,
     __base__url__,
     __documentation__url__,
+    __env_file__,
+    __project_name__,
     __repository_url__,
     load_modules,
+    load_settings,
+    warm_openapi,
 )
 
 TITLE = "template-demo"
@@ -31,33 +50,86 @@ API_BASE_URL = __base__url__
 if not API_BASE_URL:
     API_BASE_URL = f"http://{UVICORN_HOST}:{UVICORN_PORT}"
 
-api = FastAPI(
-    root_path="/api",
-    title=TITLE,
-    contact={
-        "name": CONTACT_NAME,
-        "email": CONTACT_EMAIL,
-        "url": CONTACT_URL,
-    },
-    terms_of_service=TERMS_OF_SERVICE_URL,
-    openapi_tags=[
-        {
-            "name": version,
-            "description": f"API version {version.lstrip('v')}, check link on the right",
-            "externalDocs": {
-                "description": "sub-docs",
-                "url": f"{API_BASE_URL}/api/{version}/docs",
-            },
-        }
-        for version, _ in API_VERSIONS.items()
-    ],
-)
+ROOT_PATH = "/api"
+
+
+class APISettings(BaseSettings):
+    """Settings of the webservice API."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_API_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    flat: Annotated[
+        bool,
+        Field(
+            description=(
+                "Route all API versions in a single router instead of mounting an app per version. "
+                "Saves each request the routing, middleware stack and exception handling of a second app."
+            ),
+            default=False,
+        ),
+    ]
+    lazy: Annotated[
+        bool,
+        Field(
+            description=(
+                "Register the routers of an API version on the first request to it instead of on creation "
+                "of the app, so creating the app neither imports all modules nor builds all routes."
+            ),
+            default=False,
+        ),
+    ]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """Generate the OpenAPI schemas of the API versions added on creation in the background on startup.
+
+    Args:
+        app: The app created by create_app.
+
+    Yields:
+        None: While the API is serving.
+    """
+    cached_openapi: dict[str, CachedOpenAPI] = app.state.cached_openapi
+    async with warm_openapi((cached, f"{ROOT_PATH}/{version}") for version, cached in cached_openapi.items()):
+        yield
+
+
+def _version_routers(version: str) -> list[APIRouter]:
+    """Get the routers modules registered for an API version, importing all modules.
+
+    Args:
+        version: The API version, e.g. v1.
+
+    Returns:
+        list[APIRouter]: The routers.
+    """
+    load_modules()
+    return VersionedAPIRouter.get_instances(version)  # type: ignore[return-value]
 
-# Create API instances for each version
-api_instances: dict["str", FastAPI] = {}
-for version, semver in API_VERSIONS.items():
-    api_instances[version] = FastAPI(
-        version=semver,
+
+def create_version_app(version: str) -> FastAPI:
+    """Create the app of an API version, with the routers of all modules registered for it.
+
+    Args:
+        version: The API version, e.g. v1.
+
+    Returns:
+        FastAPI: The app.
+
+    Raises:
+        ValueError: If the API version is unknown.
+    """
+    if version not in API_VERSIONS:
+        message = f"Unknown API version '{version}', available versions: {', '.join(API_VERSIONS)}"
+        raise ValueError(message)
+    app = FastAPI(
+        version=API_VERSIONS[version],
         title=TITLE,
         contact={
             "name": CONTACT_NAME,
@@ -66,15 +138,155 @@ for version, semver in API_VERSIONS.items():
         },
         terms_of_service=TERMS_OF_SERVICE_URL,
     )
+    for router in _version_routers(version):
+        app.include_router(router)
+    return app
+
+
+def _add_version(app: FastAPI, version: str) -> None:
+    """Add an API version to an app created by create_app, serving its OpenAPI schema pre-serialized.
+
+    Args:
+        app: The app.
+        version: The API version, e.g. v1.
+    """
+    version_app = create_version_app(version)
+    cached = CachedOpenAPI(version_app, version)
+    if app.state.settings.flat:
+        for router in _version_routers(version):
+            app.include_router(router, prefix=f"/{version}", include_in_schema=False)
+        cached.add_routes(app, f"/{version}")
+    else:
+        app.mount(f"/{version}", version_app)
+    app.state.cached_openapi[version] = cached
+
+
+def _requested_version(scope: Scope) -> str | None:
+    """Get the API version a request is for, from the first segment of its path below the root path.
+
+    Args:
+        scope: The ASGI connection scope.
+
+    Returns:
+        str | None: The API version, or None if the path is not below an API version.
+    """
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    version = path.split("/", 2)[1] if path.startswith("/") else ""
+    return version if version in API_VERSIONS else None
+
+
+class _LazyVersionsMiddleware:
+    """ASGI middleware adding API versions to an app on the first request to them."""
+
+    def __init__(self, app: ASGIApp, root: FastAPI) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            root: The app created by create_app, to add API versions to.
+        """
+        self.app = app
+        self.root = root
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request, adding the API version requested first.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] in {"http", "websocket"}:
+            version = _requested_version(scope)
+            if version is not None and version not in self.root.state.cached_openapi:
+                async with self._lock:
+                    if version not in self.root.state.cached_openapi:
+                        # Importing modules and building routes blocks, so keep serving other requests meanwhile
+                        await asyncio.to_thread(_add_version, self.root, version)
+        await self.app(scope, receive, send)
+
+
+def create_app(settings: APISettings | None = None) -> FastAPI:
+    """Create an app of the webservice API, serving all API versions under the root path.
+
+    - Apps are isolated from each other, e.g. to create one per test or embed several into one process.
+    - Unless lazy, all API versions are added on creation, and their OpenAPI schemas generated
+        in the background on startup.
+
+    Args:
+        settings: Settings of the API, loaded from the environment if not given.
+
+    Returns:
+        FastAPI: The app.
+    """
+    settings = settings or load_settings(APISettings)
+    app = FastAPI(
+        root_path=ROOT_PATH,
+        lifespan=lifespan,
+        title=TITLE,
+        contact={
+            "name": CONTACT_NAME,
+            "email": CONTACT_EMAIL,
+            "url": CONTACT_URL,
+        },
+        terms_of_service=TERMS_OF_SERVICE_URL,
+        openapi_tags=[
+            {
+                "name": version,
+                "description": f"API version {version.lstrip('v')}, check link on the right",
+                "externalDocs": {
+                    "description": "sub-docs",
+                    "url": f"{API_BASE_URL}/api/{version}/docs",
+                },
+            }
+            for version, _ in API_VERSIONS.items()
+        ],
+    )
+    app.state.settings = settings
+    app.state.cached_openapi = {}  # CachedOpenAPI by API version added
+
+    if settings.lazy:
+        app.add_middleware(_LazyVersionsMiddleware, root=app)
+    else:
+        for version in API_VERSIONS:
+            _add_version(app, version)
+
+    # Limit concurrent requests per route, shedding load when saturated
+    app.add_middleware(AdmissionMiddleware, prefixes=API_VERSIONS)
+
+    # Limit requests per client and route, before they wait for admission
+    app.add_middleware(RateLimitMiddleware, prefixes=API_VERSIONS)
+
+    # Compress responses, including the OpenAPI schemas of API versions
+    app.add_middleware(CompressionMiddleware)
+
+    # Bind trace context and record per-phase timings of all requests, including those of API versions
+    app.add_middleware(TimingMiddleware)
+    return app
+
+
+@cache
+def _default_app() -> FastAPI:
+    return create_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    """Create the app configured via environment on first access of api (PEP 562).
 
-load_modules()
+    Args:
+        name: The attribute name.
 
-# Register routers with appropriate API versions using the tracked instances
-for router in VersionedAPIRouter.get_instances():
-    version = router.version  # type: ignore
-    if version in API_VERSIONS:
-        api_instances[version].include_router(router)  # type: ignore
+    Returns:
+        FastAPI: The app.
 
-# Mount all API versions to the main app
-for version in API_VERSIONS:
-    api.mount(f"/{version}", api_instances[version])
+    Raises:
+        AttributeError: If the attribute is not api.
+    """
+    if name == "api":
+        return _default_app()
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
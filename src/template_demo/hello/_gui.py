@@ -1,11 +1,92 @@
 """Homepage (index) of GUI."""
 
+import asyncio
+import hashlib
+import io
+import threading
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated
+
+from fastapi import Query, Request, Response
 
 from template_demo.utils import BasePageBuilder, GUILocalFilePicker
 
 from ._service import Service
 
+PLOT_PATH = "/hello/plot.svg"
+PLOT_FIGSIZE = (4.0, 3.0)
+# Plots rendered for distinct parameters kept in memory
+PLOT_CACHE_SIZE = 32
+PLOT_MAX_AGE_SECONDS = 3600
+# Decimals the x-axis bounds are rounded to, bounding the number of distinct plots clients can request
+PLOT_AXIS_DECIMALS = 1
+
+_plot_lock = threading.Lock()
+
+
+@lru_cache(maxsize=PLOT_CACHE_SIZE)
+def _render_plot(start: float, stop: float) -> tuple[bytes, str]:
+    """Render the plot of a damped cosine as SVG.
+
+    Uses the object-oriented API of matplotlib instead of pyplot, so rendering is safe off the main thread.
+
+    Args:
+        start: Start of the x-axis.
+        stop: End of the x-axis.
+
+    Returns:
+        tuple[bytes, str]: The SVG and its entity tag.
+    """
+    import numpy as np  # noqa: PLC0415
+    from matplotlib.figure import Figure  # noqa: PLC0415
+
+    x = np.linspace(start, stop)
+    y = np.cos(2 * np.pi * x) * np.exp(-x)
+    fig = Figure(figsize=PLOT_FIGSIZE)
+    fig.gca().plot(x, y, "-")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="svg")
+    svg = buffer.getvalue()
+    return svg, hashlib.sha256(svg).hexdigest()[:32]
+
+
+def _get_plot(start: float, stop: float) -> tuple[bytes, str]:
+    """Get the rendered plot, rendering each distinct plot once even if requested concurrently.
+
+    Args:
+        start: Start of the x-axis.
+        stop: End of the x-axis.
+
+    Returns:
+        tuple[bytes, str]: The SVG and its entity tag.
+    """
+    with _plot_lock:
+        return _render_plot(start, stop)
+
+
+async def plot_svg(
+    request: Request,
+    start: Annotated[float, Query(ge=-100, le=100)] = 0.0,
+    stop: Annotated[float, Query(ge=-100, le=100)] = 5.0,
+) -> Response:
+    """Serve the plot shown on the homepage, rendered off the event loop on first request.
+
+    Args:
+        request: The request, checked for a matching entity tag.
+        start: Start of the x-axis, rounded to PLOT_AXIS_DECIMALS.
+        stop: End of the x-axis, rounded to PLOT_AXIS_DECIMALS.
+
+    Returns:
+        Response: The SVG, or 304 Not Modified if the client has it already.
+    """
+    start, stop = round(start, PLOT_AXIS_DECIMALS), round(stop, PLOT_AXIS_DECIMALS)
+    svg, etag = await asyncio.to_thread(_get_plot, start, stop)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": f"public, max-age={PLOT_MAX_AGE_SECONDS}"}
+    if headers["ETag"] in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(svg, media_type="image/svg+xml", headers=headers)
+
 
 async def pick_file() -> None:
     """Open a file picker dialog and show notifier when closed again."""
@@ -18,7 +99,9 @@ async def pick_file() -> None:
 class PageBuilder(BasePageBuilder):
     @staticmethod
     def register_pages() -> None:
-        from nicegui import ui  # noqa: PLC0415
+        from nicegui import app, ui  # noqa: PLC0415
+
+        app.add_api_route(PLOT_PATH, plot_svg, methods=["GET"], include_in_schema=False)
 
         @ui.page("/")
         def page_index() -> None:
@@ -34,13 +117,9 @@ class PageBuilder(BasePageBuilder):
             from importlib.util import find_spec  # noqa: PLC0415
 
             if find_spec("matplotlib") and find_spec("numpy"):
-                import numpy as np  # noqa: PLC0415
-
-                with ui.card().tight().mark("CARD_PLOT"):  # noqa: SIM117
-                    with ui.matplotlib(figsize=(4, 3)).figure as fig:
-                        x = np.linspace(0.0, 5.0)
-                        y = np.cos(2 * np.pi * x) * np.exp(-x)
-                        ax = fig.gca()
-                        ax.plot(x, y, "-")
+                with ui.card().tight().mark("CARD_PLOT"):
+                    ui.image(f"{PLOT_PATH}?start=0.0&stop=5.0").style(
+                        f"width: {PLOT_FIGSIZE[0]}in; height: {PLOT_FIGSIZE[1]}in"
+                    )
 
             ui.link("Info", "/info").mark("LINK_INFO")
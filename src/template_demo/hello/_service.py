@@ -5,15 +5,18 @@ import string
 from http import HTTPStatus
 from typing import Any
 
-import logfire
 import requests
+from opentelemetry import metrics
 
-from template_demo.utils import BaseService, Health
+from template_demo.utils import BaseService, Health, single_flight
 
 from ._constants import HELLO_WORLD_DE_DE, HELLO_WORLD_EN_US
 from ._models import Echo, Utterance
 from ._settings import Language, Settings
 
+# Recorded via the OpenTelemetry API, which forwards to the meter provider set up by logfire if configured
+_messages_sent = metrics.get_meter(__name__).create_counter("hello_world_messages_sent")
+
 
 # Services derived from BaseService and exported by modules via their __init__.py are automatically registered
 # with the system module, enabling for dynamic discovery of health, info and further functionality.
@@ -55,9 +58,12 @@ class Service(BaseService):
         except requests.RequestException as e:
             return Health(status=Health.Code.DOWN, reason=str(e))
 
+    @single_flight()
     def health(self) -> Health:
         """Determine health of hello service.
 
+        Concurrent calls share one determination, including its connectivity check.
+
         Returns:
             Health: The health of the service.
         """
@@ -75,8 +81,7 @@ class Service(BaseService):
         Returns:
             str: Hello world message.
         """
-        messages_sent = logfire.metric_counter("hello_world_messages_sent")
-        messages_sent.add(1)
+        _messages_sent.add(1)
 
         match self._settings.language:
             case Language.GERMAN:
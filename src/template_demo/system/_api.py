@@ -2,19 +2,30 @@
 
 This module provides a webservice API with several operations:
 - A health/healthz endpoint that returns the health status of the service
+- An info endpoint that returns the aggregate info of the system
+- Info job endpoints computing the info in the background, to be polled for the result
+- Diagnostics endpoints sleeping and burning CPU or memory on request, to validate concurrency and profiling,
+    disabled unless configured
 
 The endpoints use Pydantic models for request and response validation.
 """
 
+import asyncio
+import time
 from collections.abc import Callable, Generator
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from ..constants import API_VERSIONS  # noqa: TID252
-from ..utils import Health, VersionedAPIRouter  # noqa: TID252
+from ..utils import Health, JobQueueFullError, JobStatus, VersionedAPIRouter  # noqa: TID252
 from ._service import Service
 
+# Seconds requests for the status of a job wait for it to finish at most
+INFO_JOB_MAX_WAIT = 30.0
+# Seconds clients are asked to wait before retrying submissions rejected as too many jobs are pending
+INFO_JOB_RETRY_AFTER = 1
+
 
 def get_service() -> Generator[Service, None, None]:
     """Get instance of Service.
@@ -100,7 +111,7 @@ def register_info_endpoint(router: APIRouter) -> Callable[..., dict[str, Any]]:
             dict[str, Any]: The aggregate info of the system.
         """
         if service.is_token_valid(token):
-            return service.info(include_environ=True, filter_secrets=False)
+            return service.cached_info(include_environ=True, filter_secrets=False)
 
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"error": "Forbidden"}
@@ -108,9 +119,234 @@ def register_info_endpoint(router: APIRouter) -> Callable[..., dict[str, Any]]:
     return info_endpoint
 
 
+def register_info_job_endpoints(router: APIRouter) -> tuple[Callable[..., Any], Callable[..., Any]]:
+    """Register info job endpoints to the given router.
+
+    Args:
+        router: The router to register the info job endpoints to.
+
+    Returns:
+        tuple[Callable[..., Any], Callable[..., Any]]: The endpoint functions submitting and getting jobs.
+    """
+
+    @router.post("/system/info/jobs", status_code=status.HTTP_202_ACCEPTED)
+    def submit_info_job_endpoint(
+        service: Annotated[Service, Depends(get_service)], request: Request, response: Response, token: str
+    ) -> JobStatus | dict[str, str]:
+        """Compute aggregate info of the system in the background.
+
+        Returns the job right away, with its URL in the Location header.
+        Concurrent submissions share the job in flight, and submissions within the info cache TTL
+            share the job succeeded last.
+
+        If the token does not match the setting, a 403 Forbidden status code is returned.
+        If too many jobs are pending, a 503 Service Unavailable status code is returned.
+
+        Args:
+            service (Service): The service instance.
+            request (Request): The FastAPI request object.
+            response (Response): The FastAPI response object.
+            token (str): Token to present.
+
+        Returns:
+            JobStatus | dict[str, str]: The job.
+        """
+        if not service.is_token_valid(token):
+            response.status_code = status.HTTP_403_FORBIDDEN
+            return {"error": "Forbidden"}
+        try:
+            job = service.submit_info_job(include_environ=True, filter_secrets=False)
+        except JobQueueFullError:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            response.headers["Retry-After"] = str(INFO_JOB_RETRY_AFTER)
+            return {"error": "Too many pending jobs"}
+        response.headers["Location"] = f"{request.url.path.rstrip('/')}/{job.id}"
+        return job.status()
+
+    @router.get("/system/info/jobs/{job_id}")
+    async def get_info_job_endpoint(
+        service: Annotated[Service, Depends(get_service)],
+        response: Response,
+        job_id: str,
+        token: str,
+        wait: Annotated[float, Query(ge=0.0, le=INFO_JOB_MAX_WAIT)] = 0.0,
+    ) -> JobStatus | dict[str, str]:
+        """Get a job computing aggregate info of the system, with the info once succeeded.
+
+        Long-polls if wait is given, i.e. responds once the job finished or wait seconds passed.
+
+        If the token does not match the setting, a 403 Forbidden status code is returned.
+        If the job is unknown or its result expired, a 404 Not Found status code is returned.
+
+        Args:
+            service (Service): The service instance.
+            response (Response): The FastAPI response object.
+            job_id (str): Identifier of the job.
+            token (str): Token to present.
+            wait (float): Seconds to wait for the job to finish at most.
+
+        Returns:
+            JobStatus | dict[str, str]: The job.
+        """
+        if not service.is_token_valid(token):
+            response.status_code = status.HTTP_403_FORBIDDEN
+            return {"error": "Forbidden"}
+        job = service.get_info_job(job_id)
+        if job is None:
+            response.status_code = status.HTTP_404_NOT_FOUND
+            return {"error": "Not Found"}
+        await job.wait(wait)
+        return job.status()
+
+    return submit_info_job_endpoint, get_info_job_endpoint
+
+
+def _diagnostics_error(
+    service: Service, response: Response, token: str, seconds: float, megabytes: int = 0
+) -> dict[str, str] | None:
+    """Check a diagnostics request, setting the status code of the response if rejected.
+
+    Args:
+        service (Service): The service instance.
+        response (Response): The FastAPI response object.
+        token (str): Token presented.
+        seconds (float): Requested duration in seconds.
+        megabytes (int): Requested allocation in megabytes.
+
+    Returns:
+        dict[str, str] | None: The error to respond with, or None if the request is to be served.
+    """
+    if not service.is_diagnostics_enabled():
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"error": "Not Found"}
+    if not service.is_token_valid(token):
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return {"error": "Forbidden"}
+    exceeded = service.diagnostics_limit_exceeded(seconds, megabytes)
+    if exceeded is not None:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"error": exceeded}
+    return None
+
+
+def register_diagnostics_endpoints(
+    router: APIRouter,
+) -> tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """Register diagnostics endpoints to the given router.
+
+    Args:
+        router: The router to register the diagnostics endpoints to.
+
+    Returns:
+        tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]: The endpoint functions sleeping,
+            burning CPU and burning memory.
+    """
+
+    @router.get("/system/diagnostics/sleep")
+    async def diagnostics_sleep_endpoint(
+        service: Annotated[Service, Depends(get_service)],
+        response: Response,
+        token: str,
+        seconds: Annotated[float, Query(ge=0.0)] = 1.0,
+    ) -> dict[str, Any]:
+        """Sleep without blocking the event loop, to validate concurrency behavior.
+
+        If diagnostics are disabled, a 404 Not Found status code is returned.
+        If the token does not match the setting, a 403 Forbidden status code is returned.
+        If the duration exceeds the configured maximum, a 400 Bad Request status code is returned.
+
+        Args:
+            service (Service): The service instance.
+            response (Response): The FastAPI response object.
+            token (str): Token to present.
+            seconds (float): Number of seconds to sleep.
+
+        Returns:
+            dict[str, Any]: The elapsed seconds.
+        """
+        error = _diagnostics_error(service, response, token, seconds)
+        if error is not None:
+            return error
+        start = time.perf_counter()
+        await service.sleep_async(seconds)
+        return {"seconds": time.perf_counter() - start}
+
+    @router.get("/system/diagnostics/cpu")
+    async def diagnostics_cpu_endpoint(
+        service: Annotated[Service, Depends(get_service)],
+        response: Response,
+        token: str,
+        seconds: Annotated[float, Query(ge=0.0)] = 1.0,
+        on_event_loop: bool = False,
+    ) -> dict[str, Any]:
+        """Keep a thread busy computing, to validate CPU profiling and event loop blocking detection.
+
+        Computes in a worker thread, or on the event loop if on_event_loop is set, blocking it meanwhile.
+        Either way, the computation holds the GIL.
+
+        If diagnostics are disabled, a 404 Not Found status code is returned.
+        If the token does not match the setting, a 403 Forbidden status code is returned.
+        If the duration exceeds the configured maximum, a 400 Bad Request status code is returned.
+
+        Args:
+            service (Service): The service instance.
+            response (Response): The FastAPI response object.
+            token (str): Token to present.
+            seconds (float): Number of seconds to compute.
+            on_event_loop (bool): Compute on the event loop instead of a worker thread.
+
+        Returns:
+            dict[str, Any]: The elapsed seconds and number of iterations computed.
+        """
+        error = _diagnostics_error(service, response, token, seconds)
+        if error is not None:
+            return error
+        start = time.perf_counter()
+        if on_event_loop:
+            iterations = service.burn_cpu(seconds)
+        else:
+            iterations = await asyncio.to_thread(service.burn_cpu, seconds)
+        return {"seconds": time.perf_counter() - start, "iterations": iterations}
+
+    @router.get("/system/diagnostics/memory")
+    async def diagnostics_memory_endpoint(
+        service: Annotated[Service, Depends(get_service)],
+        response: Response,
+        token: str,
+        megabytes: Annotated[int, Query(ge=1)] = 16,
+        seconds: Annotated[float, Query(ge=0.0)] = 1.0,
+    ) -> dict[str, Any]:
+        """Allocate memory and hold it in a worker thread, to validate memory profiling.
+
+        If diagnostics are disabled, a 404 Not Found status code is returned.
+        If the token does not match the setting, a 403 Forbidden status code is returned.
+        If the duration or allocation exceeds the configured maximum, a 400 Bad Request status code is returned.
+
+        Args:
+            service (Service): The service instance.
+            response (Response): The FastAPI response object.
+            token (str): Token to present.
+            megabytes (int): Number of megabytes to allocate.
+            seconds (float): Number of seconds to hold the memory.
+
+        Returns:
+            dict[str, Any]: The elapsed seconds and number of bytes allocated.
+        """
+        error = _diagnostics_error(service, response, token, seconds, megabytes)
+        if error is not None:
+            return error
+        start = time.perf_counter()
+        allocated = await asyncio.to_thread(service.burn_memory, megabytes, seconds)
+        return {"seconds": time.perf_counter() - start, "bytes": allocated}
+
+    return diagnostics_sleep_endpoint, diagnostics_cpu_endpoint, diagnostics_memory_endpoint
+
+
 api_routers = {}
 for version in API_VERSIONS:
     router: APIRouter = VersionedAPIRouter(version, tags=["system"])  # type: ignore
     api_routers[version] = router
     health = register_health_endpoint(api_routers[version])
     info = register_info_endpoint(api_routers[version])
+    info_jobs = register_info_job_endpoints(api_routers[version])
+    diagnostics = register_diagnostics_endpoints(api_routers[version])
@@ -1,5 +1,6 @@
 """System CLI commands."""
 
+import asyncio
 import json
 import os
 from enum import StrEnum
@@ -11,7 +12,16 @@ import uvicorn
 import yaml
 
 from ..constants import API_VERSIONS  # noqa: TID252
-from ..utils import __project_name__, console, get_logger  # noqa: TID252
+from ..utils import (  # noqa: TID252
+    CLIDaemon,
+    __project_name__,
+    console,
+    daemon_request,
+    get_logger,
+    is_daemon_supported,
+    load_openapi_snapshot,
+    start_daemon,
+)
 from ._service import Service
 
 logger = get_logger(__name__)
@@ -165,8 +175,6 @@ def openapi(
     Raises:
         typer.Exit: If an invalid API version is provided.
     """
-    from ..api import api_instances  # noqa: PLC0415, TID252
-
     if api_version not in API_VERSIONS:
         available_versions = ", ".join(API_VERSIONS.keys())
         console.print(
@@ -174,7 +182,12 @@ def openapi(
         )
         raise typer.Exit(code=1)
 
-    schema = api_instances[api_version].openapi()
+    # Read the schema generated at build time if available, instead of importing and building the API
+    schema = load_openapi_snapshot(api_version)
+    if schema is None:
+        from ..api import create_version_app  # noqa: PLC0415, TID252
+
+        schema = create_version_app(api_version).openapi()
 
     match output_format:
         case OutputFormat.JSON:
@@ -194,13 +207,82 @@ def fail() -> None:
 
 @cli.command()
 def sleep(
-    seconds: Annotated[int, typer.Option(help="Duration in seconds")] = 2,
+    seconds: Annotated[float, typer.Option(help="Duration in seconds")] = 2,
+    asynchronous: Annotated[
+        bool, typer.Option(help="Sleep on an event loop instead of blocking the main thread")
+    ] = False,
 ) -> None:
     """Sleep given for given number of seconds.
 
     Args:
-        seconds (int): Number of seconds to sleep.
+        seconds (float): Number of seconds to sleep.
+        asynchronous (bool): Sleep on an event loop instead of blocking the main thread.
 
     - Used to validate performance profiling.
     """
-    Service.sleep(seconds)
+    if asynchronous:
+        asyncio.run(Service.sleep_async(seconds))
+    else:
+        Service.sleep(seconds)
+
+
+if is_daemon_supported():
+    daemon_cli = typer.Typer(
+        name="daemon",
+        help=f"Warm daemon serving CLI invocations forwarded by {__project_name__.replace('_', '-')}-client.",
+    )
+    cli.add_typer(daemon_cli)
+
+    @daemon_cli.command("serve")
+    def daemon_serve() -> None:
+        """Run the daemon in the foreground, e.g. under a service manager.
+
+        Raises:
+            typer.Exit: If a daemon is running already.
+        """
+        from ..cli import cli as root_cli  # noqa: PLC0415, TID252
+
+        try:
+            CLIDaemon(runner=lambda args: root_cli(args=args, prog_name=__project_name__.replace("_", "-"))).serve()
+        except RuntimeError as e:
+            console.print(f"[bold red]Error:[/] {e}")
+            raise typer.Exit(code=1) from e
+
+    @daemon_cli.command("start")
+    def daemon_start() -> None:
+        """Start the daemon in the background.
+
+        Raises:
+            typer.Exit: If a daemon is running already or did not get ready.
+        """
+        try:
+            status = start_daemon()
+        except RuntimeError as e:
+            console.print(f"[bold red]Error:[/] {e}")
+            raise typer.Exit(code=1) from e
+        console.print(f"Daemon started with pid {status['pid']}, listening on {status['socket_path']}")
+
+    @daemon_cli.command("stop")
+    def daemon_stop() -> None:
+        """Stop the daemon.
+
+        Raises:
+            typer.Exit: If no daemon is running.
+        """
+        if daemon_request({"type": "stop"}) is None:
+            console.print("Daemon not running")
+            raise typer.Exit(code=1)
+        console.print("Daemon stopping")
+
+    @daemon_cli.command("status")
+    def daemon_status() -> None:
+        """Print status of the daemon.
+
+        Raises:
+            typer.Exit: If no daemon is running.
+        """
+        status = daemon_request({"type": "status"})
+        if status is None:
+            console.print("Daemon not running")
+            raise typer.Exit(code=1)
+        console.print_json(data=status)
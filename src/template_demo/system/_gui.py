@@ -7,20 +7,34 @@ from ._service import Service
 class PageBuilder(BasePageBuilder):
     @staticmethod
     def register_pages() -> None:
-        from nicegui import run, ui  # noqa: PLC0415
+        from nicegui import ui  # noqa: PLC0415
 
         @ui.page("/info")
         async def page_info() -> None:
-            """Homepage of GUI."""
+            """Homepage of GUI.
+
+            Sections of the info are rendered as soon as each is computed,
+            pushing updates over the websocket of the client.
+            """
             ui.label(f"{__project_name__} v{__version__}").mark("LABEL_VERSION")
-            spinner = ui.spinner("dots", size="lg", color="red")
-            properties = {
-                "content": {"json": "Loading ..."},
-                "readOnly": True,
-            }
-            editor = ui.json_editor(properties).mark("JSON_EDITOR_INFO")
+            service = Service()
+            sections = {}
+            with ui.column().classes("w-full").mark("JSON_EDITOR_INFO"):
+                for name in service.info_section_names():
+                    with ui.expansion(name.capitalize(), value=True).classes("w-full"):
+                        spinner = ui.spinner("dots", size="lg", color="red")
+                        properties = {
+                            "content": {"json": "Loading ..."},
+                            "readOnly": True,
+                        }
+                        editor = ui.json_editor(properties).mark(f"JSON_EDITOR_INFO_{name.upper()}")
+                    sections[name] = (spinner, properties, editor)
             ui.link("Home", "/").mark("LINK_HOME")
-            info = await run.cpu_bound(Service().info, True, True)
-            properties["content"] = {"json": info}
-            editor.update()
-            spinner.delete()
+
+            # Send the page with placeholders first, then fill in sections as they arrive
+            await ui.context.client.connected()
+            async for name, section in service.info_sections(include_environ=True, filter_secrets=True):
+                spinner, properties, editor = sections[name]
+                properties["content"] = {"json": section}
+                editor.update()
+                spinner.delete()
@@ -1,12 +1,16 @@
 """System service."""
 
+import asyncio
 import json
 import os
 import platform
 import sys
+import threading
 import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from socket import AF_INET, SOCK_DGRAM, socket
-from typing import Any, NotRequired, TypedDict, cast
+from typing import Any, NotRequired, TypedDict
 from urllib.error import HTTPError
 
 from pydantic_settings import BaseSettings
@@ -16,6 +20,8 @@ from ..utils import (  # noqa: TID252
     UNHIDE_SENSITIVE_INFO,
     BaseService,
     Health,
+    Job,
+    JobQueue,
     __env__,
     __project_name__,
     __project_path__,
@@ -25,6 +31,8 @@ from ..utils import (  # noqa: TID252
     get_process_info,
     load_settings,
     locate_subclasses,
+    run_service_in_worker,
+    single_flight,
 )
 from ._settings import Settings
 
@@ -33,6 +41,16 @@ log = get_logger(__name__)
 # Note: There is multiple measurements and network calls
 MEASURE_INTERVAL_SECONDS = 5
 NETWORK_TIMEOUT = 5
+# Stride in bytes at which allocated memory is written to make it resident, see burn_memory
+MEMORY_PAGE_SIZE = 4096
+
+INFO_SECTIONS = ("package", "runtime", "cpu", "network", "settings")
+# Sections nested into the host of the runtime section when assembling the info
+HOST_INFO_SECTIONS = frozenset({"cpu", "network"})
+# Sections taking seconds to compute, as they sample the CPU or call external services
+SLOW_INFO_SECTIONS = frozenset({"cpu", "network"})
+# Environment variables whose name contains one of these are filtered as secrets
+SECRET_ENVIRON_MARKERS = ("token", "key", "secret", "password", "auth")
 
 
 class RuntimeDict(TypedDict, total=False):
@@ -55,6 +73,53 @@ class InfoDict(TypedDict, total=False):
     __extra__: NotRequired[dict[str, Any]]
 
 
+class _InfoCache:
+    """Info computed recently, shared by the webservice API and GUI.
+
+    - The info is cached unfiltered and including environment variables,
+        views for other arguments are derived from it, see Service._info_view.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entry: tuple[float, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, ttl: float) -> dict[str, Any] | None:
+        """Get info computed less than ttl seconds ago.
+
+        Args:
+            ttl: Maximum age in seconds.
+
+        Returns:
+            dict[str, Any] | None: The info, or None if not cached or expired.
+        """
+        with self._lock:
+            entry = self._entry
+        if entry is None or time.monotonic() - entry[0] >= ttl:
+            return None
+        return entry[1]
+
+    def put(self, info: dict[str, Any]) -> None:
+        """Cache info.
+
+        Args:
+            info: The info, computed unfiltered and including environment variables.
+        """
+        with self._lock:
+            self._entry = (time.monotonic(), info)
+
+    def clear(self) -> None:
+        """Forget the cached info."""
+        with self._lock:
+            self._entry = None
+
+
+_info_cache = _InfoCache()
+# Info computed in the background on behalf of the webservice API, see Service.submit_info_job
+_info_jobs = JobQueue("system-info")
+
+
 class Service(BaseService):
     """System service."""
 
@@ -73,12 +138,14 @@ class Service(BaseService):
         """
         return True
 
+    @single_flight()
     def health(self) -> Health:
         """Determine aggregate health of the system.
 
         - Health exposed by implementations of BaseService in other
             modules is automatically included into the health tree.
         - See utils/_health.py:Health for an explanation of the health tree.
+        - Concurrent calls share one determination, e.g. of probes arriving at once.
 
         Returns:
             Health: The aggregate health of the system.
@@ -105,7 +172,32 @@ class Service(BaseService):
             return False
         return token == self._settings.token.get_secret_value()
 
+    def is_diagnostics_enabled(self) -> bool:
+        """Check if diagnostics, i.e. sleeping and burning CPU or memory on request, are enabled.
+
+        Returns:
+            bool: True if diagnostics are enabled, False otherwise.
+        """
+        return self._settings.diagnostics_enabled
+
+    def diagnostics_limit_exceeded(self, seconds: float, megabytes: int = 0) -> str | None:
+        """Check a diagnostics request against the configured limits.
+
+        Args:
+            seconds (float): Requested duration in seconds.
+            megabytes (int): Requested allocation in megabytes.
+
+        Returns:
+            str | None: Description of the exceeded limit, or None if within the limits.
+        """
+        if seconds > self._settings.diagnostics_max_seconds:
+            return f"Duration exceeds the maximum of {self._settings.diagnostics_max_seconds} seconds"
+        if megabytes > self._settings.diagnostics_max_megabytes:
+            return f"Allocation exceeds the maximum of {self._settings.diagnostics_max_megabytes} megabytes"
+        return None
+
     @staticmethod
+    @single_flight()
     def _get_public_ipv4(timeout: int = NETWORK_TIMEOUT) -> str | None:
         """Get the public IPv4 address of the system.
 
@@ -125,6 +217,7 @@ class Service(BaseService):
             return None
 
     @staticmethod
+    @single_flight()
     def _get_local_ipv4() -> str | None:
         """Get the local IPv4 address of the system.
 
@@ -141,18 +234,29 @@ class Service(BaseService):
             return None
 
     @staticmethod
-    def info(include_environ: bool = False, filter_secrets: bool = True) -> dict[str, Any]:
+    def _info_package() -> dict[str, Any]:
+        """Get info about the package.
+
+        Returns:
+            dict[str, Any]: Package info.
         """
-        Get info about configuration of service.
+        return {
+            "version": __version__,
+            "name": __project_name__,
+            "repository": __repository_url__,
+            "local": __project_path__,
+        }
 
-        - Runtime information is automatically compiled.
-        - Settings are automatically aggregated from all implementations of
-            Pydantic BaseSettings in this package.
-        - Info exposed by implementations of BaseService in other modules is
-            automatically included into the info dict.
+    @staticmethod
+    def _info_runtime(include_environ: bool = False, filter_secrets: bool = True) -> RuntimeDict:
+        """Get info about the runtime, excluding the CPU and network of the host.
+
+        Args:
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
 
         Returns:
-            dict[str, Any]: Service configuration.
+            RuntimeDict: Runtime info.
         """
         import psutil  # noqa: PLC0415
         from uptime import boottime, uptime  # noqa: PLC0415
@@ -160,99 +264,121 @@ class Service(BaseService):
         bootdatetime = boottime()
         vmem = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        cpu_percent = psutil.cpu_percent(interval=MEASURE_INTERVAL_SECONDS)
-        cpu_times_percent = psutil.cpu_times_percent(interval=MEASURE_INTERVAL_SECONDS)
-
-        rtn: InfoDict = {
-            "package": {
-                "version": __version__,
-                "name": __project_name__,
-                "repository": __repository_url__,
-                "local": __project_path__,
+        runtime: RuntimeDict = {
+            "environment": __env__,
+            "username": psutil.Process().username(),
+            "process": {
+                "command_line": " ".join(sys.argv),
+                "entry_point": sys.argv[0] if sys.argv else None,
+                "process_info": json.loads(get_process_info().model_dump_json()),
             },
-            "runtime": {
-                "environment": __env__,
-                "username": psutil.Process().username(),
-                "process": {
-                    "command_line": " ".join(sys.argv),
-                    "entry_point": sys.argv[0] if sys.argv else None,
-                    "process_info": json.loads(get_process_info().model_dump_json()),
+            "host": {
+                "os": {
+                    "platform": platform.platform(),
+                    "system": platform.system(),
+                    "release": platform.release(),
+                    "version": platform.version(),
                 },
-                "host": {
-                    "os": {
-                        "platform": platform.platform(),
-                        "system": platform.system(),
-                        "release": platform.release(),
-                        "version": platform.version(),
-                    },
-                    "machine": {
-                        "cpu": {
-                            "percent": cpu_percent,
-                            "load_avg": psutil.getloadavg(),
-                            "user": cpu_times_percent.user,
-                            "system": cpu_times_percent.system,
-                            "idle": cpu_times_percent.idle,
-                            "arch": platform.machine(),
-                            "processor": platform.processor(),
-                            "count": os.cpu_count(),
-                            "frequency": {
-                                "current": psutil.cpu_freq().max,
-                                "min": psutil.cpu_freq().max,
-                                "max": psutil.cpu_freq().max,
-                            },
-                        },
-                        "memory": {
-                            "percent": vmem.percent,
-                            "total": vmem.total,
-                            "available": vmem.available,
-                            "used": vmem.used,
-                            "free": vmem.free,
-                        },
-                        "swap": {
-                            "percent": swap.percent,
-                            "total": swap.total,
-                            "used": swap.used,
-                            "free": swap.free,
-                        },
-                    },
-                    "network": {
-                        "hostname": platform.node(),
-                        "local_ipv4": Service._get_local_ipv4(),
-                        "public_ipv4": Service._get_public_ipv4(),
+                "machine": {
+                    "memory": {
+                        "percent": vmem.percent,
+                        "total": vmem.total,
+                        "available": vmem.available,
+                        "used": vmem.used,
+                        "free": vmem.free,
                     },
-                    "uptime": {
-                        "seconds": uptime(),
-                        "boottime": bootdatetime.isoformat() if bootdatetime else None,
+                    "swap": {
+                        "percent": swap.percent,
+                        "total": swap.total,
+                        "used": swap.used,
+                        "free": swap.free,
                     },
                 },
-                "python": {
-                    "version": platform.python_version(),
-                    "compiler": platform.python_compiler(),
-                    "implementation": platform.python_implementation(),
-                    "sys.path": sys.path,
-                    "interpreter_path": sys.executable,
+                "uptime": {
+                    "seconds": uptime(),
+                    "boottime": bootdatetime.isoformat() if bootdatetime else None,
                 },
             },
-            "settings": {},
+            "python": {
+                "version": platform.python_version(),
+                "compiler": platform.python_compiler(),
+                "implementation": platform.python_implementation(),
+                "sys.path": sys.path,
+                "interpreter_path": sys.executable,
+            },
         }
 
-        runtime = cast("RuntimeDict", rtn["runtime"])
         if include_environ:
-            if filter_secrets:
-                runtime["environ"] = {
-                    k: v
-                    for k, v in sorted(os.environ.items())
-                    if not (
-                        "token" in k.lower()
-                        or "key" in k.lower()
-                        or "secret" in k.lower()
-                        or "password" in k.lower()
-                        or "auth" in k.lower()
-                    )
-                }
-            else:
-                runtime["environ"] = dict(sorted(os.environ.items()))
+            environ = dict(sorted(os.environ.items()))
+            runtime["environ"] = Service._filter_environ(environ) if filter_secrets else environ
+        return runtime
 
+    @staticmethod
+    def _filter_environ(environ: dict[str, str]) -> dict[str, str]:
+        """Filter secrets from environment variables.
+
+        Args:
+            environ (dict[str, str]): Environment variables.
+
+        Returns:
+            dict[str, str]: Environment variables whose name does not hint at a secret.
+        """
+        return {k: v for k, v in environ.items() if not any(marker in k.lower() for marker in SECRET_ENVIRON_MARKERS)}
+
+    @staticmethod
+    def _info_cpu() -> dict[str, Any]:
+        """Get info about the CPU of the host, sampling its utilization.
+
+        Returns:
+            dict[str, Any]: CPU info.
+        """
+        import psutil  # noqa: PLC0415
+
+        # Sample utilization and times over the same interval instead of one after the other
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            times_percent = executor.submit(psutil.cpu_times_percent, interval=MEASURE_INTERVAL_SECONDS)
+            cpu_percent = psutil.cpu_percent(interval=MEASURE_INTERVAL_SECONDS)
+            cpu_times_percent = times_percent.result()
+        frequency = psutil.cpu_freq()
+        return {
+            "percent": cpu_percent,
+            "load_avg": psutil.getloadavg(),
+            "user": cpu_times_percent.user,
+            "system": cpu_times_percent.system,
+            "idle": cpu_times_percent.idle,
+            "arch": platform.machine(),
+            "processor": platform.processor(),
+            "count": os.cpu_count(),
+            "frequency": {
+                "current": frequency.max,
+                "min": frequency.max,
+                "max": frequency.max,
+            },
+        }
+
+    @staticmethod
+    def _info_network() -> dict[str, Any]:
+        """Get info about the network of the host.
+
+        Returns:
+            dict[str, Any]: Network info.
+        """
+        return {
+            "hostname": platform.node(),
+            "local_ipv4": Service._get_local_ipv4(),
+            "public_ipv4": Service._get_public_ipv4(),
+        }
+
+    @staticmethod
+    def _info_settings(filter_secrets: bool = True) -> dict[str, Any]:
+        """Get settings aggregated from all implementations of Pydantic BaseSettings in this package.
+
+        Args:
+            filter_secrets (bool): Filter secrets from the output.
+
+        Returns:
+            dict[str, Any]: Settings keyed by environment variable, sorted.
+        """
         settings: dict[str, Any] = {}
         for settings_class in locate_subclasses(BaseSettings):
             settings_instance = load_settings(settings_class)
@@ -263,19 +389,290 @@ class Service(BaseService):
             for key, value in settings_dict.items():
                 flat_key = f"{env_prefix}{key}".upper()
                 settings[flat_key] = value
-        rtn["settings"] = {k: settings[k] for k in sorted(settings)}
+        return {k: settings[k] for k in sorted(settings)}
 
-        # Convert the TypedDict to a regular dict before adding dynamic service keys
-        result_dict: dict[str, Any] = dict(rtn)
+    @staticmethod
+    def _module_services() -> dict[str, BaseService]:
+        """Get implementations of BaseService in other modules.
 
-        for service_class in locate_subclasses(BaseService):
-            if service_class is not Service:
-                service = service_class()
-                result_dict[service.key()] = service.info()
+        Returns:
+            dict[str, BaseService]: Service instances by key.
+        """
+        services = [service_class() for service_class in locate_subclasses(BaseService) if service_class is not Service]
+        return {service.key(): service for service in services}
+
+    @staticmethod
+    def info_section_names(services: dict[str, BaseService] | None = None) -> list[str]:
+        """Get names of the sections of the info, in order of display.
+
+        Args:
+            services (dict[str, BaseService] | None): Services of other modules, see _module_services.
+                Located and instantiated if not given.
 
+        Returns:
+            list[str]: Names of the built-in sections, followed by keys of the other modules.
+        """
+        return [*INFO_SECTIONS, *(Service._module_services() if services is None else services)]
+
+    @staticmethod
+    def info_section(
+        name: str,
+        include_environ: bool = False,
+        filter_secrets: bool = True,
+        services: dict[str, BaseService] | None = None,
+    ) -> dict[str, Any]:
+        """Compute a single section of the info.
+
+        Args:
+            name (str): Name of the section, see info_section_names.
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+            services (dict[str, BaseService] | None): Services of other modules, see _module_services.
+                Located and instantiated if not given.
+
+        Returns:
+            dict[str, Any]: The section.
+
+        Raises:
+            ValueError: If there is no section with the given name.
+        """
+        match name:
+            case "package":
+                return Service._info_package()
+            case "runtime":
+                return dict(Service._info_runtime(include_environ=include_environ, filter_secrets=filter_secrets))
+            case "cpu":
+                return Service._info_cpu()
+            case "network":
+                return Service._info_network()
+            case "settings":
+                return Service._info_settings(filter_secrets=filter_secrets)
+        service = (Service._module_services() if services is None else services).get(name)
+        if service is None:
+            message = f"Unknown info section: {name}"
+            raise ValueError(message)
+        return service.info()
+
+    @staticmethod
+    def _assemble_info(sections: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """Assemble the info from its sections, nesting CPU and network into the host of the runtime.
+
+        Args:
+            sections: Sections by name.
+
+        Returns:
+            dict[str, Any]: The info.
+        """
+        info = {name: section for name, section in sections.items() if name not in HOST_INFO_SECTIONS}
+        runtime = dict(info["runtime"])
+        host = runtime["host"]
+        runtime["host"] = {
+            "os": host["os"],
+            "machine": {"cpu": sections["cpu"], **host["machine"]},
+            "network": sections["network"],
+            "uptime": host["uptime"],
+        }
+        info["runtime"] = runtime
+        return info
+
+    @staticmethod
+    def _split_info(info: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Split the info into its sections, reversing _assemble_info.
+
+        Args:
+            info: The info.
+
+        Returns:
+            dict[str, dict[str, Any]]: Sections by name.
+        """
+        runtime = dict(info["runtime"])
+        host = runtime["host"]
+        machine = {k: v for k, v in host["machine"].items() if k != "cpu"}
+        runtime["host"] = {"os": host["os"], "machine": machine, "uptime": host["uptime"]}
+        return {
+            **info,
+            "runtime": runtime,
+            "cpu": host["machine"]["cpu"],
+            "network": host["network"],
+        }
+
+    @staticmethod
+    def _info_section_view(
+        name: str, section: dict[str, Any], include_environ: bool, filter_secrets: bool
+    ) -> dict[str, Any]:
+        """Derive a section for the given arguments from the section computed unfiltered and including environ.
+
+        Args:
+            name (str): Name of the section.
+            section (dict[str, Any]): The section, computed unfiltered and including environment variables.
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+
+        Returns:
+            dict[str, Any]: The section.
+        """
+        if name == "runtime":
+            environ = section.get("environ", {})
+            section = {k: v for k, v in section.items() if k != "environ"}
+            if include_environ:
+                section["environ"] = Service._filter_environ(environ) if filter_secrets else environ
+        elif name == "settings" and filter_secrets:
+            # Secrets are masked when serializing the settings, so the filtered section is computed anew
+            section = Service._info_settings(filter_secrets=True)
+        return section
+
+    @staticmethod
+    def _info_view(info: dict[str, Any], include_environ: bool, filter_secrets: bool) -> dict[str, Any]:
+        """Derive the info for the given arguments from the info computed unfiltered and including environ.
+
+        Args:
+            info (dict[str, Any]): The info, computed unfiltered and including environment variables.
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+
+        Returns:
+            dict[str, Any]: The info.
+        """
+        sections = Service._split_info(info)
+        return Service._assemble_info({
+            name: Service._info_section_view(name, section, include_environ, filter_secrets)
+            for name, section in sections.items()
+        })
+
+    @staticmethod
+    @single_flight()
+    def info(include_environ: bool = False, filter_secrets: bool = True) -> dict[str, Any]:
+        """
+        Get info about configuration of service.
+
+        - Runtime information is automatically compiled.
+        - Settings are automatically aggregated from all implementations of
+            Pydantic BaseSettings in this package.
+        - Info exposed by implementations of BaseService in other modules is
+            automatically included into the info dict.
+        - Slow sections, i.e. CPU sampling and network calls, are computed concurrently.
+        - Concurrent calls with the same arguments share one computation.
+
+        Returns:
+            dict[str, Any]: Service configuration.
+        """
+        services = Service._module_services()
+        names = Service.info_section_names(services)
+        with ThreadPoolExecutor(max_workers=len(SLOW_INFO_SECTIONS)) as executor:
+            slow = {
+                name: executor.submit(Service.info_section, name, include_environ, filter_secrets)
+                for name in names
+                if name in SLOW_INFO_SECTIONS
+            }
+            fast = {
+                name: Service.info_section(name, include_environ, filter_secrets, services)
+                for name in names
+                if name not in SLOW_INFO_SECTIONS
+            }
+            sections = {name: fast[name] if name in fast else slow[name].result() for name in names}
+
+        result_dict = Service._assemble_info(sections)
         log.info("Service info: %s", result_dict)
         return result_dict
 
+    def cached_info(self, include_environ: bool = False, filter_secrets: bool = True) -> dict[str, Any]:
+        """Get info, reusing info computed recently by the webservice API or GUI.
+
+        - The info is computed and cached unfiltered and including environment variables,
+            so it is shared by callers regardless of their arguments.
+
+        Args:
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+
+        Returns:
+            dict[str, Any]: Service configuration, see info.
+        """
+        info = _info_cache.get(self._settings.info_cache_ttl)
+        if info is None:
+            info = self.info(include_environ=True, filter_secrets=False)
+            _info_cache.put(info)
+        return self._info_view(info, include_environ, filter_secrets)
+
+    def submit_info_job(self, include_environ: bool = False, filter_secrets: bool = True) -> Job:
+        """Compute info in the background, joining the job in flight if any.
+
+        - The job reuses info computed recently, see cached_info.
+        - Succeeded jobs are reused for the info cache TTL, so requesters within it share one job.
+
+        Args:
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+
+        Returns:
+            Job: The job, its result being the info once succeeded.
+        """
+        return _info_jobs.submit(
+            ("info", include_environ, filter_secrets),
+            self.cached_info,
+            include_environ,
+            filter_secrets,
+            reuse_for=self._settings.info_cache_ttl,
+        )
+
+    @staticmethod
+    def get_info_job(job_id: str) -> Job | None:
+        """Get a job submitted via submit_info_job.
+
+        Args:
+            job_id (str): The identifier of the job.
+
+        Returns:
+            Job | None: The job, or None if unknown or its result expired.
+        """
+        return _info_jobs.get(job_id)
+
+    async def info_sections(
+        self, include_environ: bool = False, filter_secrets: bool = True
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Stream sections of the info as they are computed, reusing info computed recently.
+
+        - Slow sections are computed in the warm worker pool, so sampling the CPU
+            does not occupy threads of the server process.
+        - The complete info is cached once all sections are computed, see cached_info.
+
+        Args:
+            include_environ (bool): Include environment variables.
+            filter_secrets (bool): Filter secrets from the output.
+
+        Yields:
+            tuple[str, dict[str, Any]]: Name of the section, see info_section_names, and the section.
+        """
+        info = _info_cache.get(self._settings.info_cache_ttl)
+        if info is not None:
+            for item in self._split_info(self._info_view(info, include_environ, filter_secrets)).items():
+                yield item
+            return
+
+        # Services of other modules are instantiated once, instead of once per section
+        services = self._module_services()
+        names = self.info_section_names(services)
+
+        # Sections are computed unfiltered and including environ to be cached, see cached_info
+        async def compute(name: str) -> tuple[str, dict[str, Any]]:
+            if name in SLOW_INFO_SECTIONS:
+                section = await run_service_in_worker(Service, "info_section", name, True, False)
+            else:
+                section = await asyncio.to_thread(self.info_section, name, True, False, services)
+            return name, section
+
+        tasks = [asyncio.ensure_future(compute(name)) for name in names]
+        sections: dict[str, dict[str, Any]] = {}
+        try:
+            for completed in asyncio.as_completed(tasks):
+                name, section = await completed
+                sections[name] = section
+                yield name, self._info_section_view(name, section, include_environ, filter_secrets)
+        finally:
+            for task in tasks:
+                task.cancel()
+        _info_cache.put(self._assemble_info({name: sections[name] for name in names}))
+
     @staticmethod
     def div_by_zero() -> float:
         """Divide by zero to trigger an error.
@@ -289,12 +686,63 @@ class Service(BaseService):
         return 1 / 0
 
     @staticmethod
-    def sleep(seconds: int) -> None:
-        """Sleep for a given number of seconds.
+    def sleep(seconds: float) -> None:
+        """Sleep for a given number of seconds, blocking the calling thread.
 
         - This function is used to validate performance profiling in the system.
+        - Use sleep_async on an event loop, as this blocks it.
+
+        Args:
+            seconds (float): Number of seconds to sleep.
+        """
+        time.sleep(seconds)
+
+    @staticmethod
+    async def sleep_async(seconds: float) -> None:
+        """Sleep for a given number of seconds without blocking the event loop.
+
+        - This function is used to validate concurrency behavior and performance profiling in the system.
+
+        Args:
+            seconds (float): Number of seconds to sleep.
+        """
+        await asyncio.sleep(seconds)
+
+    @staticmethod
+    def burn_cpu(seconds: float) -> int:
+        """Keep the calling thread busy computing for a given number of seconds, holding the GIL.
+
+        - This function is used to validate event loop blocking detection and CPU profiling in the system.
+
+        Args:
+            seconds (float): Number of seconds to compute.
+
+        Returns:
+            int: Number of iterations computed.
+        """
+        deadline = time.perf_counter() + seconds
+        iterations = 0
+        while time.perf_counter() < deadline:
+            sum(i * i for i in range(1000))
+            iterations += 1
+        return iterations
+
+    @staticmethod
+    def burn_memory(megabytes: int, seconds: float) -> int:
+        """Allocate memory and hold it for a given number of seconds, blocking the calling thread.
+
+        - This function is used to validate memory profiling in the system.
+        - Every page is written, so the memory is resident rather than merely reserved.
 
         Args:
-            seconds (int): Number of seconds to sleep.
+            megabytes (int): Number of megabytes to allocate.
+            seconds (float): Number of seconds to hold the memory.
+
+        Returns:
+            int: Number of bytes allocated.
         """
+        buffer = bytearray(megabytes * 1024 * 1024)
+        pages = range(0, len(buffer), MEMORY_PAGE_SIZE)
+        buffer[::MEMORY_PAGE_SIZE] = b"\x01" * len(pages)
         time.sleep(seconds)
+        return len(buffer)
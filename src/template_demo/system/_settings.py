@@ -29,3 +29,32 @@ class Settings(OpaqueSettings):
             default=None,
         ),
     ]
+    info_cache_ttl: Annotated[
+        float,
+        Field(
+            description=(
+                "Seconds info computed for the webservice API or GUI is reused by both, "
+                "as computing it takes several seconds. Set to 0 to disable caching."
+            ),
+            ge=0.0,
+            default=30.0,
+        ),
+    ]
+    diagnostics_enabled: Annotated[
+        bool,
+        Field(
+            description=(
+                "Expose diagnostics endpoints of the webservice API sleeping and burning CPU or memory on request, "
+                "to validate concurrency behavior and profiling. Requires the token."
+            ),
+            default=False,
+        ),
+    ]
+    diagnostics_max_seconds: Annotated[
+        float,
+        Field(description="Maximum duration in seconds a diagnostics request may take", gt=0.0, default=30.0),
+    ]
+    diagnostics_max_megabytes: Annotated[
+        int,
+        Field(description="Maximum number of megabytes a diagnostics request may allocate", ge=1, default=512),
+    ]
@@ -1,44 +1,182 @@
-"""Utilities module."""
-
-from ._api import VersionedAPIRouter
-from ._cli import prepare_cli
-from ._console import console
-from ._constants import (
-    __author_email__,
-    __author_name__,
-    __base__url__,
-    __documentation__url__,
-    __env__,
-    __env_file__,
-    __is_development_mode__,
-    __is_running_in_container__,
-    __is_running_in_read_only_environment__,
-    __project_name__,
-    __project_path__,
-    __repository_url__,
-    __version__,
-)
-from ._di import load_modules, locate_implementations, locate_subclasses
-from ._health import Health
-from ._log import LogSettings, get_logger
-from ._logfire import LogfireSettings
-from ._process import ProcessInfo, get_process_info
-from ._sentry import SentrySettings
-from ._service import BaseService
-from ._settings import UNHIDE_SENSITIVE_INFO, OpaqueSettings, load_settings, strip_to_none_before_validator
+"""Utilities module.
+
+- Symbols are exported lazily (PEP 562): the module defining a symbol is imported on first access,
+    so library use of a single utility does not pull in e.g. the observability or GUI stack.
+    Exception: pydantic imports logfire when loading the logfire plugin on definition of the first model,
+    unless disabled via PYDANTIC_DISABLE_PLUGINS.
+"""
+
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+
+# The boot module is imported eagerly, as the package runs the boot sequence on import anyway,
+# and the boot function would otherwise be shadowed by the boot submodule of the same name.
 from .boot import boot
 
+if TYPE_CHECKING:
+    from ._admission import AdmissionMiddleware, AdmissionSettings
+    from ._api import VersionedAPIRouter
+    from ._cli import prepare_cli
+    from ._compression import CompressionMiddleware, CompressionSettings
+    from ._console import console
+    from ._constants import (
+        __author_email__,
+        __author_name__,
+        __base__url__,
+        __documentation__url__,
+        __env__,
+        __env_file__,
+        __is_development_mode__,
+        __is_running_in_container__,
+        __is_running_in_read_only_environment__,
+        __project_name__,
+        __project_path__,
+        __repository_url__,
+        __version__,
+    )
+    from ._daemon import CLIDaemon, DaemonSettings, daemon_request, is_daemon_supported, start_daemon
+    from ._di import load_modules, locate_implementations, locate_subclasses
+    from ._gui import BasePageBuilder, GUILocalFilePicker, gui_register_pages, gui_run
+    from ._health import Health
+    from ._jobs import Job, JobQueue, JobQueueFullError, JobSettings, JobStatus
+    from ._log import LogSettings, get_logger
+    from ._logfire import LogfireSettings
+    from ._notebook import create_marimo_app
+    from ._openapi import CachedOpenAPI, OpenAPIDocument, load_openapi_snapshot, warm_openapi
+    from ._process import ProcessInfo, get_process_info
+    from ._rate_limit import (
+        MemoryRateLimitBackend,
+        RateLimitBackend,
+        RateLimitBudget,
+        RateLimitMiddleware,
+        RateLimitSettings,
+        SQLiteRateLimitBackend,
+    )
+    from ._sentry import SentrySettings
+    from ._service import BaseService
+    from ._settings import UNHIDE_SENSITIVE_INFO, OpaqueSettings, load_settings, strip_to_none_before_validator
+    from ._single_flight import single_flight
+    from ._timing import (
+        InMemorySpanExporter,
+        RequestTiming,
+        SpanExporter,
+        TimingMiddleware,
+        TimingSettings,
+        TimingSpan,
+        add_span_exporter,
+        get_request_timing,
+        remove_span_exporter,
+    )
+    from ._worker_pool import WorkerPoolSettings, run_service_in_worker, start_worker_pool, stop_worker_pool
+
+# Maps exported symbol to the submodule defining it
+_LAZY_EXPORTS: dict[str, str] = {
+    **dict.fromkeys(("AdmissionMiddleware", "AdmissionSettings"), "._admission"),
+    "VersionedAPIRouter": "._api",
+    "prepare_cli": "._cli",
+    **dict.fromkeys(("CompressionMiddleware", "CompressionSettings"), "._compression"),
+    "console": "._console",
+    **dict.fromkeys(
+        (
+            "__author_email__",
+            "__author_name__",
+            "__base__url__",
+            "__documentation__url__",
+            "__env__",
+            "__env_file__",
+            "__is_development_mode__",
+            "__is_running_in_container__",
+            "__is_running_in_read_only_environment__",
+            "__project_name__",
+            "__project_path__",
+            "__repository_url__",
+            "__version__",
+        ),
+        "._constants",
+    ),
+    **dict.fromkeys(
+        ("CLIDaemon", "DaemonSettings", "daemon_request", "is_daemon_supported", "start_daemon"), "._daemon"
+    ),
+    **dict.fromkeys(("load_modules", "locate_implementations", "locate_subclasses"), "._di"),
+    "Health": "._health",
+    **dict.fromkeys(("Job", "JobQueue", "JobQueueFullError", "JobSettings", "JobStatus"), "._jobs"),
+    **dict.fromkeys(("LogSettings", "get_logger"), "._log"),
+    "LogfireSettings": "._logfire",
+    **dict.fromkeys(("CachedOpenAPI", "OpenAPIDocument", "load_openapi_snapshot", "warm_openapi"), "._openapi"),
+    **dict.fromkeys(("ProcessInfo", "get_process_info"), "._process"),
+    **dict.fromkeys(
+        (
+            "MemoryRateLimitBackend",
+            "RateLimitBackend",
+            "RateLimitBudget",
+            "RateLimitMiddleware",
+            "RateLimitSettings",
+            "SQLiteRateLimitBackend",
+        ),
+        "._rate_limit",
+    ),
+    "SentrySettings": "._sentry",
+    "BaseService": "._service",
+    **dict.fromkeys(
+        ("UNHIDE_SENSITIVE_INFO", "OpaqueSettings", "load_settings", "strip_to_none_before_validator"), "._settings"
+    ),
+    "single_flight": "._single_flight",
+    **dict.fromkeys(
+        (
+            "InMemorySpanExporter",
+            "RequestTiming",
+            "SpanExporter",
+            "TimingMiddleware",
+            "TimingSettings",
+            "TimingSpan",
+            "add_span_exporter",
+            "get_request_timing",
+            "remove_span_exporter",
+        ),
+        "._timing",
+    ),
+    **dict.fromkeys(
+        ("WorkerPoolSettings", "run_service_in_worker", "start_worker_pool", "stop_worker_pool"), "._worker_pool"
+    ),
+}
+
 __all__ = [
     "UNHIDE_SENSITIVE_INFO",
+    "AdmissionMiddleware",
+    "AdmissionSettings",
     "BaseService",
+    "CLIDaemon",
+    "CachedOpenAPI",
+    "CompressionMiddleware",
+    "CompressionSettings",
+    "DaemonSettings",
     "Health",
-    "LogSettings",
+    "InMemorySpanExporter",
+    "Job",
+    "JobQueue",
+    "JobQueueFullError",
+    "JobSettings",
+    "JobStatus",
     "LogSettings",
     "LogfireSettings",
+    "MemoryRateLimitBackend",
     "OpaqueSettings",
+    "OpenAPIDocument",
     "ProcessInfo",
+    "RateLimitBackend",
+    "RateLimitBudget",
+    "RateLimitMiddleware",
+    "RateLimitSettings",
+    "RequestTiming",
+    "SQLiteRateLimitBackend",
     "SentrySettings",
+    "SpanExporter",
+    "TimingMiddleware",
+    "TimingSettings",
+    "TimingSpan",
     "VersionedAPIRouter",
+    "WorkerPoolSettings",
     "__author_email__",
     "__author_name__",
     "__base__url__",
@@ -52,28 +190,69 @@ __all__ = [
     "__project_path__",
     "__repository_url__",
     "__version__",
+    "add_span_exporter",
     "boot",
     "console",
+    "daemon_request",
     "get_logger",
     "get_process_info",
+    "get_request_timing",
+    "is_daemon_supported",
     "load_modules",
+    "load_openapi_snapshot",
     "load_settings",
     "locate_implementations",
     "locate_subclasses",
     "prepare_cli",
+    "remove_span_exporter",
+    "run_service_in_worker",
+    "single_flight",
+    "start_daemon",
+    "start_worker_pool",
+    "stop_worker_pool",
     "strip_to_none_before_validator",
+    "warm_openapi",
 ]
 
-from importlib.util import find_spec
-
+# Optional exports are advertised only if their extra is installed; find_spec does not import the package
 if find_spec("nicegui"):
-    from ._gui import BasePageBuilder, GUILocalFilePicker, gui_register_pages, gui_run
-
+    _LAZY_EXPORTS.update(
+        dict.fromkeys(("BasePageBuilder", "GUILocalFilePicker", "gui_register_pages", "gui_run"), "._gui")
+    )
     __all__ += ["BasePageBuilder", "GUILocalFilePicker", "gui_register_pages", "gui_run"]
 
 if find_spec("marimo"):
-    from ._notebook import create_marimo_app
-
+    _LAZY_EXPORTS["create_marimo_app"] = "._notebook"
     __all__ += [
         "create_marimo_app",
     ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule defining an exported symbol on first access.
+
+    Args:
+        name: Name of the symbol.
+
+    Returns:
+        Any: The symbol, cached in the module namespace for subsequent access.
+
+    Raises:
+        AttributeError: If the symbol is not exported.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(message)
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List attributes including exported symbols not yet imported.
+
+    Returns:
+        list[str]: Sorted attribute names.
+    """
+    return sorted({*globals(), *__all__})
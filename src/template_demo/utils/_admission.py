@@ -0,0 +1,262 @@
+"""Admission control of HTTP requests, shedding load when saturated.
+
+- AdmissionMiddleware is a pure ASGI middleware limiting the number of concurrent requests per route,
+    so slow routes, e.g. sync endpoints blocking the threadpool for seconds, cannot starve other routes.
+- Routes are identified by path prefix below the root path and API version, e.g. /system/info.
+    Routes without a specific limit share the default limit.
+- Requests exceeding a limit wait in a bounded queue for a limited time,
+    and are rejected with 503 Service Unavailable and a Retry-After header once the queue is full or the time is up.
+- Rejections are counted via the OpenTelemetry API,
+    which forwards to the meter provider set up by logfire if configured.
+"""
+
+import asyncio
+import contextlib
+import json
+from collections import Counter, deque
+from collections.abc import Iterable
+from typing import Annotated
+
+from opentelemetry import metrics
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._settings import load_settings
+from ._timing import ASGIApp, Receive, Scope, Send
+
+DEFAULT_LIMIT_KEY = "default"
+
+_rejections = metrics.get_meter(__name__).create_counter(
+    "http_requests_rejected",
+    description="Requests rejected by admission control, by limit and reason",
+)
+
+
+class AdmissionSettings(BaseSettings):
+    """Settings for admission control of HTTP requests."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_ADMISSION_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(description="Enable admission control of HTTP requests", default=True),
+    ]
+    default_limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of concurrent requests to routes without a specific limit, shared by them",
+            ge=1,
+            default=24,
+        ),
+    ]
+    limits: Annotated[
+        dict[str, int],
+        Field(
+            description=(
+                "Maximum number of concurrent requests by path prefix below the API version, e.g. /system/info. "
+                "Given as JSON via environment."
+            ),
+            default={"/system/info": 2, "/system/info/jobs": 16, "/system/health": 4, "/healthz": 4},
+        ),
+    ]
+    max_queue: Annotated[
+        int,
+        Field(
+            description="Maximum number of requests waiting for admission per limit, further requests are rejected",
+            ge=0,
+            default=16,
+        ),
+    ]
+    queue_timeout: Annotated[
+        float,
+        Field(description="Seconds a request waits for admission before it is rejected", ge=0.0, default=0.5),
+    ]
+    retry_after: Annotated[
+        int,
+        Field(description="Seconds clients are asked to wait before retrying rejected requests", ge=0, default=1),
+    ]
+
+
+def _route_path(scope: Scope, prefixes: frozenset[str]) -> str:
+    """Get the path of a request below the root path and prefixes.
+
+    Args:
+        scope: The ASGI connection scope.
+        prefixes: First path segments to strip, e.g. the API versions.
+
+    Returns:
+        str: The path, e.g. /system/info for /api/v1/system/info.
+    """
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    first, _, rest = path.removeprefix("/").partition("/")
+    return f"/{rest}" if first in prefixes else path
+
+
+def _by_specificity(routes: Iterable[str]) -> list[str]:
+    """Sort route prefixes longest first, so the most specific prefix matches first.
+
+    Args:
+        routes: The route prefixes.
+
+    Returns:
+        list[str]: The sorted route prefixes.
+    """
+    return sorted(routes, key=len, reverse=True)
+
+
+def _match_route(path: str, routes: list[str]) -> str | None:
+    """Match a path against route prefixes, segment by segment.
+
+    Args:
+        path: The path, e.g. /system/info/.
+        routes: The route prefixes, sorted by _by_specificity.
+
+    Returns:
+        str | None: The first matching route prefix, or None if none matches.
+    """
+    for route in routes:
+        if path == route or path.startswith(f"{route.rstrip('/')}/"):
+            return route
+    return None
+
+
+class _Limiter:
+    """Limit of concurrent requests with a bounded queue, admitting waiting requests first come, first served."""
+
+    def __init__(self, limit: int, max_queue: int) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self, timeout: float) -> str | None:
+        """Wait for admission.
+
+        Args:
+            timeout: Seconds to wait in the queue at most.
+
+        Returns:
+            str | None: None if admitted, else the reason of the rejection, i.e. queue_full or timeout.
+
+        Raises:
+            CancelledError: If cancelled while waiting, e.g. as the client disconnected.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return None
+        if len(self._waiters) >= self.max_queue:
+            return "queue_full"
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                return None  # Admitted just as the time was up
+            self._discard(waiter)
+            return "timeout"
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        return None
+
+    def release(self) -> None:
+        """Hand the slot of a finished request over to the next waiting request, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter: "asyncio.Future[None]") -> None:
+        with contextlib.suppress(ValueError):
+            self._waiters.remove(waiter)
+
+
+class AdmissionMiddleware:
+    """ASGI middleware limiting concurrent HTTP requests per route, rejecting requests when saturated."""
+
+    def __init__(self, app: ASGIApp, settings: AdmissionSettings | None = None, prefixes: Iterable[str] = ()) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            settings: Admission settings, loaded from the environment if not given.
+            prefixes: First path segments stripped before matching limits, e.g. the API versions.
+        """
+        self.app = app
+        self.settings = settings or load_settings(AdmissionSettings)
+        self.prefixes = frozenset(prefixes)
+        self._routes = _by_specificity(self.settings.limits)
+        self._limiters = {
+            route: _Limiter(limit, self.settings.max_queue) for route, limit in self.settings.limits.items()
+        }
+        self._limiters[DEFAULT_LIMIT_KEY] = _Limiter(self.settings.default_limit, self.settings.max_queue)
+        self.rejected: Counter[tuple[str, str]] = Counter()  # By limit and reason
+
+    def limit_key(self, scope: Scope) -> str:
+        """Get the key of the limit applying to a request.
+
+        Args:
+            scope: The ASGI connection scope.
+
+        Returns:
+            str: The path prefix of the limit, or DEFAULT_LIMIT_KEY if the request has no specific limit.
+        """
+        return _match_route(_route_path(scope, self.prefixes), self._routes) or DEFAULT_LIMIT_KEY
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+        key = self.limit_key(scope)
+        limiter = self._limiters[key]
+        reason = await limiter.acquire(self.settings.queue_timeout)
+        if reason is not None:
+            self.rejected[key, reason] += 1
+            _rejections.add(1, {"limit": key, "reason": reason})
+            await self._reject(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _reject(self, send: Send) -> None:
+        """Respond with 503 Service Unavailable, asking the client to retry later.
+
+        Args:
+            send: The ASGI send channel.
+        """
+        body = json.dumps({"detail": "Service overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(self.settings.retry_after).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body, "more_body": False})
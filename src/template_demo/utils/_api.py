@@ -1,6 +1,89 @@
 """API router utilities for versioned FastAPI routers."""
 
-from typing import ClassVar
+import time
+from collections.abc import Callable, Coroutine, Generator
+from contextlib import contextmanager
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from fastapi import APIRouter
+    from fastapi.routing import APIRoute
+
+
+@cache
+def _timed_route_class() -> type["APIRoute"]:
+    """Get route class marking routing, dependency, handler and serialization phases of the current request.
+
+    Returns:
+        type[APIRoute]: The route class, created on first use to defer importing FastAPI.
+    """
+    from fastapi import Request, Response  # noqa: PLC0415
+    from fastapi.routing import APIRoute  # noqa: PLC0415
+
+    from ._timing import get_request_timing, timed_endpoint  # noqa: PLC0415
+
+    class TimedAPIRoute(APIRoute):
+        """APIRoute recording phase timings into the request timing bound by TimingMiddleware."""
+
+        def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:  # noqa: ANN401
+            """Initialize the route with the endpoint wrapped for timing.
+
+            Args:
+                path: The path of the route.
+                endpoint: The endpoint function.
+                **kwargs: Keyword arguments to pass to the FastAPI APIRoute.
+            """
+            super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+        def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            """Get the request handler, marking when routing ended and the response is ready.
+
+            Returns:
+                Callable[[Request], Coroutine[Any, Any, Response]]: The wrapped request handler.
+            """
+            handler = super().get_route_handler()
+
+            async def timed_route_handler(request: Request) -> Response:
+                timing = get_request_timing()
+                if timing is None:
+                    return await handler(request)
+                timing.route_matched_at = time.perf_counter()
+                response = await handler(request)
+                timing.response_ready_at = time.perf_counter()
+                return response
+
+            return timed_route_handler
+
+    return TimedAPIRoute
+
+
+@cache
+def _router_class() -> Callable[..., "APIRouter"]:
+    """Get the class implementing VersionedAPIRouter.
+
+    Returns:
+        Callable[..., APIRouter]: The class, defined on first use to defer importing FastAPI.
+    """
+    from fastapi import APIRouter  # noqa: PLC0415
+
+    class VersionedAPIRouterImpl(APIRouter):
+        """Implementation of VersionedAPIRouter with lazy-loaded dependencies."""
+
+        version: str
+
+        def __init__(self, version: str, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+            """Initialize the router.
+
+            Args:
+                version: The API version this router belongs to.
+                *args: Arguments to pass to the FastAPI APIRouter.
+                **kwargs: Keyword arguments to pass to the FastAPI APIRouter.
+            """
+            super().__init__(*args, **kwargs)
+            self.version = version
+
+    return VersionedAPIRouterImpl
 
 
 class VersionedAPIRouter:
@@ -11,19 +94,49 @@ class VersionedAPIRouter:
     - The version attribute is used to identify the version of the API
         that the router corresponds to.
     - See constants.por versions defined for this system.
+    - Created routers are registered by API version, see get_instances and scoped.
     """
 
-    # Class variable to track all created instances
-    _instances: ClassVar[list["VersionedAPIRouter"]] = []
+    # Registry of created instances by API version, in order of creation
+    _instances: ClassVar[dict[str, list["VersionedAPIRouter"]]] = {}
 
     @classmethod
-    def get_instances(cls) -> list["VersionedAPIRouter"]:
-        """Get all created router instances.
+    def get_instances(cls, version: str | None = None) -> list["VersionedAPIRouter"]:
+        """Get created router instances.
+
+        Args:
+            version: The API version to get the routers of, or None to get the routers of all API versions.
 
         Returns:
-            A list of all router instances created.
+            A list of router instances, in order of creation per API version.
+        """
+        if version is not None:
+            return cls._instances.get(version, []).copy()
+        return [router for routers in cls._instances.values() for router in routers]
+
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Forget all created router instances, so apps created afterwards do not include them."""
+        cls._instances.clear()
+
+    @classmethod
+    @contextmanager
+    def scoped(cls) -> Generator[None]:
+        """Register routers created within the context in a separate registry, discarded on exit.
+
+        - E.g. to create routers in tests without leaking them into apps created by other tests.
+        - Apps created within the context include only the routers created within the context.
+        - Modules create their routers on import, so import modules before entering the context.
+
+        Yields:
+            None: While routers are registered in the separate registry.
         """
-        return cls._instances.copy()
+        instances = cls._instances
+        cls._instances = {}
+        try:
+            yield
+        finally:
+            cls._instances = instances
 
     def __new__(cls, version: str, *args, **kwargs) -> "VersionedAPIRouter":  # type: ignore[no-untyped-def]
         """Create a new instance with lazy-loaded dependencies.
@@ -36,30 +149,14 @@ class VersionedAPIRouter:
         Returns:
             An instance of VersionedAPIRouter with lazy-loaded dependencies.
         """
-        from fastapi import APIRouter  # Import only when creating an instance  # noqa: PLC0415
-
-        # Define the actual implementation class with the imports available
-        class VersionedAPIRouterImpl(APIRouter):
-            """Implementation of VersionedAPIRouter with lazy-loaded dependencies."""
-
-            version: str
-
-            def __init__(self, version: str, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
-                """Initialize the router.
-
-                Args:
-                    version: The API version this router belongs to.
-                    *args: Arguments to pass to the FastAPI APIRouter.
-                    **kwargs: Keyword arguments to pass to the FastAPI APIRouter.
-                """
-                super().__init__(*args, **kwargs)
-                self.version = version
+        # Record phase timings of requests handled by routes of this router
+        kwargs.setdefault("route_class", _timed_route_class())
 
         # Create an instance
-        instance = VersionedAPIRouterImpl(version, *args, **kwargs)
+        instance = _router_class()(version, *args, **kwargs)
 
         # Add to registry of instances
-        cls._instances.append(instance)  # type: ignore
+        cls._instances.setdefault(version, []).append(instance)  # type: ignore[arg-type]
 
         # Return the instance but tell mypy it's a VersionedAPIRouter
         return instance  # type: ignore[return-value]
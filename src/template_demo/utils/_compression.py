@@ -0,0 +1,404 @@
+"""Compression of HTTP responses with content negotiation.
+
+- CompressionMiddleware is a pure ASGI middleware compressing responses with the best encoding
+    accepted by the client, preferring zstd over brotli over gzip.
+- gzip is always available. zstd requires Python 3.14+ or the zstandard package,
+    brotli requires the brotli package. Unavailable encodings are not offered.
+- Complete bodies are compressed at once, streamed bodies chunk by chunk. Each chunk is flushed,
+    so clients of streaming responses, e.g. server-sent events, receive it without waiting for the next.
+- Compressed variants of static payloads, i.e. responses with an ETag and OpenAPI schemas,
+    are cached by content, so they are compressed once per encoding.
+- Compressed variants get their own ETag, suffixed by the encoding, e.g. "abc-gzip". For such ETags in
+    If-None-Match, the app is passed the ETag of the identity body to revalidate, restored in its 304 Not Modified.
+"""
+
+import asyncio
+import hashlib
+import typing as t
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from importlib.util import find_spec
+from typing import Annotated, NamedTuple
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._settings import load_settings
+from ._timing import ASGIApp, Message, Receive, Scope, Send
+
+# Compressed off the event loop if larger
+_OFFLOAD_SIZE = 1024 * 1024
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+_COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+_UNCOMPRESSED_STATUS_CODES = {204, 206, 304}
+
+
+class CompressionSettings(BaseSettings):
+    """Settings for compression of HTTP responses."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_COMPRESSION_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(description="Enable compression of HTTP responses", default=True),
+    ]
+    minimum_size: Annotated[
+        int,
+        Field(description="Minimum size in bytes of complete response bodies to compress", ge=0, default=1000),
+    ]
+    gzip_level: Annotated[
+        int,
+        Field(description="Compression level of gzip", ge=1, le=9, default=6),
+    ]
+    brotli_quality: Annotated[
+        int,
+        Field(description="Compression quality of brotli", ge=0, le=11, default=4),
+    ]
+    zstd_level: Annotated[
+        int,
+        Field(description="Compression level of zstd", ge=1, le=22, default=3),
+    ]
+    cache_size: Annotated[
+        int,
+        Field(description="Number of compressed variants of static payloads kept in memory", ge=0, default=64),
+    ]
+
+
+class _Encoder(NamedTuple):
+    compress: Callable[[bytes], bytes]
+    flush: Callable[[], bytes]  # Ends the stream
+    sync_flush: Callable[[], bytes]  # Emits all data compressed so far, without ending the stream
+
+
+def _gzip_encoder(level: int) -> _Encoder:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return _Encoder(compressor.compress, compressor.flush, lambda: compressor.flush(zlib.Z_SYNC_FLUSH))
+
+
+def _brotli_encoder(quality: int) -> _Encoder:
+    import brotli  # noqa: PLC0415
+
+    compressor = brotli.Compressor(quality=quality)
+    return _Encoder(compressor.process, compressor.finish, compressor.flush)
+
+
+def _has_stdlib_zstd() -> bool:
+    # The compression package was added in Python 3.14, find_spec raises for submodules of missing packages
+    return find_spec("compression") is not None and find_spec("compression.zstd") is not None
+
+
+def _zstd_encoder(level: int) -> _Encoder:
+    if _has_stdlib_zstd():
+        from compression.zstd import ZstdCompressor  # noqa: PLC0415
+
+        stdlib_compressor = ZstdCompressor(level=level)
+        return _Encoder(
+            stdlib_compressor.compress,
+            stdlib_compressor.flush,
+            lambda: stdlib_compressor.flush(ZstdCompressor.FLUSH_BLOCK),
+        )
+    import zstandard  # noqa: PLC0415
+
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return _Encoder(compressor.compress, compressor.flush, lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK))
+
+
+def available_encodings(settings: CompressionSettings) -> dict[str, Callable[[], _Encoder]]:
+    """Get encoders of the available encodings, in order of preference.
+
+    Args:
+        settings: Compression settings defining the levels.
+
+    Returns:
+        dict[str, Callable[[], _Encoder]]: Factory of a new encoder by encoding.
+    """
+    encodings: dict[str, Callable[[], _Encoder]] = {}
+    if _has_stdlib_zstd() or find_spec("zstandard"):
+        encodings["zstd"] = lambda: _zstd_encoder(settings.zstd_level)
+    if find_spec("brotli"):
+        encodings["br"] = lambda: _brotli_encoder(settings.brotli_quality)
+    encodings["gzip"] = lambda: _gzip_encoder(settings.gzip_level)
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> str | None:
+    """Choose the encoding of a response given the Accept-Encoding header of the request.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header, e.g. "gzip, br;q=0.9".
+        available: Available encodings, in order of preference.
+
+    Returns:
+        str | None: The accepted encoding with the highest quality, ties broken by preference,
+            or None to send the response unencoded.
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding.strip():
+            qualities[coding.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _get_header(headers: t.Iterable[tuple[bytes, bytes]], name: bytes) -> str | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _is_compressible(message: Message) -> bool:
+    """Check if the response started by the message may be compressed.
+
+    Args:
+        message: The http.response.start message.
+
+    Returns:
+        bool: True if the content type is compressible, and the response is neither encoded nor marked no-transform.
+    """
+    headers = message.get("headers", [])
+    content_type = (_get_header(headers, b"content-type") or "").split(";")[0].strip().lower()
+    return (
+        message["status"] not in _UNCOMPRESSED_STATUS_CODES
+        and _get_header(headers, b"content-encoding") is None
+        and "no-transform" not in (_get_header(headers, b"cache-control") or "").lower()
+        and (content_type.startswith(_COMPRESSIBLE_TYPES) or content_type.endswith(_COMPRESSIBLE_SUFFIXES))
+    )
+
+
+def _vary(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    vary = _get_header(headers, b"vary")
+    if vary is None:
+        return [*headers, (b"vary", b"Accept-Encoding")]
+    if "accept-encoding" in vary.lower() or vary.strip() == "*":
+        return headers
+    return [(key, value) for key, value in headers if key.lower() != b"vary"] + [
+        (b"vary", f"{vary}, Accept-Encoding".encode("latin-1"))
+    ]
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    """Derive the ETag of an encoded variant, as variants must not share a strong ETag with the identity body.
+
+    Args:
+        etag: The ETag of the identity body, e.g. "abc" or W/"abc".
+        encoding: The encoding of the variant.
+
+    Returns:
+        str: The ETag suffixed by the encoding, e.g. "abc-gzip" or W/"abc-gzip".
+    """
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else f"{etag}-{encoding}"
+
+
+def _identity_etags(if_none_match: str, encoding: str) -> str:
+    """Add the ETags of the identity body to ETags of encoded variants in an If-None-Match header.
+
+    The ETags of encoded variants are kept, for apps encoding responses themselves, e.g. the OpenAPI documents.
+
+    Args:
+        if_none_match: Value of the If-None-Match header.
+        encoding: The negotiated encoding.
+
+    Returns:
+        str: Value of the If-None-Match header, as understood by the app.
+    """
+    suffix = f'-{encoding}"'
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    identity_tags = [f'{tag[: -len(suffix)]}"' for tag in tags if tag.endswith(suffix)]
+    return ", ".join([*tags, *(tag for tag in identity_tags if tag not in tags)])
+
+
+def _encoded(headers: list[tuple[bytes, bytes]], encoding: str, length: int | None) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (key, _encoded_etag(value.decode("latin-1"), encoding).encode("latin-1") if key.lower() == b"etag" else value)
+        for key, value in headers
+        if key.lower() != b"content-length"
+    ]
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    if length is not None:
+        headers.append((b"content-length", str(length).encode("latin-1")))
+    return headers
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing HTTP responses with the best encoding accepted by the client."""
+
+    def __init__(self, app: ASGIApp, settings: CompressionSettings | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            settings: Compression settings, loaded from the environment if not given.
+        """
+        self.app = app
+        self.settings = settings or load_settings(CompressionSettings)
+        self.encodings = available_encodings(self.settings)
+        self._cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(_get_header(scope["headers"], b"accept-encoding") or "", list(self.encodings))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = _get_header(scope["headers"], b"if-none-match")
+        if if_none_match is not None:
+            headers = [(key, value) for key, value in scope["headers"] if key.lower() != b"if-none-match"]
+            headers.append((b"if-none-match", _identity_etags(if_none_match, encoding).encode("latin-1")))
+            scope = {**scope, "headers": headers}
+        await self.app(scope, receive, _CompressingSend(self, scope, encoding, send, if_none_match))
+
+    async def _send_complete(self, scope: Scope, encoding: str, start: Message, message: Message, send: Send) -> None:
+        """Send a response whose body is complete, compressing it if large enough.
+
+        Args:
+            scope: The ASGI connection scope.
+            encoding: The negotiated encoding.
+            start: The http.response.start message.
+            message: The http.response.body message.
+            send: The ASGI send channel.
+        """
+        body = message.get("body", b"")
+        if len(body) < self.settings.minimum_size:
+            await send(start)
+            await send(message)
+            return
+        compressed = await self._compress(scope, encoding, start, body)
+        start["headers"] = _encoded(start["headers"], encoding, len(compressed))
+        await send(start)
+        await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+    async def _compress(self, scope: Scope, encoding: str, start: Message, body: bytes) -> bytes:
+        """Compress a complete body, reusing the compressed variant of static payloads.
+
+        Args:
+            scope: The ASGI connection scope.
+            encoding: The negotiated encoding.
+            start: The http.response.start message.
+            body: The body.
+
+        Returns:
+            bytes: The compressed body.
+        """
+        static = _get_header(start["headers"], b"etag") is not None or str(scope.get("path", "")).endswith(
+            "/openapi.json"
+        )
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest()) if static else None
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        def compress() -> bytes:
+            encoder = self.encodings[encoding]()
+            return encoder.compress(body) + encoder.flush()
+
+        compressed = await asyncio.to_thread(compress) if len(body) > _OFFLOAD_SIZE else compress()
+        if key is not None and self.settings.cache_size > 0:
+            self._cache[key] = compressed
+            while len(self._cache) > self.settings.cache_size:
+                self._cache.popitem(last=False)
+        return compressed
+
+
+class _CompressingSend:
+    """ASGI send channel of a single response, compressing its body if eligible."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, scope: Scope, encoding: str, send: Send, if_none_match: str | None
+    ) -> None:
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self.send = send
+        self.if_none_match = if_none_match  # As sent by the client, before mapping ETags back for the app
+        self.start: Message | None = None  # Held back until the first part of the body tells its size
+        self.encoder: _Encoder | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+        elif message["type"] == "http.response.start":
+            if message["status"] == 304:  # noqa: PLR2004
+                message["headers"] = self._revalidated(list(message.get("headers", [])))
+            if _is_compressible(message):
+                message["headers"] = _vary(list(message.get("headers", [])))
+                self.start = message
+            else:
+                self.passthrough = True
+                await self.send(message)
+        elif message["type"] != "http.response.body" or self.start is None:
+            await self.send(message)
+        elif self.encoder is None and not message.get("more_body", False):
+            self.passthrough = True
+            await self.middleware._send_complete(self.scope, self.encoding, self.start, message, self.send)  # noqa: SLF001
+        else:
+            await self._send_chunk(self.start, message)
+
+    def _revalidated(self, headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+        """Restore the ETag of the encoded variant in a 304 Not Modified, if the client revalidated that variant.
+
+        Args:
+            headers: Headers of the 304 Not Modified sent by the app.
+
+        Returns:
+            list[tuple[bytes, bytes]]: The headers.
+        """
+        etag = _get_header(headers, b"etag")
+        if etag is None or self.if_none_match is None:
+            return headers
+        encoded = _encoded_etag(etag, self.encoding)
+        if encoded not in {tag.strip() for tag in self.if_none_match.split(",")}:
+            return headers
+        return [(key, encoded.encode("latin-1") if key.lower() == b"etag" else value) for key, value in headers]
+
+    async def _send_chunk(self, start: Message, message: Message) -> None:
+        if self.encoder is None:
+            self.encoder = self.middleware.encodings[self.encoding]()
+            start["headers"] = _encoded(start["headers"], self.encoding, None)
+            await self.send(start)
+        chunk = message.get("body", b"")
+        body = self.encoder.compress(chunk)
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self.encoder.flush()
+        elif chunk:
+            body += self.encoder.sync_flush()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
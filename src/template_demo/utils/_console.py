@@ -3,12 +3,20 @@
 from rich.console import Console
 from rich.theme import Theme
 
-console = Console(
-    theme=Theme({
-        "logging.level.info": "purple4",
-        "debug": "light_cyan3",
-        "info": "purple4",
-        "warning": "yellow1",
-        "error": "red1",
-    }),
-)
+_THEME = Theme({
+    "logging.level.info": "purple4",
+    "debug": "light_cyan3",
+    "info": "purple4",
+    "warning": "yellow1",
+    "error": "red1",
+})
+
+console = Console(theme=_THEME)
+
+
+def _reset_console() -> None:
+    """Re-detect terminal capabilities of the console, e.g. after standard streams were redirected.
+
+    The console is reinitialized in place, as modules hold references to it.
+    """
+    console.__init__(theme=_THEME)  # type: ignore[misc]
@@ -2,6 +2,8 @@
 
 import os
 import sys
+from dataclasses import dataclass, field
+from functools import cache
 from importlib import metadata
 from pathlib import Path
 
@@ -11,8 +13,57 @@ load_dotenv()
 __project_name__ = __name__.split(".")[0]
 load_dotenv(os.getenv(f"{__project_name__.upper()}_ENV_FILE", Path.home() / f".{__project_name__}/.env"))
 
+
+@dataclass(frozen=True)
+class _PackageMetadata:
+    """Snapshot of the package metadata the constants are derived from."""
+
+    version: str
+    author_name: str | None = None
+    author_email: str | None = None
+    urls: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_distribution(cls, name: str) -> "_PackageMetadata":
+        """Read the metadata of an installed distribution in one pass.
+
+        Args:
+            name: Name of the distribution.
+
+        Returns:
+            _PackageMetadata: The snapshot.
+        """
+        core = metadata.distribution(name).metadata
+        authors = core.get_all("Author-email", [])
+        author = authors[0] if authors else None
+        urls = dict(entry.split(", ", 1) for entry in core.get_all("Project-URL", []) if ", " in entry)
+        return cls(
+            version=core["Version"],
+            author_name=author.split("<")[0].strip() if author else None,
+            author_email=author.split("<")[1].strip(" >") if author and "<" in author else None,
+            urls=urls,
+        )
+
+
+@cache
+def _package_metadata() -> _PackageMetadata:
+    """Get the package metadata, computed once.
+
+    - Wheels ship a snapshot generated at build time by hatch_build.py, so no dist-info is parsed at runtime.
+    - Otherwise, e.g. in editable installs, the metadata of the installed distribution is read.
+
+    Returns:
+        _PackageMetadata: The snapshot.
+    """
+    try:
+        from ._metadata_snapshot import SNAPSHOT  # noqa: PLC0415
+    except ImportError:
+        return _PackageMetadata.from_distribution(__project_name__)
+    return _PackageMetadata(**SNAPSHOT)
+
+
 __project_path__ = str(Path(__file__).parent.parent.parent)
-__version__ = metadata.version(__project_name__)
+__version__ = _package_metadata().version
 __is_development_mode__ = "uvx" not in sys.argv[0].lower()
 __is_running_in_container__ = os.getenv(f"{__project_name__.upper()}_RUNNING_IN_CONTAINER")
 
@@ -73,15 +124,13 @@ def get_project_url_by_label(prefix: str) -> str:
     Returns:
         The extracted URL string if found, or an empty string if not found.
     """
-    for url_entry in metadata.metadata(__project_name__).get_all("Project-URL", []):
-        if url_entry.startswith(prefix):
-            return str(url_entry.split(", ", 1)[1])
+    for label, url in _package_metadata().urls.items():
+        if label.startswith(prefix):
+            return url
     return ""
 
 
-_authors = metadata.metadata(__project_name__).get_all("Author-email", [])
-_author = _authors[0] if _authors else None
-__author_name__ = _author.split("<")[0].strip() if _author else None
-__author_email__ = _author.split("<")[1].strip(" >") if _author else None
+__author_name__ = _package_metadata().author_name
+__author_email__ = _package_metadata().author_email
 __repository_url__ = get_project_url_by_label("Source")
 __documentation__url__ = get_project_url_by_label("Documentation")
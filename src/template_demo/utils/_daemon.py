@@ -0,0 +1,453 @@
+"""Warm daemon serving CLI invocations forwarded by a thin client over a Unix domain socket.
+
+- The daemon imports the CLI and boots once, then forks a child per invocation,
+    so commands skip interpreter startup, imports and the boot sequence.
+- The client passes argv, environment and working directory. Its standard streams are passed as
+    file descriptors (SCM_RIGHTS), so the child reads from and writes to them directly.
+- Settings loaded at import time, e.g. by module level services, reflect the environment of the daemon.
+    Restart the daemon after changing them or upgrading the package.
+- Protocol: Each message is a JSON object, prefixed by its length as 4-byte big-endian unsigned integer.
+    The client sends {"type": "run" | "status" | "stop", ...}. For run, the descriptors of stdin, stdout and
+    stderr accompany the length prefix, and the child answers {"pid": ...} followed by {"exit_code": ...}.
+    The thin client in template_demo_client.py implements the client side using the standard library only.
+- Only available on POSIX systems, see is_daemon_supported.
+"""
+
+import contextlib
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Annotated, Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._console import _reset_console
+from ._constants import __env_file__, __project_name__, __version__
+from ._log import get_logger
+from ._settings import load_settings
+
+logger = get_logger(__name__)
+
+_LENGTH = struct.Struct("!I")
+_MAX_FDS = 3
+_REQUEST_TIMEOUT = 5.0
+_ACCEPT_TIMEOUT = 1.0
+
+
+class DaemonSettings(BaseSettings):
+    """Settings for the CLI daemon."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_DAEMON_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    socket_path: Annotated[
+        Path,
+        Field(
+            description="Path of the Unix domain socket the daemon listens on",
+            default=Path.home() / f".{__project_name__}" / "daemon.sock",
+        ),
+    ]
+    idle_timeout: Annotated[
+        float | None,
+        Field(
+            description="Seconds without invocations after which the daemon stops. Leave unset to run until stopped.",
+            gt=0,
+            default=None,
+        ),
+    ]
+    start_timeout: Annotated[
+        float,
+        Field(description="Seconds to wait for a daemon starting in the background to get ready", gt=0, default=10.0),
+    ]
+
+
+def is_daemon_supported() -> bool:
+    """Check if the platform supports the daemon, i.e. Unix domain sockets, passing descriptors and fork.
+
+    Returns:
+        bool: True if supported.
+    """
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds") and hasattr(os, "fork")
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Receive exactly the given number of bytes.
+
+    Args:
+        sock: The connected socket.
+        size: Number of bytes to receive.
+
+    Returns:
+        bytes: The received bytes.
+
+    Raises:
+        ConnectionError: If the peer closed the connection before.
+    """
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            message = "Connection closed by peer"
+            raise ConnectionError(message)
+        data += chunk
+    return bytes(data)
+
+
+def send_message(sock: socket.socket, message: dict[str, Any], fds: list[int] | None = None) -> None:
+    """Send a length-prefixed JSON message, optionally passing file descriptors.
+
+    Args:
+        sock: The connected socket.
+        message: The message.
+        fds: File descriptors to pass along with the length prefix.
+    """
+    payload = json.dumps(message).encode("utf-8")
+    header = _LENGTH.pack(len(payload))
+    if fds:
+        socket.send_fds(sock, [header], fds)
+    else:
+        sock.sendall(header)
+    sock.sendall(payload)
+
+
+def recv_message(sock: socket.socket) -> tuple[dict[str, Any], list[int]]:
+    """Receive a length-prefixed JSON message, along with file descriptors passed.
+
+    Args:
+        sock: The connected socket.
+
+    Returns:
+        tuple[dict[str, Any], list[int]]: The message and the received file descriptors, owned by the caller.
+
+    Raises:
+        ConnectionError: If the peer closed the connection before the message was complete.
+    """
+    header, fds, _flags, _address = socket.recv_fds(sock, _LENGTH.size, _MAX_FDS)
+    if not header:
+        message = "Connection closed by peer"
+        raise ConnectionError(message)
+    try:
+        header += _recv_exactly(sock, _LENGTH.size - len(header))
+        (length,) = _LENGTH.unpack(header)
+        return json.loads(_recv_exactly(sock, length)), fds
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def daemon_request(
+    message: dict[str, Any], socket_path: Path | None = None, timeout: float = _REQUEST_TIMEOUT
+) -> dict[str, Any] | None:
+    """Send a control message, such as status or stop, to the daemon.
+
+    Args:
+        message: The message, e.g. {"type": "status"}.
+        socket_path: Path of the socket, defaults to the one configured in DaemonSettings.
+        timeout: Seconds to wait for the response.
+
+    Returns:
+        dict[str, Any] | None: The response, or None if no daemon is listening.
+    """
+    path = socket_path or load_settings(DaemonSettings).socket_path
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None
+        send_message(sock, message)
+        response, _fds = recv_message(sock)
+        return response
+
+
+def start_daemon(settings: DaemonSettings | None = None) -> dict[str, Any]:
+    """Start the daemon in the background and wait until it is ready.
+
+    Args:
+        settings: Daemon settings, loaded from the environment if not given.
+
+    Returns:
+        dict[str, Any]: Status of the started daemon.
+
+    Raises:
+        RuntimeError: If a daemon is running already, or the daemon did not get ready in time.
+    """
+    settings = settings or load_settings(DaemonSettings)
+    if daemon_request({"type": "status"}, settings.socket_path) is not None:
+        message = f"Daemon already listening on {settings.socket_path}"
+        raise RuntimeError(message)
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", f"{__project_name__}.cli", "system", "daemon", "serve"],
+        env={**os.environ, f"{__project_name__.upper()}_DAEMON_SOCKET_PATH": str(settings.socket_path)},
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + settings.start_timeout
+    while time.monotonic() < deadline and process.poll() is None:
+        status = daemon_request({"type": "status"}, settings.socket_path)
+        if status is not None:
+            return status
+        time.sleep(0.05)
+    message = f"Daemon did not get ready within {settings.start_timeout}s (exit code {process.poll()})"
+    raise RuntimeError(message)
+
+
+class CLIDaemon:
+    """Daemon forking a warm child per CLI invocation received via its Unix domain socket."""
+
+    def __init__(self, runner: Callable[[list[str]], int | None], settings: DaemonSettings | None = None) -> None:
+        """Initialize the daemon.
+
+        Args:
+            runner: Runs the CLI with the given arguments, excluding the program name, in the forked child.
+                Returns or raises SystemExit with the exit code.
+            settings: Daemon settings, loaded from the environment if not given.
+        """
+        self.runner = runner
+        self.settings = settings or load_settings(DaemonSettings)
+        self.requests = 0
+        self._pid = os.getpid()
+        self._started_at = datetime.now(UTC)
+        self._last_request_at = time.monotonic()
+        self._children: set[int] = set()
+        self._stopping = False
+
+    def status(self) -> dict[str, Any]:
+        """Get status of the daemon.
+
+        Returns:
+            dict[str, Any]: Process id, version, start time, number of invocations served and socket path.
+        """
+        return {
+            "pid": self._pid,
+            "version": __version__,
+            "started_at": self._started_at.isoformat(),
+            "requests": self.requests,
+            "socket_path": str(self.settings.socket_path),
+        }
+
+    def stop(self) -> None:
+        """Stop serving after the current request."""
+        self._stopping = True
+
+    def serve(self) -> None:
+        """Listen on the socket and serve invocations until stopped.
+
+        Raises:
+            RuntimeError: If another daemon is listening on the socket already.
+        """
+        path = self.settings.socket_path
+        if daemon_request({"type": "status"}, path) is not None:
+            message = f"Daemon already listening on {path}"
+            raise RuntimeError(message)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)  # Socket accessible by owner only
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(umask)
+        server.listen(128)
+        server.settimeout(_ACCEPT_TIMEOUT)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda _signum, _frame: self.stop())
+        logger.info("Daemon listening on %s (pid %s)", path, self._pid)
+        try:
+            while not self._stopping:
+                self._reap_children()
+                try:
+                    connection, _address = server.accept()
+                except TimeoutError:
+                    idle_timeout = self.settings.idle_timeout
+                    if idle_timeout is not None and time.monotonic() - self._last_request_at > idle_timeout:
+                        logger.info("Daemon idle for more than %ss, stopping", idle_timeout)
+                        self.stop()
+                    continue
+                with connection:
+                    self._handle(connection, server)
+        finally:
+            # Forked children leave via SystemExit as well, and must not remove the socket of the daemon
+            if os.getpid() == self._pid:
+                server.close()
+                path.unlink(missing_ok=True)
+                logger.info("Daemon stopped after serving %d invocations", self.requests)
+
+    def _reap_children(self) -> None:
+        """Collect exit status of finished children, so they do not linger as zombies."""
+        for pid in list(self._children):
+            try:
+                finished, _status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished = pid
+            if finished:
+                self._children.discard(pid)
+
+    def _handle(self, connection: socket.socket, server: socket.socket) -> None:
+        """Handle a connection of a client.
+
+        Args:
+            connection: The accepted connection.
+            server: The listening socket, closed in forked children.
+        """
+        connection.settimeout(_REQUEST_TIMEOUT)
+        if not _is_same_user(connection):
+            logger.warning("Rejected connection of another user")
+            return
+        try:
+            request, fds = recv_message(connection)
+        except (OSError, ValueError):
+            logger.warning("Received invalid request", exc_info=True)
+            return
+        try:
+            self._respond(connection, server, request, fds)
+        except OSError:
+            logger.warning("Failed to respond to client", exc_info=True)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _respond(
+        self, connection: socket.socket, server: socket.socket, request: dict[str, Any], fds: list[int]
+    ) -> None:
+        """Respond to a request of a client.
+
+        Args:
+            connection: The connection to the client.
+            server: The listening socket, closed in forked children.
+            request: The request.
+            fds: File descriptors passed along with the request.
+        """
+        match request.get("type"):
+            case "status":
+                send_message(connection, self.status())
+            case "stop":
+                self.stop()
+                send_message(connection, {"stopping": True})
+            case "run" if len(fds) == _MAX_FDS:
+                self._fork(connection, server, request, fds)
+            case _:
+                send_message(connection, {"error": "Invalid request"})
+
+    def _fork(self, connection: socket.socket, server: socket.socket, request: dict[str, Any], fds: list[int]) -> None:
+        """Fork a child running the requested invocation.
+
+        Args:
+            connection: The connection to the client.
+            server: The listening socket, closed in the child.
+            request: The run request.
+            fds: Standard streams of the client.
+
+        Raises:
+            SystemExit: In the child once the invocation finished, so it exits like a regular CLI process.
+        """
+        self.requests += 1
+        self._last_request_at = time.monotonic()
+        pid = os.fork()
+        if pid:
+            self._children.add(pid)
+            return
+        server.close()
+        raise SystemExit(self._run_child(connection, request, fds))
+
+    def _run_child(self, connection: socket.socket, request: dict[str, Any], fds: list[int]) -> int:
+        """Run the invocation in the forked child, with the environment and streams of the client.
+
+        Args:
+            connection: The connection to the client.
+            request: The run request with argv, env and cwd.
+            fds: Standard streams of the client, becoming the standard streams of the child.
+
+        Returns:
+            int: The exit code, also sent to the client.
+        """
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        sys.stdout.reconfigure(line_buffering=sys.stdout.isatty())  # type: ignore[union-attr]
+        _reset_console()
+        connection.settimeout(None)
+        send_message(connection, {"pid": os.getpid()})
+        code = self._run_invocation(request)
+        for stream in (sys.stdout, sys.stderr):
+            with contextlib.suppress(OSError):
+                stream.flush()
+        try:
+            send_message(connection, {"exit_code": code})
+        except OSError:
+            logger.debug("Client disconnected before receiving exit code")
+        return code
+
+    def _run_invocation(self, request: dict[str, Any]) -> int:
+        """Run the CLI with the environment of the client.
+
+        Args:
+            request: The run request with argv, env and cwd.
+
+        Returns:
+            int: The exit code.
+        """
+        try:
+            _prepare_invocation(request)
+            code = self.runner(sys.argv[1:])
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)  # noqa: T201
+            return 1
+        except Exception:  # noqa: BLE001
+            traceback.print_exc()
+            return 1
+        return code or 0
+
+
+def _prepare_invocation(request: dict[str, Any]) -> None:
+    """Apply environment, working directory and arguments of the client to the forked child.
+
+    Args:
+        request: The run request with argv, env and cwd.
+    """
+    from .boot import _parse_env_args  # noqa: PLC0415
+
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    sys.argv = [str(arg) for arg in request["argv"]]
+    _parse_env_args()
+
+
+def _is_same_user(connection: socket.socket) -> bool:
+    """Check if the peer of a connection runs as the same user as the daemon.
+
+    - Where peer credentials are not available, access is restricted by permissions of the socket only.
+
+    Args:
+        connection: The accepted connection.
+
+    Returns:
+        bool: True if the peer runs as the same user.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", credentials)
+    return bool(uid == os.getuid())
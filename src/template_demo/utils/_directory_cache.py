@@ -0,0 +1,257 @@
+"""Cache of values derived from directory listings, invalidated when directories change.
+
+- Values are evicted least recently used first.
+- On Linux, directories are watched via inotify, so validating a cached value costs a non-blocking read.
+- Elsewhere, or if a directory cannot be watched, the modification time of the directory is compared instead.
+    Values of directories modified within the timestamp granularity of the filesystem are not cached,
+    as further changes within the same tick would go unnoticed.
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from ._log import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# See inotify(7)
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+_IN_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len of name following the struct
+
+_MTIME_GRANULARITY_NS = 2_000_000_000  # Coarsest common granularity, i.e. FAT
+
+
+class _Inotify:
+    """Minimal inotify binding, reading events without blocking."""
+
+    def __init__(self) -> None:
+        """Initialize an inotify instance.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, path: Path) -> int:
+        """Watch a directory for entries being created, deleted or moved.
+
+        Args:
+            path: The directory.
+
+        Returns:
+            int: The watch descriptor, the same for repeated calls with the same directory.
+
+        Raises:
+            OSError: If the directory cannot be watched, e.g. as the limit of watches is reached.
+        """
+        wd = int(self._libc.inotify_add_watch(self.fd, os.fsencode(path), _IN_MASK))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Stop watching a directory.
+
+        Args:
+            wd: The watch descriptor.
+        """
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> list[tuple[int, int]]:
+        """Read pending events.
+
+        Returns:
+            list[tuple[int, int]]: Watch descriptor and mask of each event.
+        """
+        events: list[tuple[int, int]] = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _IN_EVENT.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += _IN_EVENT.size + length
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    wd: int | None
+    mtime_ns: int
+
+
+class DirectoryCache(Generic[T]):
+    """Thread-safe LRU cache of values derived from directories, e.g. their sorted listing."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of directories to cache values for.
+        """
+        self._capacity = capacity
+        self._entries: OrderedDict[Path, _Entry[T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._inotify: _Inotify | None = None  # Initialized on first use
+        self._inotify_available = sys.platform.startswith("linux")
+        self._paths: dict[int, Path] = {}  # Watched directories by watch descriptor
+        self._changes: dict[int, int] = {}  # Number of events by watch descriptor
+
+    def get(self, path: Path, load: Callable[[Path], T]) -> T:
+        """Get the value for a directory, loading it if not cached or the directory changed.
+
+        Args:
+            path: The directory.
+            load: Function deriving the value from the directory, called without holding the lock.
+
+        Returns:
+            T: The value.
+        """
+        with self._lock:
+            self._process_events()
+            entry = self._entries.get(path)
+            if entry is not None and self._is_valid(path, entry):
+                self._entries.move_to_end(path)
+                return entry.value
+            self._evict(path)
+            # Watch before loading, so changes during loading are noticed
+            wd = self._watch(path)
+            changes = self._changes.get(wd, 0) if wd is not None else 0
+
+        stored = False
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            value = load(path)
+            with self._lock:
+                self._process_events()
+                if wd is None:
+                    stored = time.time_ns() - mtime_ns >= _MTIME_GRANULARITY_NS
+                else:
+                    stored = self._paths.get(wd) == path and self._changes.get(wd, 0) == changes
+                if stored:
+                    self._store(path, _Entry(value, wd, mtime_ns))
+        finally:
+            if not stored and wd is not None:
+                with self._lock:
+                    self._unwatch_if_unused(wd)
+        return value
+
+    def clear(self) -> None:
+        """Forget all cached values and stop watching directories."""
+        with self._lock:
+            for path in list(self._entries):
+                self._evict(path)
+
+    def __len__(self) -> int:
+        """Get number of cached values.
+
+        Returns:
+            int: Number of directories with cached values.
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def _is_valid(path: Path, entry: _Entry[T]) -> bool:
+        if entry.wd is not None:
+            return True  # Evicted when an event is received
+        try:
+            return path.stat().st_mtime_ns == entry.mtime_ns
+        except OSError:
+            return False
+
+    def _watch(self, path: Path) -> int | None:
+        if self._inotify is None and self._inotify_available:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.debug("inotify not available, validating directories by modification time: %s", e)
+                self._inotify_available = False
+        if self._inotify is None:
+            return None
+        try:
+            wd = self._inotify.add_watch(path)
+        except OSError as e:
+            logger.debug("Validating %s by modification time, as it cannot be watched: %s", path, e)
+            return None
+        self._paths[wd] = path
+        return wd
+
+    def _unwatch(self, wd: int) -> None:
+        self._changes.pop(wd, None)
+        if self._paths.pop(wd, None) is not None and self._inotify is not None:
+            self._inotify.rm_watch(wd)
+
+    def _unwatch_if_unused(self, wd: int) -> None:
+        path = self._paths.get(wd)
+        entry = self._entries.get(path) if path is not None else None
+        if entry is None or entry.wd != wd:
+            self._unwatch(wd)
+
+    def _store(self, path: Path, entry: _Entry[T]) -> None:
+        self._entries[path] = entry
+        self._entries.move_to_end(path)
+        while len(self._entries) > self._capacity:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None and entry.wd is not None:
+            self._unwatch(entry.wd)
+
+    def _process_events(self) -> None:
+        if self._inotify is None:
+            return
+        for wd, mask in self._inotify.read_events():
+            if mask & _IN_Q_OVERFLOW:
+                logger.debug("inotify queue overflowed, forgetting all cached values")
+                self._entries.clear()
+                for watched in list(self._paths):
+                    self._unwatch(watched)
+                continue
+            if mask & _IN_IGNORED:
+                # Watch removed, by us or as the directory was deleted or unmounted
+                path = self._paths.pop(wd, None)
+                self._changes.pop(wd, None)
+                if path is not None:
+                    self._entries.pop(path, None)
+                continue
+            self._changes[wd] = self._changes.get(wd, 0) + 1
+            path = self._paths.get(wd)
+            if path is not None and path in self._entries:
+                self._evict(path)
+
+    def __del__(self) -> None:
+        """Close the inotify instance."""
+        if self._inotify is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._inotify.fd)
@@ -1,14 +1,22 @@
+import os
 import platform
 from abc import ABC, abstractmethod
 from pathlib import Path
 from types import EllipsisType
+from typing import NamedTuple
 
 from ._constants import __is_running_in_container__, __project_name__
 from ._di import locate_subclasses
+from ._directory_cache import DirectoryCache
 from ._log import get_logger
 
 logger = get_logger(__name__)
 
+# Rows sent to the grid of the file picker per message
+FILE_PICKER_PAGE_SIZE = 1000
+# Directories whose listing is cached for the file picker
+DIRECTORY_CACHE_SIZE = 32
+
 
 class BasePageBuilder(ABC):
     """Base class for all page builders."""
@@ -66,6 +74,11 @@ def gui_run(  # noqa: PLR0913, PLR0917
 
         app.mount("/api", api)
 
+    from ._worker_pool import start_worker_pool, stop_worker_pool  # noqa: PLC0415
+
+    app.on_startup(start_worker_pool)
+    app.on_shutdown(stop_worker_pool)
+
     gui_register_pages()
     ui.run(
         title=title,
@@ -81,6 +94,70 @@ def gui_run(  # noqa: PLR0913, PLR0917
     )
 
 
+class _DirectoryEntry(NamedTuple):
+    name: str
+    path: str
+    is_dir: bool
+
+
+def _scan_directory(path: Path) -> list[_DirectoryEntry]:
+    """List all entries of a directory, directories first, then by case-insensitive name.
+
+    Uses os.scandir, which caches the type of each entry, so there is at most one stat call per entry.
+
+    Args:
+        path: The directory.
+
+    Returns:
+        list[_DirectoryEntry]: The entries.
+    """
+    with os.scandir(path) as iterator:
+        entries = [_DirectoryEntry(entry.name, entry.path, _is_dir(entry)) for entry in iterator]
+    entries.sort(key=lambda entry: (not entry.is_dir, entry.name.lower()))
+    return entries
+
+
+def _list_directory(path: Path, show_hidden_files: bool = False) -> list[_DirectoryEntry]:
+    """List a directory, directories first, then by case-insensitive name.
+
+    - Listings are cached across file pickers and sessions until the directory changes.
+    - Blocks on the filesystem, so call from a thread when on the event loop.
+
+    Args:
+        path: The directory.
+        show_hidden_files: Whether to include entries whose name starts with a dot.
+
+    Returns:
+        list[_DirectoryEntry]: The entries, or an empty list if the directory cannot be read.
+    """
+    try:
+        entries = _directory_cache.get(path, _scan_directory)
+    except OSError as e:
+        logger.warning("Failed to list directory %s: %s", path, e)
+        return []
+    if show_hidden_files:
+        return entries
+    return [entry for entry in entries if not entry.name.startswith(".")]
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    """Check if a directory entry is a directory, following symlinks.
+
+    Args:
+        entry: The entry.
+
+    Returns:
+        bool: True if the entry is a directory, False otherwise or if it cannot be inspected.
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+_directory_cache: DirectoryCache[list[_DirectoryEntry]] = DirectoryCache(DIRECTORY_CACHE_SIZE)
+
+
 class GUILocalFilePicker:
     """Local File Picker dialog class that lazy-loads NiceGUI dependencies."""
 
@@ -103,7 +180,7 @@ class GUILocalFilePicker:
         Returns:
             An instance of the dialog with lazy-loaded dependencies.
         """
-        from nicegui import events, ui  # noqa: PLC0415
+        from nicegui import background_tasks, events, run, ui  # noqa: PLC0415
         # Lazy import ui only when actually creating an instance
 
         # Define the actual implementation class with the imports available
@@ -136,6 +213,7 @@ class GUILocalFilePicker:
                 else:
                     self.upper_limit = Path(upper_limit).expanduser()
                 self.show_hidden_files = show_hidden_files
+                self.generation = 0
 
                 with self, ui.card():
                     self.add_drives_toggle()
@@ -153,7 +231,7 @@ class GUILocalFilePicker:
                     with ui.row().classes("w-full justify-end"):
                         ui.button("Cancel", on_click=self.close).props("outline").mark("BUTTON_CANCEL")
                         ui.button("Ok", on_click=self._handle_ok).mark("BUTTON_OK")
-                self.update_grid()
+                background_tasks.create(self.update_grid(), name="update_grid")
 
             def add_drives_toggle(self) -> None:
                 if platform.system() == "Windows":
@@ -164,38 +242,51 @@ class GUILocalFilePicker:
 
             def update_drive(self) -> None:
                 self.path = Path(str(self.drives_toggle.value)).expanduser()
-                self.update_grid()
-
-            def update_grid(self) -> None:
-                paths = list(self.path.glob("*"))
-                if not self.show_hidden_files:
-                    paths = [p for p in paths if not p.name.startswith(".")]
-                paths.sort(key=lambda p: p.name.lower())
-                paths.sort(key=lambda p: not p.is_dir())
-
-                self.grid.options["rowData"] = [
+                background_tasks.create(self.update_grid(), name="update_grid")
+
+            async def update_grid(self) -> None:
+                """Show the current directory, listing it off the event loop and sending rows page by page."""
+                self.generation += 1
+                generation = self.generation
+                path = self.path
+                entries = await run.io_bound(_list_directory, path, self.show_hidden_files)
+                if entries is None or generation != self.generation:
+                    return  # Shutting down, or another directory was opened meanwhile
+
+                rows = [
                     {
-                        "name": f"📁 <strong>{p.name}</strong>" if p.is_dir() else p.name,
-                        "path": str(p),
+                        "name": f"📁 <strong>{entry.name}</strong>" if entry.is_dir else entry.name,
+                        "path": entry.path,
+                        "dir": entry.is_dir,
                     }
-                    for p in paths
+                    for entry in entries
                 ]
-                if (self.upper_limit is None and self.path != self.path.parent) or (
-                    self.upper_limit is not None and self.path != self.upper_limit
+                if (self.upper_limit is None and path != path.parent) or (
+                    self.upper_limit is not None and path != self.upper_limit
                 ):
-                    self.grid.options["rowData"].insert(
-                        0,
-                        {
-                            "name": "📁 <strong>..</strong>",
-                            "path": str(self.path.parent),
-                        },
-                    )
-                self.grid.update()
+                    rows.insert(0, {"name": "📁 <strong>..</strong>", "path": str(path.parent), "dir": True})
 
-            def handle_double_click(self, e: events.GenericEventArguments) -> None:
+                # The first page replaces the grid content, further pages are appended as transactions,
+                # each awaited so the client is not flooded
+                self.grid.options["rowData"] = rows[:FILE_PICKER_PAGE_SIZE]
+                self.grid.update()
+                for start in range(FILE_PICKER_PAGE_SIZE, len(rows), FILE_PICKER_PAGE_SIZE):
+                    if generation != self.generation:
+                        return
+                    page = rows[start : start + FILE_PICKER_PAGE_SIZE]
+                    self.grid.options["rowData"].extend(page)
+                    try:
+                        await self.grid.run_grid_method("applyTransaction", {"add": page})
+                    except TimeoutError:
+                        # Grid not mounted in the browser yet, so send all rows with its options
+                        self.grid.options["rowData"] = rows
+                        self.grid.update()
+                        return
+
+            async def handle_double_click(self, e: events.GenericEventArguments) -> None:
                 self.path = Path(e.args["data"]["path"])
-                if self.path.is_dir():
-                    self.update_grid()
+                if e.args["data"].get("dir"):
+                    await self.update_grid()
                 else:
                     self.submit([str(self.path)])
 
@@ -0,0 +1,248 @@
+"""Background jobs for expensive operations, e.g. to be submitted and polled via the webservice API.
+
+- JobQueue runs jobs on a bounded thread pool, created on first use, and rejects jobs once too many are pending.
+- Jobs are deduplicated by key: submitting a job while one with the same key is pending or running
+    returns the job in flight, and results of succeeded jobs are reused for a given time.
+- Finished jobs can be retrieved for a limited time, after which they are forgotten.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+import uuid
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Annotated, Any, ClassVar
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._settings import load_settings
+
+
+class JobSettings(BaseSettings):
+    """Settings for background jobs."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_JOBS_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    max_workers: Annotated[
+        int,
+        Field(description="Number of jobs run concurrently per queue", ge=1, default=2),
+    ]
+    max_pending: Annotated[
+        int,
+        Field(
+            description="Maximum number of jobs waiting to run per queue, further jobs are rejected", ge=0, default=16
+        ),
+    ]
+    result_ttl: Annotated[
+        float,
+        Field(description="Seconds finished jobs can be retrieved for", gt=0.0, default=300.0),
+    ]
+
+
+class _JobState(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobStatus(BaseModel):
+    """Status of a background job, with its result once succeeded."""
+
+    State: ClassVar[type[_JobState]] = _JobState
+    id: str = Field(description="Identifier of the job")
+    state: _JobState = Field(description="State of the job")
+    created_at: datetime = Field(description="When the job was submitted")
+    finished_at: datetime | None = Field(default=None, description="When the job finished, if finished")
+    result: Any = Field(default=None, description="Result of the job, if succeeded")
+    error: str | None = Field(default=None, description="Error of the job, if failed")
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when submitting a job to a queue with too many pending jobs."""
+
+
+@dataclass
+class Job:
+    """A job submitted to a JobQueue."""
+
+    id: str
+    key: Hashable
+    future: Future[Any] = field(init=False)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    finished_monotonic: float | None = None
+
+    @property
+    def state(self) -> _JobState:
+        """State of the job, derived from its future."""
+        if not self.future.done():
+            return _JobState.RUNNING if self.future.running() else _JobState.PENDING
+        if self.future.cancelled() or self.future.exception() is not None:
+            return _JobState.FAILED
+        return _JobState.SUCCEEDED
+
+    def status(self) -> JobStatus:
+        """Get the status of the job.
+
+        Returns:
+            JobStatus: The status, with the result or error once finished.
+        """
+        state = self.state
+        result, error = None, None
+        if state == _JobState.SUCCEEDED:
+            result = self.future.result()
+        elif state == _JobState.FAILED:
+            error = "Cancelled" if self.future.cancelled() else repr(self.future.exception())
+        return JobStatus(
+            id=self.id,
+            state=state,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            result=result,
+            error=error,
+        )
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the job to finish, without cancelling it on timeout.
+
+        Args:
+            timeout: Seconds to wait at most.
+
+        Returns:
+            bool: True if the job finished.
+        """
+        if not self.future.done() and timeout > 0:
+            # Timeouts and failures alike are reported via the status of the job
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self.future)), timeout)
+        return self.future.done()
+
+
+class JobQueue:
+    """Bounded queue of background jobs, deduplicated by key."""
+
+    def __init__(self, name: str, settings: JobSettings | None = None) -> None:
+        """Initialize the queue.
+
+        Args:
+            name: Name of the queue, used as prefix of its worker threads.
+            settings: Job settings, loaded from the environment on first submission if not given.
+        """
+        self.name = name
+        self._settings = settings
+        self._executor: ThreadPoolExecutor | None = None
+        self._jobs: dict[str, Job] = {}
+        self._by_key: dict[Hashable, Job] = {}  # Latest job by key
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self) -> JobSettings:
+        """Job settings of the queue."""
+        if self._settings is None:
+            self._settings = load_settings(JobSettings)
+        return self._settings
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args: Any, reuse_for: float = 0.0) -> Job:  # noqa: ANN401
+        """Submit a job, unless a job with the same key is in flight or succeeded recently.
+
+        Args:
+            key: Key identifying equivalent jobs, e.g. the operation and its arguments.
+            fn: Function to run.
+            *args: Arguments of the function.
+            reuse_for: Seconds the result of a succeeded job with the same key is reused for.
+
+        Returns:
+            Job: The submitted job, or the equivalent job in flight or succeeded recently.
+
+        Raises:
+            JobQueueFullError: If too many jobs are pending.
+        """
+        with self._lock:
+            self._prune()
+            job = self._by_key.get(key)
+            if job is not None and (
+                not job.future.done()
+                or (
+                    job.state == _JobState.SUCCEEDED
+                    and job.finished_monotonic is not None
+                    and time.monotonic() - job.finished_monotonic < reuse_for
+                )
+            ):
+                return job
+            pending = sum(1 for job in self._jobs.values() if job.state == _JobState.PENDING)
+            if pending >= self.settings.max_pending:
+                message = f"Too many pending jobs in queue '{self.name}'"
+                raise JobQueueFullError(message)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.settings.max_workers, thread_name_prefix=f"jobs-{self.name}"
+                )
+            job = Job(id=uuid.uuid4().hex, key=key)
+            job.future = self._executor.submit(self._run, job, fn, *args)
+            self._jobs[job.id] = job
+            self._by_key[key] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a job submitted recently.
+
+        Args:
+            job_id: The identifier of the job.
+
+        Returns:
+            Job | None: The job, or None if unknown or forgotten.
+        """
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running jobs finished, cancelling pending jobs."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    @staticmethod
+    def _run(job: Job, fn: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """Run a job, recording when it finished before its future resolves.
+
+        Args:
+            job: The job.
+            fn: Function to run.
+            *args: Arguments of the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        try:
+            return fn(*args)
+        finally:
+            job.finished_at = datetime.now(UTC)
+            job.finished_monotonic = time.monotonic()
+
+    def _prune(self) -> None:
+        """Forget jobs finished longer than the result TTL ago."""
+        deadline = time.monotonic() - self.settings.result_ttl
+        expired = [
+            job
+            for job in self._jobs.values()
+            if job.finished_monotonic is not None and job.finished_monotonic < deadline
+        ]
+        for job in expired:
+            del self._jobs[job.id]
+            if self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
@@ -1,23 +1,35 @@
 """Logging configuration and utilities."""
 
+import atexit
 import contextlib
+import copy
+import gzip
+import json
 import logging as python_logging
 import os
+import random
+import shutil
+import sys
+import threading
+import time
 import typing as t
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
 from logging import FileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+from queue import Full, Queue
 from typing import Annotated, Literal
 
-import click
-import logfire
 from pydantic import AfterValidator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from rich.console import Console
-from rich.logging import RichHandler
 
 from ._constants import __env_file__, __is_running_in_read_only_environment__, __project_name__
 from ._settings import load_settings
 
+logger = python_logging.getLogger(__name__)
+
 
 def get_logger(name: str | None) -> python_logging.Logger:
     """
@@ -74,6 +86,33 @@ def _validate_file_name(file_name: str | None) -> str | None:
     return file_name
 
 
+def _is_zstd_available() -> bool:
+    """Check if zstd compression is available.
+
+    Returns:
+        bool: True if running on Python 3.14+ or the zstandard package is installed.
+    """
+    return sys.version_info >= (3, 14) or find_spec("zstandard") is not None
+
+
+def _validate_file_compression(compression: str) -> str:
+    """Validate the compression of rotated log files is available.
+
+    Args:
+        compression: The compression of rotated log files.
+
+    Returns:
+        str: The validated compression.
+
+    Raises:
+        ValueError: If zstd compression is requested but not available.
+    """
+    if compression == "zstd" and not _is_zstd_available():
+        message = "zstd compression requires Python 3.14+ or the zstandard package to be installed"
+        raise ValueError(message)
+    return compression
+
+
 class LogSettings(BaseSettings):
     """Settings for configuring logging behavior."""
 
@@ -104,15 +143,146 @@ class LogSettings(BaseSettings):
         bool,
         Field(description="Enable logging to console", default=False),
     ]
+    queue_enabled: Annotated[
+        bool,
+        Field(
+            description=(
+                "Hand log records to a background thread via a bounded queue, "
+                "so that logging calls only enqueue and never block on I/O"
+            ),
+            default=True,
+        ),
+    ]
+    queue_size: Annotated[
+        int,
+        Field(description="Maximum number of log records waiting in the queue", ge=1, default=10_000),
+    ]
+    queue_overflow: Annotated[
+        Literal["drop", "block"],
+        Field(
+            description="Behavior if the queue is full: drop the record or block the caller until there is room",
+            default="drop",
+        ),
+    ]
+    file_flush_batch_size: Annotated[
+        int,
+        Field(description="Number of records written to the log file before flushing it", ge=1, default=100),
+    ]
+    file_flush_interval: Annotated[
+        float,
+        Field(description="Maximum number of seconds between flushes of the log file", ge=0.0, default=1.0),
+    ]
+    file_format: Annotated[
+        Literal["text", "json"],
+        Field(description="Format of the log file: plain text or compact JSON lines", default="text"),
+    ]
+    file_rotation: Annotated[
+        Literal["none", "size", "time"],
+        Field(description="Rotate the log file when it reaches a maximum size or at given times", default="none"),
+    ]
+    file_rotation_max_bytes: Annotated[
+        int,
+        Field(description="Size in bytes at which the log file is rotated", ge=1, default=10 * 1024 * 1024),
+    ]
+    file_rotation_when: Annotated[
+        Literal["S", "M", "H", "D", "midnight", "W0", "W1", "W2", "W3", "W4", "W5", "W6"],
+        Field(
+            description=(
+                "Unit of the time based rotation interval, see "
+                "https://docs.python.org/3/library/logging.handlers.html#timedrotatingfilehandler"
+            ),
+            default="midnight",
+        ),
+    ]
+    file_rotation_interval: Annotated[
+        int,
+        Field(description="Number of units between time based rotations", ge=1, default=1),
+    ]
+    file_rotation_backup_count: Annotated[
+        int,
+        Field(description="Number of rotated log files to keep", ge=0, default=7),
+    ]
+    file_compression: Annotated[
+        Literal["none", "gzip", "zstd"],
+        AfterValidator(_validate_file_compression),
+        Field(description="Compress rotated log files in the background", default="none"),
+    ]
+    filter_sample_rate_debug: Annotated[
+        float,
+        Field(description="Probability of a DEBUG record to be logged", ge=0.0, le=1.0, default=1.0),
+    ]
+    filter_sample_rate_info: Annotated[
+        float,
+        Field(description="Probability of an INFO record to be logged", ge=0.0, le=1.0, default=1.0),
+    ]
+    filter_rate_limit: Annotated[
+        float,
+        Field(
+            description="Maximum number of records per second and logger below ERROR level, 0 for no limit",
+            ge=0.0,
+            default=0.0,
+        ),
+    ]
+    filter_rate_limit_burst: Annotated[
+        int,
+        Field(
+            description="Number of records a logger can log at once before the rate limit applies", ge=1, default=1000
+        ),
+    ]
+    filter_dedup_window: Annotated[
+        float,
+        Field(
+            description="Seconds within which identical records below ERROR level are logged only once, 0 to disable",
+            ge=0.0,
+            default=0.0,
+        ),
+    ]
+    filter_report_interval: Annotated[
+        float,
+        Field(description="Minimum number of seconds between reports of suppressed records", ge=0.0, default=60.0),
+    ]
 
 
-class CustomFilter(python_logging.Filter):
-    """Custom filter for log records."""
+_FILTER_DECISION = "_rate_limiting_filter_decision"
 
-    @staticmethod
-    def filter(_record: python_logging.LogRecord) -> bool:
+
+class RateLimitingFilter(python_logging.Filter):
+    """Filter sampling, rate limiting and deduplicating log records.
+
+    - Records at ERROR level and above always pass.
+    - DEBUG and INFO records are sampled with the configured probabilities.
+    - Each logger passes at most the configured number of records per second, allowing for bursts.
+    - Records identical to a record that passed within the deduplication window are suppressed.
+    - Counts of suppressed records are periodically reported as a warning.
+    - The decision is stored on the record, so a record passing several handlers is only judged once.
+    """
+
+    def __init__(self, settings: LogSettings) -> None:
+        """Initialize the filter.
+
+        Args:
+            settings: The log settings.
         """
-        Filter log records based on custom criteria.
+        super().__init__()
+        self._sample_rates = {
+            python_logging.DEBUG: settings.filter_sample_rate_debug,
+            python_logging.INFO: settings.filter_sample_rate_info,
+        }
+        self._rate_limit = settings.filter_rate_limit
+        self._burst = settings.filter_rate_limit_burst
+        self._dedup_window = settings.filter_dedup_window
+        self._report_interval = settings.filter_report_interval
+        self._enabled = (
+            any(rate < 1.0 for rate in self._sample_rates.values()) or self._rate_limit > 0 or self._dedup_window > 0
+        )
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._recent: dict[tuple[str, int, str], float] = {}
+        self._suppressed: Counter[tuple[str, str]] = Counter()
+        self._last_report = time.monotonic()
+
+    def filter(self, record: python_logging.LogRecord) -> bool:
+        """Decide if the record is logged.
 
         Args:
             record: The log record to filter.
@@ -120,28 +290,606 @@ class CustomFilter(python_logging.Filter):
         Returns:
             bool: True if record should be logged, False otherwise.
         """
+        decision: bool | None = record.__dict__.get(_FILTER_DECISION)
+        if decision is not None:
+            return decision
+        decision = True if not self._enabled or record.levelno >= python_logging.ERROR else self._decide(record)
+        setattr(record, _FILTER_DECISION, decision)
+        self._report_if_due()
+        return decision
+
+    def _decide(self, record: python_logging.LogRecord) -> bool:
+        """Sample, rate limit and deduplicate the record.
+
+        Args:
+            record: The log record to decide on.
+
+        Returns:
+            bool: True if record should be logged, False otherwise.
+        """
+        sample_rate = self._sample_rates.get(record.levelno, 1.0)
+        if sample_rate < 1.0 and random.random() >= sample_rate:  # noqa: S311
+            return self._suppress(record, "sampled")
+
+        now = time.monotonic()
+        with self._lock:
+            if self._rate_limit > 0:
+                tokens, last = self._buckets.get(record.name, (float(self._burst), now))
+                tokens = min(float(self._burst), tokens + (now - last) * self._rate_limit)
+                if tokens < 1.0:
+                    self._buckets[record.name] = (tokens, now)
+                    self._suppressed[record.name, "rate limited"] += 1
+                    return False
+                self._buckets[record.name] = (tokens - 1.0, now)
+
+            if self._dedup_window > 0:
+                key = (record.name, record.levelno, record.getMessage())
+                passed_at = self._recent.get(key)
+                if passed_at is not None and now - passed_at < self._dedup_window:
+                    self._suppressed[record.name, "duplicate"] += 1
+                    return False
+                self._recent[key] = now
         return True
 
+    def _suppress(self, record: python_logging.LogRecord, reason: str) -> bool:
+        """Count the record as suppressed.
 
-def logging_initialize(log_to_logfire: bool = False) -> None:
-    """Initialize logging configuration."""
-    log_filter = CustomFilter()
+        Args:
+            record: The suppressed log record.
+            reason: Why the record was suppressed.
 
-    handlers = []
+        Returns:
+            bool: Always False.
+        """
+        with self._lock:
+            self._suppressed[record.name, reason] += 1
+        return False
+
+    def _report_if_due(self) -> None:
+        """Log counts of suppressed records if the report interval elapsed."""
+        now = time.monotonic()
+        if now - self._last_report < self._report_interval:
+            return
+        with self._lock:
+            if now - self._last_report < self._report_interval:
+                return
+            elapsed = now - self._last_report
+            self._last_report = now
+            suppressed, self._suppressed = self._suppressed, Counter()
+            if self._dedup_window > 0:
+                self._recent = {key: at for key, at in self._recent.items() if now - at < self._dedup_window}
+        if suppressed:
+            logger.warning(
+                "Suppressed %d log records in the last %.0f seconds: %s",
+                suppressed.total(),
+                elapsed,
+                ", ".join(f"{name} ({reason}): {count}" for (name, reason), count in suppressed.most_common()),
+                extra={_FILTER_DECISION: True},
+            )
+
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _PrecompiledFormatter(python_logging.Formatter):
+    """Base of formatters building lines directly instead of going through %-style format strings.
+
+    - The timestamp is formatted at most once per second.
+    - Formatting only happens for records that passed all filters.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the formatter."""
+        super().__init__(datefmt=_DATE_FORMAT)
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: python_logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802, ARG002
+        """Format the creation time of the record, reusing the result within the same second.
+
+        Args:
+            record: The log record.
+            datefmt: Ignored, the date format of the formatter is used.
+
+        Returns:
+            str: The formatted creation time.
+        """
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = super().formatTime(record, self.datefmt)
+            self._time_cache = (second, formatted)
+        return formatted
+
+    def _exception_text(self, record: python_logging.LogRecord) -> str | None:
+        """Get the formatted exception of the record, caching it on the record.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            str | None: The formatted exception, None if the record has none.
+        """
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        return record.exc_text or None
+
+
+class _TextFormatter(_PrecompiledFormatter):
+    """Formatter rendering records as text lines.
+
+    - Equivalent to the format "%(asctime)s %(process)d %(levelname)s %(name)s %(message)s".
+    """
+
+    def format(self, record: python_logging.LogRecord) -> str:
+        """Format the record.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            str: The formatted line.
+        """
+        line = f"{self.formatTime(record)} {record.process} {record.levelname} {record.name} {record.getMessage()}"
+        exception_text = self._exception_text(record)
+        if exception_text:
+            line = f"{line}\n{exception_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+
+class _JSONFormatter(_PrecompiledFormatter):
+    """Formatter rendering records as compact JSON lines."""
+
+    _encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+    def format(self, record: python_logging.LogRecord) -> str:
+        """Format the record.
+
+        Args:
+            record: The log record.
+
+        Returns:
+            str: The formatted JSON line.
+        """
+        data = {
+            "time": self.formatTime(record),
+            "pid": record.process,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        exception_text = self._exception_text(record)
+        if exception_text:
+            data["exception"] = exception_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return self._encode(data)
+
+
+_COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_compression_executor: ThreadPoolExecutor | None = None
+_compression_futures: list[Future[None]] = []
+
+
+def _compress_log_file(source: str, target: str, compression: str) -> None:
+    """Compress a rotated log file and remove the uncompressed file.
+
+    Args:
+        source: The uncompressed log file.
+        target: The compressed log file to create.
+        compression: The compression to use, gzip or zstd.
+    """
+    with Path(source).open("rb") as src:
+        if compression == "gzip":
+            with gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        elif sys.version_info >= (3, 14):
+            from compression import zstd  # noqa: PLC0415
+
+            with zstd.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            import zstandard  # noqa: PLC0415
+
+            with Path(target).open("wb") as raw, zstandard.ZstdCompressor().stream_writer(raw) as dst:
+                shutil.copyfileobj(src, dst)
+    Path(source).unlink()
+
+
+def _wait_for_log_compression() -> None:
+    """Wait until all rotated log files scheduled for compression are compressed."""
+    while _compression_futures:
+        _compression_futures.pop(0).result()
+
+
+class _LogFileCompressor:
+    """Namer and rotator for rotating handlers, compressing rotated log files on a background thread."""
+
+    def __init__(self, compression: str) -> None:
+        """Initialize the compressor.
+
+        Args:
+            compression: The compression to use, gzip or zstd.
+        """
+        self.compression = compression
+        self.suffix = _COMPRESSION_SUFFIXES[compression]
+
+    def namer(self, name: str) -> str:
+        """Name rotated log files after their compressed variant.
+
+        Args:
+            name: The default name of the rotated log file.
+
+        Returns:
+            str: The name with the suffix of the compression appended.
+        """
+        return f"{name}{self.suffix}"
+
+    def rotator(self, source: str, dest: str) -> None:
+        """Move the log file aside and schedule its compression.
+
+        Args:
+            source: The log file to rotate.
+            dest: The name of the compressed rotated log file.
+        """
+        global _compression_executor  # noqa: PLW0603
+        if not Path(source).exists():
+            return
+        uncompressed = dest.removesuffix(self.suffix)
+        Path(source).replace(uncompressed)
+        if _compression_executor is None:
+            _compression_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compression")
+        _compression_futures.append(
+            _compression_executor.submit(_compress_log_file, uncompressed, dest, self.compression)
+        )
+
+
+class _BatchedFlushMixin(python_logging.StreamHandler):  # type: ignore[type-arg]
+    """Mixin for file handlers flushing to disk once per batch of records instead of after every record."""
+
+    def __init__(self, *args, batch_size: int, flush_interval: float, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        """Initialize the handler.
+
+        Args:
+            *args: Arguments to pass to the file handler.
+            batch_size: Number of records written before flushing.
+            flush_interval: Maximum number of seconds between flushes.
+            **kwargs: Keyword arguments to pass to the file handler.
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._emitting = False
+
+    def emit(self, record: python_logging.LogRecord) -> None:
+        """Write a record, flushing if the batch is complete or the flush interval elapsed.
+
+        Args:
+            record: The record to write.
+        """
+        with self.lock:  # type: ignore[union-attr]
+            self._emitting = True  # Defer the flush the stream handler performs after every record
+            try:
+                super().emit(record)
+            finally:
+                self._emitting = False
+            self._pending += 1
+            if self._pending >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def flush(self) -> None:
+        """Flush all records written so far, unless called by emit for a single record."""
+        with self.lock:  # type: ignore[union-attr]
+            if self._emitting:
+                return
+            self._pending = 0
+            self._last_flush = time.monotonic()
+            super().flush()
+
+
+class _BatchingFileHandler(_BatchedFlushMixin, FileHandler):
+    """File handler flushing in batches."""
+
+
+class _BatchingRotatingFileHandler(_BatchedFlushMixin, RotatingFileHandler):
+    """Size based rotating file handler flushing in batches."""
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Rotate the log file once compression of previously rotated files is done."""
+        _wait_for_log_compression()
+        super().doRollover()
+
+
+class _BatchingTimedRotatingFileHandler(_BatchedFlushMixin, TimedRotatingFileHandler):
+    """Time based rotating file handler flushing in batches."""
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Rotate the log file once compression of previously rotated files is done."""
+        _wait_for_log_compression()
+        super().doRollover()
+
+
+def _create_file_handler(settings: LogSettings) -> FileHandler:
+    """Create the file handler as configured.
+
+    Args:
+        settings: The log settings.
+
+    Returns:
+        FileHandler: The file handler, rotating and compressing the log file if configured.
+    """
+    batch_size = settings.file_flush_batch_size
+    flush_interval = settings.file_flush_interval
+    handler: FileHandler
+    match settings.file_rotation:
+        case "size":
+            handler = _BatchingRotatingFileHandler(
+                settings.file_name,
+                maxBytes=settings.file_rotation_max_bytes,
+                backupCount=settings.file_rotation_backup_count,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+            )
+        case "time":
+            handler = _BatchingTimedRotatingFileHandler(
+                settings.file_name,
+                when=settings.file_rotation_when,
+                interval=settings.file_rotation_interval,
+                backupCount=settings.file_rotation_backup_count,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+            )
+        case _:
+            handler = _BatchingFileHandler(settings.file_name, batch_size=batch_size, flush_interval=flush_interval)
+
+    if isinstance(handler, RotatingFileHandler | TimedRotatingFileHandler) and settings.file_compression != "none":
+        compressor = _LogFileCompressor(settings.file_compression)
+        handler.namer = compressor.namer
+        handler.rotator = compressor.rotator
+
+    handler.setFormatter(_JSONFormatter() if settings.file_format == "json" else _TextFormatter())
+    return handler
+
+
+class _LogQueueHandler(QueueHandler):
+    """Queue handler that never blocks the caller unless configured to, and counts overflows."""
+
+    queue: Queue[python_logging.LogRecord]
+
+    def __init__(self, log_queue: Queue[python_logging.LogRecord], block_on_overflow: bool) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: The bounded queue to put records into.
+            block_on_overflow: Block the caller if the queue is full instead of dropping the record.
+        """
+        super().__init__(log_queue)
+        self.block_on_overflow = block_on_overflow
+        self.enqueued = 0
+        self.overflowed = 0
+        self.dropped = 0
+
+    def prepare(self, record: python_logging.LogRecord) -> python_logging.LogRecord:  # noqa: PLR6301
+        """Prepare a record for enqueuing.
+
+        - Merges args into the message, so mutable args can change after the call returns.
+        - Keeps exc_info other than the base implementation, as records never leave the process,
+            so handlers such as the rich handler can still render tracebacks.
+
+        Args:
+            record: The record to prepare.
+
+        Returns:
+            LogRecord: A copy of the record with the message formatted.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: python_logging.LogRecord) -> None:
+        """Put the record into the queue, counting records dropped or delayed due to a full queue.
+
+        Args:
+            record: The record to enqueue.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.overflowed += 1
+            if not self.block_on_overflow:
+                self.dropped += 1
+                return
+            self.queue.put(record)
+        self.enqueued += 1
+
+
+class _LogQueueListener(QueueListener):
+    """Queue listener flushing batching handlers whenever the queue runs empty."""
+
+    queue: Queue[python_logging.LogRecord | None]
+
+    def dequeue(self, block: bool) -> python_logging.LogRecord:
+        """Dequeue the next record, flushing pending batches before waiting for it.
+
+        Args:
+            block: Whether to block until a record is available.
+
+        Returns:
+            LogRecord: The dequeued record.
+        """
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, _BatchedFlushMixin):
+                    handler.flush()
+        return super().dequeue(block)
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the sentinel, waiting for room if the queue is full."""
+        self.queue.put(self._sentinel)  # type: ignore[attr-defined]
+
+
+_queue_handler: _LogQueueHandler | None = None
+_queue_listener: _LogQueueListener | None = None
+# Handlers attached to the root logger by the last call of logging_initialize
+_root_handlers: list[python_logging.Handler] = []
+
+
+def _stop_queue_listener() -> None:
+    """Stop the queue listener, processing all records still queued."""
+    global _queue_listener  # noqa: PLW0603
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _start_queue_listener(handlers: list[python_logging.Handler], settings: LogSettings) -> _LogQueueHandler:
+    """Start a listener passing queued records to the given handlers on a background thread.
+
+    Args:
+        handlers: The handlers doing the actual I/O.
+        settings: The log settings.
+
+    Returns:
+        _LogQueueHandler: The handler to attach to loggers, enqueuing records for the listener.
+    """
+    global _queue_handler, _queue_listener  # noqa: PLW0603
+    _stop_queue_listener()
+    log_queue: Queue[python_logging.LogRecord] = Queue(maxsize=settings.queue_size)
+    _queue_handler = _LogQueueHandler(log_queue, block_on_overflow=settings.queue_overflow == "block")
+    _queue_listener = _LogQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.unregister(_stop_queue_listener)
+    atexit.register(_stop_queue_listener)
+    return _queue_handler
+
+
+def get_log_queue_stats() -> dict[str, int]:
+    """Get counters of the log queue.
+
+    Returns:
+        dict[str, int]: Number of records enqueued, records that found the queue full (overflowed),
+            records dropped due to the queue being full, and records currently waiting in the queue.
+            Empty if logging does not use a queue.
+    """
+    if _queue_handler is None:
+        return {}
+    return {
+        "enqueued": _queue_handler.enqueued,
+        "overflowed": _queue_handler.overflowed,
+        "dropped": _queue_handler.dropped,
+        "queued": _queue_handler.queue.qsize(),
+    }
+
+
+def _reinit_queue_after_fork() -> None:
+    """Restart the queue listener in a forked child, as its thread does not survive the fork.
+
+    - The child gets a fresh queue, as the lock of the inherited one might have been held by another thread.
+    - Records queued but not yet handled at the time of the fork are left to the parent.
+    """
+    if _queue_handler is None or _queue_listener is None:
+        return
+    log_queue: Queue[python_logging.LogRecord] = Queue(maxsize=_queue_handler.queue.maxsize)
+    _queue_handler.queue = log_queue
+    _queue_listener.queue = log_queue  # type: ignore[assignment]
+    _queue_listener._thread = None  # noqa: SLF001
+    _queue_listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_queue_after_fork)
+
+
+class _DeferredHandler(python_logging.Handler):
+    """Handler buffering records until the handlers they are destined for are ready, e.g. during background boot."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the handler.
+
+        Args:
+            capacity: Maximum number of records buffered; further records are dropped and counted.
+        """
+        super().__init__()
+        self.capacity = capacity
+        self.buffer: list[python_logging.LogRecord] = []
+        self.dropped = 0
+        self._targets: list[python_logging.Handler] | None = None
+
+    def emit(self, record: python_logging.LogRecord) -> None:
+        """Buffer the record, or pass it on to the target handlers once ready.
+
+        Args:
+            record: The record to emit.
+        """
+        if self._targets is None:
+            if len(self.buffer) < self.capacity:
+                self.buffer.append(record)
+            else:
+                self.dropped += 1
+            return
+        self._dispatch(record, self._targets)
+
+    @staticmethod
+    def _dispatch(record: python_logging.LogRecord, handlers: list[python_logging.Handler]) -> None:
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def replay(
+        self, targets: list[python_logging.Handler], replay_only: list[python_logging.Handler] | None = None
+    ) -> None:
+        """Replay buffered records and pass on subsequent records.
+
+        Args:
+            targets: Handlers receiving buffered and subsequent records.
+            replay_only: Handlers receiving buffered records only, e.g. as they capture subsequent records on their own.
+        """
+        self.acquire()
+        try:
+            for record in self.buffer:
+                self._dispatch(record, [*targets, *(replay_only or [])])
+            self.buffer.clear()
+            self._targets = targets
+        finally:
+            self.release()
+        if self.dropped:
+            python_logging.getLogger(__name__).warning(
+                "Dropped %d log records while observability backends were starting", self.dropped
+            )
+
+
+def logging_initialize(
+    log_to_logfire: bool = False, additional_handlers: list[python_logging.Handler] | None = None
+) -> None:
+    """Initialize logging configuration.
+
+    - If the queue is enabled, handlers run on a background thread fed by a bounded queue.
+
+    Args:
+        log_to_logfire: Pass records to logfire, which must be configured already.
+        additional_handlers: Further handlers, subject to the same filtering and queueing as the built-in ones.
+    """
+    handlers: list[python_logging.Handler] = []
 
     settings = load_settings(LogSettings)
 
+    log_filter = RateLimitingFilter(settings)
+
     if settings.file_enabled:
-        file_handler = python_logging.FileHandler(settings.file_name)
-        file_formatter = python_logging.Formatter(
-            fmt="%(asctime)s %(process)d %(levelname)s %(name)s %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler = _create_file_handler(settings)
         file_handler.addFilter(log_filter)
         handlers.append(file_handler)
 
     if settings.console_enabled:
+        import click  # noqa: PLC0415
+        from rich.console import Console  # noqa: PLC0415
+        from rich.logging import RichHandler  # noqa: PLC0415
+
         rich_handler = RichHandler(
             console=Console(stderr=True),
             markup=True,
@@ -157,13 +905,34 @@ def logging_initialize(log_to_logfire: bool = False) -> None:
         handlers.append(t.cast("FileHandler", rich_handler))
 
     if log_to_logfire:
+        import logfire  # noqa: PLC0415
+
         logfire_handler = logfire.LogfireLoggingHandler()
         logfire_handler.addFilter(log_filter)
         handlers.append(t.cast("FileHandler", logfire_handler))
 
+    for handler in additional_handlers or []:
+        handler.addFilter(log_filter)
+        handlers.append(handler)
+
+    if settings.queue_enabled and handlers:
+        queue_handler = _start_queue_listener(handlers, settings)
+        queue_handler.addFilter(log_filter)  # filter before enqueuing, so dropped records are never formatted
+        handlers = [queue_handler]
+
+    # Detach the handlers of a previous initialization, as basicConfig keeps existing handlers of the root logger,
+    # e.g. the queue handler of a stopped listener, whose records would pile up in a queue nothing drains
+    global _root_handlers  # noqa: PLW0603
+    root_logger = python_logging.getLogger()
+    for handler in _root_handlers:
+        root_logger.removeHandler(handler)
+        if handler not in handlers:
+            handler.close()
+    _root_handlers = list(handlers)
+
     python_logging.basicConfig(
         level=settings.level,
         format="%(name)s %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+        datefmt=_DATE_FORMAT,
         handlers=handlers,
     )
@@ -1,14 +1,18 @@
 """Logfire integration for logging and instrumentation."""
 
-from typing import Annotated
+import os
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Annotated, Literal
 
-import logfire
 from pydantic import BeforeValidator, Field, PlainSerializer, SecretStr
 from pydantic_settings import SettingsConfigDict
 
 from ._constants import __env__, __env_file__, __project_name__, __repository_url__, __version__
 from ._settings import OpaqueSettings, load_settings, strip_to_none_before_validator
 
+if TYPE_CHECKING:
+    import logfire
+
 
 class LogfireSettings(OpaqueSettings):
     """Configuration settings for Logfire integration."""
@@ -30,13 +34,84 @@ class LogfireSettings(OpaqueSettings):
         bool,
         Field(description="Enable system metrics instrumentation", default=False),
     ]
+    auto_tracing_min_duration: Annotated[
+        float,
+        Field(
+            description=(
+                "Minimum duration in seconds of a function call before it is auto-traced. "
+                "Calls are timed always, but only functions that once exceeded the threshold are traced."
+            ),
+            ge=0.0,
+            default=0.01,
+        ),
+    ]
+    auto_tracing_modules: Annotated[
+        list[str] | None,
+        Field(
+            description=(
+                "Module prefixes to auto-trace, including submodules. "
+                "Leave unset to trace the modules given by the application."
+            ),
+            examples=[["template_demo.hello"]],
+            default=None,
+        ),
+    ]
+    auto_tracing_exclude_modules: Annotated[
+        list[str],
+        Field(
+            description="Module prefixes to exclude from auto-tracing, including submodules",
+            examples=[["template_demo.hello._gui"]],
+            default=[],
+        ),
+    ]
+    sampling_ratio: Annotated[
+        float,
+        Field(description="Ratio of traces to keep via head sampling", ge=0.0, le=1.0, default=1.0),
+    ]
+    batch_schedule_delay_millis: Annotated[
+        int,
+        Field(description="Delay in milliseconds between two exports of batched spans", gt=0, default=500),
+    ]
+    batch_max_queue_size: Annotated[
+        int,
+        Field(description="Maximum number of spans buffered before spans are dropped", gt=0, default=2048),
+    ]
+    batch_max_export_batch_size: Annotated[
+        int,
+        Field(description="Maximum number of spans exported in one batch", gt=0, default=512),
+    ]
+
 
+def _auto_tracing_filter(include: list[str], exclude: list[str]) -> Callable[["logfire.AutoTraceModule"], bool]:
+    """Create filter deciding which modules are auto-traced.
 
-def logfire_initialize(modules: list["str"]) -> bool:
+    Args:
+        include: Module prefixes to trace, including submodules.
+        exclude: Module prefixes not to trace, including submodules, taking precedence over include.
+
+    Returns:
+        Callable[[logfire.AutoTraceModule], bool]: The filter to be passed to install_auto_tracing.
+    """
+    include_prefixes = tuple(include)
+    exclude_prefixes = tuple(exclude)
+
+    def should_trace(module: "logfire.AutoTraceModule") -> bool:
+        if not include_prefixes or not module.parts_start_with(include_prefixes):
+            return False
+        return not (exclude_prefixes and module.parts_start_with(exclude_prefixes))
+
+    return should_trace
+
+
+def logfire_initialize(
+    modules: list["str"], check_imported_modules: Literal["error", "warn", "ignore"] = "error"
+) -> bool:
     """Initialize Logfire integration.
 
     Args:
         modules(list["str"]): List of modules to be instrumented.
+        check_imported_modules: How to handle modules to be auto-traced that were imported already,
+            and thus cannot be traced anymore.
 
     Returns:
         bool: True if initialized successfully False otherwise
@@ -46,6 +121,14 @@ def logfire_initialize(modules: list["str"]) -> bool:
     if settings.token is None:
         return False
 
+    import logfire  # noqa: PLC0415
+
+    # The batch span processor of OpenTelemetry is configured via the environment;
+    # explicitly set OTEL_BSP_* variables take precedence.
+    os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", str(settings.batch_schedule_delay_millis))
+    os.environ.setdefault("OTEL_BSP_MAX_QUEUE_SIZE", str(settings.batch_max_queue_size))
+    os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", str(settings.batch_max_export_batch_size))
+
     logfire.configure(
         send_to_logfire="if-token-present",
         token=settings.token.get_secret_value(),
@@ -57,6 +140,7 @@ def logfire_initialize(modules: list["str"]) -> bool:
             revision=__version__,
             root_path="",
         ),
+        sampling=logfire.SamplingOptions(head=settings.sampling_ratio),
     )
 
     if settings.instrument_system_metrics:
@@ -64,6 +148,13 @@ def logfire_initialize(modules: list["str"]) -> bool:
 
     logfire.instrument_pydantic()
 
-    logfire.install_auto_tracing(modules=modules, min_duration=0.0)
+    logfire.install_auto_tracing(
+        modules=_auto_tracing_filter(
+            include=settings.auto_tracing_modules if settings.auto_tracing_modules is not None else modules,
+            exclude=settings.auto_tracing_exclude_modules,
+        ),
+        min_duration=settings.auto_tracing_min_duration,
+        check_imported_modules=check_imported_modules,
+    )
 
     return True
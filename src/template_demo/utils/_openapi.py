@@ -0,0 +1,275 @@
+"""OpenAPI documents generated once and served pre-serialized.
+
+- FastAPI generates the OpenAPI schema of an app on first request and serializes it on every request.
+    CachedOpenAPI replaces the route serving the schema of an app with one serving bytes
+    serialized and compressed once, with an ETag, answering revalidations with 304 Not Modified.
+- Documents are generated eagerly in the background on startup, see warm_openapi.
+- Wheels ship a snapshot of the schemas generated at build time by hatch_build.py,
+    read instead of generating the schemas, and by the openapi command of the CLI without importing FastAPI.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import threading
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._log import get_logger
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI, Request, Response
+
+logger = get_logger(__name__)
+
+OPENAPI_SNAPSHOT_DIR = Path(__file__).parent.parent / "_openapi_snapshot"
+
+
+def serialize_openapi(schema: dict[str, Any]) -> bytes:
+    """Serialize an OpenAPI schema the same way FastAPI serializes JSON responses.
+
+    Args:
+        schema: The schema.
+
+    Returns:
+        bytes: The serialized schema.
+    """
+    return json.dumps(schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def load_openapi_snapshot(version: str) -> dict[str, Any] | None:
+    """Load the schema of an API version generated at build time.
+
+    Args:
+        version: The API version, e.g. v1.
+
+    Returns:
+        dict[str, Any] | None: The schema, or None if there is no snapshot, e.g. in editable installs.
+    """
+    try:
+        return dict(json.loads((OPENAPI_SNAPSHOT_DIR / f"{version}.json").read_bytes()))
+    except (OSError, ValueError):
+        return None
+
+
+def write_openapi_snapshot(directory: Path) -> None:
+    """Generate the schemas of all API versions into a directory, one file per version.
+
+    Called by hatch_build.py in a separate interpreter, as it imports the API.
+
+    Args:
+        directory: The target directory.
+    """
+    from ..api import create_version_app  # noqa: PLC0415, TID252
+    from ..constants import API_VERSIONS  # noqa: PLC0415, TID252
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for version in API_VERSIONS:
+        (directory / f"{version}.json").write_bytes(serialize_openapi(create_version_app(version).openapi()))
+
+
+@dataclass(frozen=True)
+class OpenAPIDocument:
+    """OpenAPI document serialized once, with compressed variants."""
+
+    digest: str
+    variants: dict[str, bytes]  # Body by content encoding, identity for the uncompressed body
+
+    @classmethod
+    def from_schema(cls, schema: dict[str, Any]) -> "OpenAPIDocument":
+        """Serialize and compress a schema with all encodings enabled by the compression settings.
+
+        Args:
+            schema: The schema.
+
+        Returns:
+            OpenAPIDocument: The document.
+        """
+        from ._compression import CompressionSettings, available_encodings  # noqa: PLC0415
+        from ._settings import load_settings  # noqa: PLC0415
+
+        body = serialize_openapi(schema)
+        variants = {"identity": body}
+        settings = load_settings(CompressionSettings)
+        if settings.enabled:
+            for encoding, encoder_factory in available_encodings(settings).items():
+                encoder = encoder_factory()
+                variants[encoding] = encoder.compress(body) + encoder.flush()
+        return cls(digest=hashlib.blake2b(body, digest_size=16).hexdigest(), variants=variants)
+
+    def response(self, request: "Request") -> "Response":
+        """Respond with the variant accepted by the client, or 304 Not Modified if the client has it already.
+
+        Args:
+            request: The request.
+
+        Returns:
+            Response: The response.
+        """
+        from fastapi import Response  # noqa: PLC0415
+
+        from ._compression import negotiate_encoding  # noqa: PLC0415
+
+        encodings = [encoding for encoding in self.variants if encoding != "identity"]
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), encodings) or "identity"
+        etag = f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(self.variants[encoding], media_type="application/json", headers=headers)
+
+
+class CachedOpenAPI:
+    """Serves the OpenAPI schema of an app pre-serialized, replacing the route added by FastAPI."""
+
+    def __init__(self, app: "FastAPI", version: str) -> None:
+        """Replace the route serving the schema of the app.
+
+        Args:
+            app: The app, with openapi_url set.
+            version: The API version of the app, e.g. v1, naming its snapshot.
+        """
+        from starlette.routing import Route  # noqa: PLC0415
+
+        self.app = app
+        self.version = version
+        self._documents: dict[str, OpenAPIDocument] = {}  # By root path, as it is added to the servers
+        self._lock = threading.Lock()
+        app.router.routes = [
+            route for route in app.router.routes if not (isinstance(route, Route) and route.path == app.openapi_url)
+        ]
+        app.add_route(str(app.openapi_url), self.endpoint, include_in_schema=False)
+
+    def schema(self) -> dict[str, Any]:
+        """Get the schema of the app, from the snapshot if available.
+
+        Returns:
+            dict[str, Any]: The schema.
+        """
+        snapshot = load_openapi_snapshot(self.version)
+        return snapshot if snapshot is not None else self.app.openapi()
+
+    def document(self, root_path: str) -> OpenAPIDocument:
+        """Get the document served under a root path, generating it on first use.
+
+        Args:
+            root_path: The root path, added to the servers of the schema like FastAPI does.
+
+        Returns:
+            OpenAPIDocument: The document.
+        """
+        with self._lock:
+            document = self._documents.get(root_path)
+            if document is None:
+                schema = self.schema()
+                if root_path and self.app.root_path_in_servers:
+                    servers = schema.get("servers", [])
+                    if root_path not in {server.get("url") for server in servers}:
+                        schema = {**schema, "servers": [{"url": root_path}, *servers]}
+                document = self._documents[root_path] = OpenAPIDocument.from_schema(schema)
+        return document
+
+    async def endpoint(self, request: "Request") -> "Response":
+        """Serve the document.
+
+        Args:
+            request: The request.
+
+        Returns:
+            Response: The response.
+        """
+        return await self._serve(request, "")
+
+    async def _serve(self, request: "Request", prefix: str) -> "Response":
+        root_path = request.scope.get("root_path", "").rstrip("/") + prefix
+        document = self._documents.get(root_path)
+        if document is None:
+            document = await asyncio.to_thread(self.document, root_path)
+        return document.response(request)
+
+    def add_routes(self, app: "FastAPI", prefix: str) -> None:
+        """Serve the document and the docs of the app from another app, under a path prefix.
+
+        Used by apps routing all API versions themselves instead of mounting an app per version,
+        the routes being the same as those FastAPI adds to the app, e.g. /v1/openapi.json and /v1/docs.
+
+        Args:
+            app: The app serving the routes.
+            prefix: The path prefix, e.g. /v1, appended to the root path in the servers of the schema.
+        """
+        from fastapi.openapi.docs import (  # noqa: PLC0415
+            get_redoc_html,
+            get_swagger_ui_html,
+            get_swagger_ui_oauth2_redirect_html,
+        )
+        from fastapi.responses import HTMLResponse  # noqa: PLC0415
+
+        source = self.app
+        openapi_url = prefix + str(source.openapi_url)
+
+        async def openapi(request: "Request") -> "Response":
+            return await self._serve(request, prefix)
+
+        app.add_route(openapi_url, openapi, include_in_schema=False)
+        if source.docs_url:
+            oauth2_redirect_url = (
+                prefix + source.swagger_ui_oauth2_redirect_url if source.swagger_ui_oauth2_redirect_url else None
+            )
+
+            async def swagger_ui_html(request: "Request") -> HTMLResponse:  # noqa: RUF029
+                root_path = request.scope.get("root_path", "").rstrip("/")
+                return get_swagger_ui_html(
+                    openapi_url=root_path + openapi_url,
+                    title=f"{source.title} - Swagger UI",
+                    oauth2_redirect_url=root_path + oauth2_redirect_url if oauth2_redirect_url else None,
+                    init_oauth=source.swagger_ui_init_oauth,
+                    swagger_ui_parameters=source.swagger_ui_parameters,
+                )
+
+            async def swagger_ui_redirect(_request: "Request") -> HTMLResponse:  # noqa: RUF029
+                return get_swagger_ui_oauth2_redirect_html()
+
+            app.add_route(prefix + source.docs_url, swagger_ui_html, include_in_schema=False)
+            if oauth2_redirect_url:
+                app.add_route(oauth2_redirect_url, swagger_ui_redirect, include_in_schema=False)
+        if source.redoc_url:
+
+            async def redoc_html(request: "Request") -> HTMLResponse:  # noqa: RUF029
+                root_path = request.scope.get("root_path", "").rstrip("/")
+                return get_redoc_html(openapi_url=root_path + openapi_url, title=f"{source.title} - ReDoc")
+
+            app.add_route(prefix + source.redoc_url, redoc_html, include_in_schema=False)
+
+
+@contextlib.asynccontextmanager
+async def warm_openapi(documents: Iterable[tuple[CachedOpenAPI, str]]) -> AsyncGenerator[None]:
+    """Generate OpenAPI documents in the background while the app serves requests.
+
+    Args:
+        documents: Cached OpenAPI of an app, and the root path it is served under.
+
+    Yields:
+        None: Once the background task is started.
+    """
+    documents = list(documents)
+
+    def warm() -> None:
+        for cached, root_path in documents:
+            try:
+                cached.document(root_path)
+            except Exception:
+                logger.exception("Failed to generate OpenAPI schema of API %s", cached.version)
+
+    task = asyncio.create_task(asyncio.to_thread(warm))
+    try:
+        yield
+    finally:
+        # Cancelling stops waiting for the thread, which finishes the document in progress on its own
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,365 @@
+"""Per-client rate limiting of HTTP requests via token buckets.
+
+- RateLimitMiddleware is a pure ASGI middleware granting each client a budget of requests per route.
+    Clients are identified by IP address, as presented tokens are not validated before the budget is checked.
+- A budget refills at a steady rate up to its burst, requests beyond it are rejected with
+    429 Too Many Requests and a Retry-After header telling when the next request is admitted.
+- Routes are identified by path prefix below the root path and API version, e.g. /system/info.
+- Buckets are kept in memory by default, i.e. per worker process. The sqlite backend keeps them in a database
+    file shared by all workers on the host, so limits hold with multiple uvicorn workers.
+- Rejections are counted via the OpenTelemetry API,
+    which forwards to the meter provider set up by logfire if configured.
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Annotated, ClassVar, Literal, Protocol
+
+from opentelemetry import metrics
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._admission import _by_specificity, _match_route, _route_path
+from ._constants import __env_file__, __project_name__
+from ._settings import load_settings
+from ._timing import ASGIApp, Receive, Scope, Send
+
+DEFAULT_BUDGET_KEY = "default"
+_PRUNE_INTERVAL = 1000  # Acquisitions between removals of full buckets from the sqlite backend
+
+_rejections = metrics.get_meter(__name__).create_counter(
+    "http_requests_rate_limited",
+    description="Requests rejected by rate limiting, by route",
+)
+
+
+class RateLimitBudget(BaseModel):
+    """Budget of requests of a client to a route."""
+
+    requests_per_minute: float = Field(description="Rate at which the budget refills", gt=0.0)
+    burst: int = Field(description="Number of requests a client may send at once after being idle", ge=1)
+
+
+class RateLimitSettings(BaseSettings):
+    """Settings for rate limiting of HTTP requests."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_RATE_LIMIT_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(description="Enable rate limiting of HTTP requests", default=True),
+    ]
+    budgets: Annotated[
+        dict[str, RateLimitBudget],
+        Field(
+            description=(
+                "Budget of each client by path prefix below the API version, the longest matching prefix wins. "
+                "Given as JSON via environment."
+            ),
+            examples=[{"/system/info": {"requests_per_minute": 6, "burst": 5}}],
+            default={
+                "/system/info": RateLimitBudget(requests_per_minute=6, burst=5),
+                "/system/info/jobs": RateLimitBudget(requests_per_minute=120, burst=20),
+            },
+        ),
+    ]
+    default_budget: Annotated[
+        RateLimitBudget | None,
+        Field(
+            description="Budget of each client for routes without a specific budget, None for unlimited", default=None
+        ),
+    ]
+    backend: Annotated[
+        Literal["memory", "sqlite"],
+        Field(
+            description=(
+                "Where buckets are kept: memory of the worker process, "
+                "or a sqlite database shared by all workers on the host"
+            ),
+            default="memory",
+        ),
+    ]
+    sqlite_path: Annotated[
+        Path,
+        Field(
+            description="Database file of the sqlite backend",
+            default=Path(tempfile.gettempdir()) / f"{__project_name__}_rate_limit.sqlite3",
+        ),
+    ]
+    max_clients: Annotated[
+        int,
+        Field(
+            description="Maximum number of buckets kept by the memory backend, least recently used are forgotten",
+            ge=1,
+            default=100_000,
+        ),
+    ]
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, burst: float) -> float:
+    return min(burst, tokens + max(0.0, now - updated) * rate)
+
+
+def _take(tokens: float, rate: float) -> tuple[float, float]:
+    """Take a token from a bucket.
+
+    Args:
+        tokens: Tokens in the bucket.
+        rate: Tokens added per second.
+
+    Returns:
+        tuple[float, float]: Tokens left, and seconds until a token is available if none was taken, else 0.
+    """
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (1.0 - tokens) / rate
+
+
+class RateLimitBackend(Protocol):
+    """Storage of token buckets."""
+
+    blocking: ClassVar[bool]  # Whether acquire blocks, so it must be called off the event loop
+
+    def acquire(self, key: str, rate: float, burst: float, now: float) -> float:
+        """Take a token from the bucket of a key, creating a full bucket if there is none.
+
+        Args:
+            key: The key of the bucket.
+            rate: Tokens added to the bucket per second.
+            burst: Capacity of the bucket.
+            now: Current time in seconds since the epoch.
+
+        Returns:
+            float: 0 if a token was taken, else seconds until a token is available.
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Token buckets kept in memory of the current process, least recently used forgotten first."""
+
+    blocking: ClassVar[bool] = False
+
+    def __init__(self, max_keys: int) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_keys: Maximum number of buckets to keep.
+        """
+        self._max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()  # Tokens and time of update by key
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, rate: float, burst: float, now: float) -> float:
+        """Take a token from the bucket of a key, creating a full bucket if there is none.
+
+        Args:
+            key: The key of the bucket.
+            rate: Tokens added to the bucket per second.
+            burst: Capacity of the bucket.
+            now: Current time in seconds since the epoch.
+
+        Returns:
+            float: 0 if a token was taken, else seconds until a token is available.
+        """
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens, wait = _take(_refill(tokens, updated, now, rate, burst), rate)
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class SQLiteRateLimitBackend:
+    """Token buckets kept in a sqlite database, shared by all processes using the same file."""
+
+    blocking: ClassVar[bool] = True
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the backend, creating the database if it does not exist.
+
+        Args:
+            path: The database file.
+        """
+        self._path = path
+        self._local = threading.local()  # Connection per thread, as connections must not be shared
+        self._acquisitions = 0
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, full_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def acquire(self, key: str, rate: float, burst: float, now: float) -> float:
+        """Take a token from the bucket of a key, creating a full bucket if there is none.
+
+        Args:
+            key: The key of the bucket.
+            rate: Tokens added to the bucket per second.
+            burst: Capacity of the bucket.
+            now: Current time in seconds since the epoch.
+
+        Returns:
+            float: 0 if a token was taken, else seconds until a token is available.
+        """
+        connection = self._connection()
+        # Take the write lock right away, so concurrent workers cannot both take the last token
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            wait = self._acquire_in_transaction(connection, key, rate, burst, now)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return wait
+
+    def _acquire_in_transaction(
+        self, connection: sqlite3.Connection, key: str, rate: float, burst: float, now: float
+    ) -> float:
+        row = connection.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+        tokens, updated = row or (burst, now)
+        tokens, wait = _take(_refill(tokens, updated, now, rate, burst), rate)
+        connection.execute(
+            "INSERT OR REPLACE INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?)",
+            (key, tokens, now, now + (burst - tokens) / rate),
+        )
+        self._acquisitions += 1
+        if self._acquisitions % _PRUNE_INTERVAL == 0:
+            # Full buckets are equivalent to no bucket
+            connection.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+        return wait
+
+
+def _client_key(scope: Scope) -> str:
+    """Identify the client of a request by IP address.
+
+    Presented tokens are deliberately not part of the key: they are not validated yet,
+    so clients varying them per request would get a fresh budget each time.
+
+    Args:
+        scope: The ASGI connection scope.
+
+    Returns:
+        str: The key of the client.
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware rate limiting HTTP requests per client and route via token buckets."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: RateLimitSettings | None = None,
+        prefixes: Iterable[str] = (),
+        backend: RateLimitBackend | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            settings: Rate limit settings, loaded from the environment if not given.
+            prefixes: First path segments stripped before matching budgets, e.g. the API versions.
+            backend: Storage of the token buckets, created as configured by the settings if not given.
+        """
+        self.app = app
+        self.settings = settings or load_settings(RateLimitSettings)
+        self.prefixes = frozenset(prefixes)
+        self._routes = _by_specificity(self.settings.budgets)
+        self._backend = backend
+        self.rejected: dict[str, int] = {}  # By route
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        """Storage of the token buckets, created on first use.
+
+        Returns:
+            RateLimitBackend: The backend.
+        """
+        if self._backend is None:
+            if self.settings.backend == "sqlite":
+                self._backend = SQLiteRateLimitBackend(self.settings.sqlite_path)
+            else:
+                self._backend = MemoryRateLimitBackend(self.settings.max_clients)
+        return self._backend
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+        route = _match_route(_route_path(scope, self.prefixes), self._routes)
+        budget = self.settings.budgets[route] if route is not None else self.settings.default_budget
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        route = route or DEFAULT_BUDGET_KEY
+        key = f"{route}|{_client_key(scope)}"
+        rate, burst = budget.requests_per_minute / 60, float(budget.burst)
+        backend = self.backend
+        if backend.blocking:
+            wait = await asyncio.to_thread(backend.acquire, key, rate, burst, time.time())
+        else:
+            wait = backend.acquire(key, rate, burst, time.time())
+        if wait > 0:
+            self.rejected[route] = self.rejected.get(route, 0) + 1
+            _rejections.add(1, {"route": route})
+            await self._reject(send, wait)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send: Send, wait: float) -> None:
+        """Respond with 429 Too Many Requests, telling the client when to retry.
+
+        Args:
+            send: The ASGI send channel.
+            wait: Seconds until the next request of the client is admitted.
+        """
+        body = json.dumps({"detail": "Rate limit exceeded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(math.ceil(wait)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body, "more_body": False})
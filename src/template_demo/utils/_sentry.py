@@ -1,23 +1,39 @@
 """Sentry integration for application monitoring."""
 
 import re
+import threading
+import time
 import urllib.parse
-from typing import Annotated
+from datetime import datetime
+from typing import TYPE_CHECKING, Annotated, Any
 
-import sentry_sdk
 from pydantic import AfterValidator, BeforeValidator, Field, PlainSerializer, SecretStr
 from pydantic_settings import SettingsConfigDict
-from sentry_sdk.integrations.typer import TyperIntegration
 
 from ._constants import __env__, __env_file__, __project_name__, __version__
 from ._settings import OpaqueSettings, load_settings, strip_to_none_before_validator
 
+if TYPE_CHECKING:
+    from sentry_sdk.types import Event, Hint, SamplingContext
+
 _ERR_MSG_MISSING_SCHEME = "Sentry DSN is missing URL scheme (protocol)"
 _ERR_MSG_MISSING_NETLOC = "Sentry DSN is missing network location (domain)"
 _ERR_MSG_NON_HTTPS = "Sentry DSN must use HTTPS protocol for security"
 _ERR_MSG_INVALID_DOMAIN = "Sentry DSN must use a valid Sentry domain (ingest.us.sentry.io or ingest.de.sentry.io)"
 _ERR_MSG_INVALID_FORMAT = "Invalid Sentry DSN format"
 _VALID_SENTRY_DOMAIN_PATTERN = r"^[a-f0-9]+@o\d+\.ingest\.(us|de)\.sentry\.io$"
+_HEALTH_ROUTE_PATTERN = re.compile(r"/healthz?/?$")
+_SERVER_ERROR_STATUSES = {
+    "aborted",
+    "data_loss",
+    "deadline_exceeded",
+    "internal_error",
+    "unavailable",
+    "unimplemented",
+    "unknown",
+    "unknown_error",
+}
+_ADAPTIVE_WINDOW_SECONDS = 60.0
 
 
 def _validate_url_scheme(parsed_url: urllib.parse.ParseResult) -> None:
@@ -162,20 +178,260 @@ class SentrySettings(OpaqueSettings):
         float,
         Field(
             ge=0.0,
-            description="Traces Sample Rate (https://docs.sentry.io/platforms/python/configuration/sampling/#configuring-the-transaction-sample-rate)",
-            default=1.0,
+            le=1.0,
+            description="Traces Sample Rate for routes without specific rate (https://docs.sentry.io/platforms/python/configuration/sampling/#configuring-the-transaction-sample-rate)",
+            default=0.1,
+        ),
+    ]
+    traces_sample_rates_by_route: Annotated[
+        dict[str, float],
+        Field(
+            description="Traces Sample Rate by route prefix, the longest matching prefix wins",
+            examples=[{"/api/v1/hello": 0.5, "/api/v2/hello": 1.0}],
+            default={},
+        ),
+    ]
+    traces_sample_rate_health: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=1.0,
+            description="Traces Sample Rate of health probes, i.e. routes ending with /health or /healthz",
+            default=0.001,
+        ),
+    ]
+    traces_keep_errors: Annotated[
+        bool,
+        Field(
+            description="Always keep transactions failing with a server error, regardless of the sample rate. "
+            "Records all transactions but health probes, deciding which to send once they finished.",
+            default=False,
+        ),
+    ]
+    traces_slow_threshold: Annotated[
+        float | None,
+        Field(
+            gt=0.0,
+            description="Always keep transactions taking longer than this many seconds. "
+            "Records all transactions but health probes, deciding which to send once they finished. "
+            "Leave empty to disable.",
+            default=None,
+        ),
+    ]
+    traces_target_per_minute: Annotated[
+        int | None,
+        Field(
+            gt=0,
+            description="Budget of sampled transactions per minute; sample rates are lowered adaptively "
+            "when traffic exceeds the budget. Leave empty to disable.",
+            default=None,
         ),
     ]
     profiles_sample_rate: Annotated[
         float,
         Field(
             ge=0.0,
-            description="Traces Sample Rate (https://docs.sentry.io/platforms/python/tracing/#configure)",
-            default=1.0,
+            le=1.0,
+            description="Profiles Sample Rate relative to sampled transactions (https://docs.sentry.io/platforms/python/tracing/#configure)",
+            default=0.1,
         ),
     ]
 
 
+class TransactionSampler:
+    """Sampling of Sentry transactions by route, outcome and traffic.
+
+    - Head sampling via traces_sampler applies per-route rates, with health probes down-sampled to near zero.
+    - If errors or slow transactions are to be kept, which is opt-in, all transactions but health probes
+        are recorded, and before_send_transaction decides at the end: errors and slow transactions are always kept,
+        others with the rate of their route.
+    - The decision for a transaction is derived from its trace id, so profiles are only recorded for
+        transactions that will be kept.
+    - Given a budget of transactions per minute, rates are lowered to match the traffic of the last minute.
+    """
+
+    def __init__(self, settings: SentrySettings) -> None:
+        """Initialize the sampler.
+
+        Args:
+            settings: The Sentry settings.
+        """
+        self._settings = settings
+        self._routes = sorted(
+            settings.traces_sample_rates_by_route.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._tail_sampling = settings.traces_keep_errors or settings.traces_slow_threshold is not None
+        self._lock = threading.Lock()
+        self._window_started_at = time.monotonic()
+        self._window_count = 0.0  # Transactions sampled at the configured rates in the current window
+        self._adaptive_factor = 1.0
+
+    @staticmethod
+    def _route(name_or_url: str | None) -> str:
+        """Get the route of a transaction, i.e. the path of its name or URL without scheme, host and query.
+
+        The ASGI integration names a transaction by its full URL when it starts,
+        and by its route template relative to the mounted API version once it finished.
+
+        Args:
+            name_or_url: The name of the transaction, or the URL of its request.
+
+        Returns:
+            str: The route, e.g. /api/v1/hello/world.
+        """
+        return urllib.parse.urlsplit(name_or_url or "").path
+
+    @staticmethod
+    def _sample_rand(trace_id: str | None) -> float:
+        """Map a trace id to a number in [0, 1), so all decisions about one trace agree.
+
+        Args:
+            trace_id: The trace id, 32 hex digits.
+
+        Returns:
+            float: The pseudo-random number derived from the trace id, 0 if no valid trace id is given.
+        """
+        try:
+            return int((trace_id or "")[-8:], 16) / 0x100000000
+        except ValueError:
+            return 0.0
+
+    @staticmethod
+    def _is_health_probe(route: str) -> bool:
+        return _HEALTH_ROUTE_PATTERN.search(route) is not None
+
+    def _configured_rate(self, route: str) -> float:
+        """Get the configured sample rate of a route other than a health probe.
+
+        Args:
+            route: The route, i.e. name of the transaction.
+
+        Returns:
+            float: The sample rate, not lowered by the adaptive factor.
+        """
+        return next(
+            (rate for prefix, rate in self._routes if route.startswith(prefix)),
+            self._settings.traces_sample_rate,
+        )
+
+    def route_rate(self, route: str) -> float:
+        """Get the sample rate of a route, lowered by the adaptive factor if a budget is configured.
+
+        Args:
+            route: The route, i.e. name of the transaction.
+
+        Returns:
+            float: The sample rate.
+        """
+        if self._is_health_probe(route):
+            return self._settings.traces_sample_rate_health
+        return self._configured_rate(route) * self._adaptive_factor
+
+    def _count(self, route: str) -> None:
+        """Count a transaction towards the budget, adjusting the adaptive factor once per window.
+
+        The budget is of sampled transactions, so each transaction counts with the configured rate of its route.
+
+        Args:
+            route: The route, i.e. name of the transaction.
+        """
+        target = self._settings.traces_target_per_minute
+        if target is None:
+            return
+        with self._lock:
+            self._window_count += self._configured_rate(route)
+            elapsed = time.monotonic() - self._window_started_at
+            if elapsed < _ADAPTIVE_WINDOW_SECONDS:
+                return
+            sampled_per_minute = self._window_count * _ADAPTIVE_WINDOW_SECONDS / elapsed
+            self._adaptive_factor = min(1.0, target / sampled_per_minute) if sampled_per_minute else 1.0
+            self._window_started_at += elapsed
+            self._window_count = 0.0
+
+    def traces_sampler(self, sampling_context: "SamplingContext") -> float:
+        """Decide at the start of a transaction whether to record it.
+
+        Args:
+            sampling_context: The sampling context provided by Sentry.
+
+        Returns:
+            float: The probability to record the transaction.
+        """
+        if sampling_context.get("parent_sampled") is not None:
+            return float(sampling_context["parent_sampled"])
+        transaction_context = sampling_context.get("transaction_context", {})
+        route = self._route(transaction_context.get("name"))
+        if self._is_health_probe(route):
+            return self._settings.traces_sample_rate_health
+        self._count(route)
+        if self._tail_sampling:
+            return 1.0
+        return self.route_rate(route)
+
+    def profiles_sampler(self, sampling_context: "SamplingContext") -> float:
+        """Decide at the start of a recorded transaction whether to profile it.
+
+        Args:
+            sampling_context: The sampling context provided by Sentry.
+
+        Returns:
+            float: The probability to profile the transaction.
+        """
+        transaction_context = sampling_context.get("transaction_context", {})
+        route = self._route(transaction_context.get("name"))
+        if self._is_health_probe(route):
+            return 0.0
+        if self._tail_sampling and self._sample_rand(transaction_context.get("trace_id")) >= self.route_rate(route):
+            return 0.0
+        return self._settings.profiles_sample_rate
+
+    def before_send_transaction(self, event: "Event", hint: "Hint") -> "Event | None":  # noqa: ARG002
+        """Decide at the end of a recorded transaction whether to send it.
+
+        Args:
+            event: The transaction event.
+            hint: Additional information provided by Sentry.
+
+        Returns:
+            Event | None: The event if to be sent, None to drop it.
+        """
+        if not self._tail_sampling:
+            return event
+        request: dict[str, Any] = event.get("request", {})
+        route = self._route(request.get("url") or event.get("transaction"))
+        if self._is_health_probe(route):
+            return event  # already head sampled
+        if self._settings.traces_keep_errors and self._is_error(event):
+            return event
+        if self._settings.traces_slow_threshold is not None and (
+            self._duration(event) >= self._settings.traces_slow_threshold
+        ):
+            return event
+        contexts: dict[str, Any] = event.get("contexts", {})
+        if self._sample_rand(contexts.get("trace", {}).get("trace_id")) < self.route_rate(route):
+            return event
+        return None
+
+    @staticmethod
+    def _is_error(event: "Event") -> bool:
+        contexts: dict[str, Any] = event.get("contexts", {})
+        status_code = contexts.get("response", {}).get("status_code")
+        if isinstance(status_code, int) and status_code >= 500:  # noqa: PLR2004
+            return True
+        return contexts.get("trace", {}).get("status") in _SERVER_ERROR_STATUSES
+
+    @staticmethod
+    def _duration(event: "Event") -> float:
+        # Timestamps are serialized to ISO 8601 strings before the event is passed to before_send_transaction
+        timestamps: list[Any] = [event.get("start_timestamp"), event.get("timestamp")]
+        if None in timestamps:
+            return 0.0
+        start, end = (
+            datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp for timestamp in timestamps
+        )
+        return float((end - start).total_seconds())
+
+
 def sentry_initialize() -> bool:
     """Initialize Sentry integration.
 
@@ -187,6 +443,10 @@ def sentry_initialize() -> bool:
     if settings.dsn is None:
         return False
 
+    import sentry_sdk  # noqa: PLC0415
+    from sentry_sdk.integrations.typer import TyperIntegration  # noqa: PLC0415
+
+    sampler = TransactionSampler(settings)
     sentry_sdk.init(
         release=f"{__project_name__}@{__version__}",  # https://docs.sentry.io/platforms/python/configuration/releases/,
         environment=__env__,
@@ -195,8 +455,9 @@ def sentry_initialize() -> bool:
         debug=settings.debug,
         send_default_pii=settings.send_default_pii,
         sample_rate=settings.sample_rate,
-        traces_sample_rate=settings.traces_sample_rate,
-        profiles_sample_rate=settings.profiles_sample_rate,
+        traces_sampler=sampler.traces_sampler,
+        profiles_sampler=sampler.profiles_sampler,
+        before_send_transaction=sampler.before_send_transaction,
         integrations=[TyperIntegration()],
     )
 
@@ -8,10 +8,6 @@ from typing import TypeVar
 
 from pydantic import FieldSerializationInfo, SecretStr, ValidationError
 from pydantic_settings import BaseSettings
-from rich.panel import Panel
-from rich.text import Text
-
-from ._console import console
 
 T = TypeVar("T", bound=BaseSettings)
 
@@ -55,6 +51,11 @@ def load_settings(settings_class: type[T]) -> T:
     try:
         return settings_class()
     except ValidationError as e:
+        from rich.panel import Panel  # noqa: PLC0415
+        from rich.text import Text  # noqa: PLC0415
+
+        from ._console import console  # noqa: PLC0415
+
         errors = json.loads(e.json())
         text = Text()
         text.append(
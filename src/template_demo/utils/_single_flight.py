@@ -0,0 +1,122 @@
+"""Single-flight coalescing of concurrent calls, e.g. to expensive service methods.
+
+- Concurrent calls with the same key share one in-flight call and its result or exception,
+    instead of each computing its own. Calls after it finished compute afresh, nothing is cached.
+- Sync functions coalesce calls across threads, async functions coalesce calls within an event loop.
+- The key defaults to the arguments bound to the parameters. For methods, i.e. functions whose first parameter
+    is self, the instance is not part of the key, so calls via different instances, e.g. one per request, share a call.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, ParamSpec, TypeVar, cast
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class _Call:
+    """A sync call in flight, awaited by callers joining it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: BaseException | None = None
+
+
+def _default_key(fn: Callable[..., Any]) -> Callable[..., Hashable]:
+    """Create a function deriving the key of a call from its arguments, bound to the parameters of a function.
+
+    Args:
+        fn: The function to derive keys for.
+
+    Returns:
+        Callable[..., Hashable]: The function, omitting the instance for methods, so calls passing arguments
+            positionally, by keyword or not at all, i.e. defaulting, share a key.
+    """
+    signature = inspect.signature(fn)
+    omitted = {"self"} if list(signature.parameters)[:1] == ["self"] else set()
+    var_keyword = next((p.name for p in signature.parameters.values() if p.kind is p.VAR_KEYWORD), None)
+
+    def key(*args: Any, **kwargs: Any) -> Hashable:  # noqa: ANN401
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(
+            (name, tuple(sorted(value.items())) if name == var_keyword else value)
+            for name, value in bound.arguments.items()
+            if name not in omitted
+        )
+
+    return key
+
+
+def single_flight(
+    key: Callable[..., Hashable] | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a sync or async function, so concurrent calls with the same key share one call.
+
+    Args:
+        key: Function deriving the key of a call from its arguments, defaults to the arguments
+            omitting the instance for methods. Arguments must be hashable unless a key function is given.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator.
+    """
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        derive_key = key or _default_key(fn)
+        if inspect.iscoroutinefunction(fn):
+            return cast("Callable[P, R]", _single_flight_async(fn, derive_key))
+        return _single_flight_sync(fn, derive_key)
+
+    return decorator
+
+
+def _single_flight_sync(fn: Callable[P, R], derive_key: Callable[..., Hashable]) -> Callable[P, R]:
+    calls: dict[Hashable, _Call] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        call_key = derive_key(*args, **kwargs)
+        with lock:
+            call = calls.get(call_key)
+            leader = call is None
+            if call is None:
+                call = calls[call_key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return cast("R", call.result)
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with lock:
+                del calls[call_key]
+            call.done.set()
+        return cast("R", call.result)
+
+    return wrapper
+
+
+def _single_flight_async(fn: Callable[P, Any], derive_key: Callable[..., Hashable]) -> Callable[P, Any]:
+    calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Any]] = {}
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # noqa: ANN401
+        call_key = (asyncio.get_running_loop(), derive_key(*args, **kwargs))
+        task = calls.get(call_key)
+        if task is None:
+            task = calls[call_key] = asyncio.ensure_future(fn(*args, **kwargs))
+            task.add_done_callback(lambda _: calls.pop(call_key, None))
+        # Shielded, so a caller cancelled, e.g. as its client disconnected, does not cancel the call of others
+        return await asyncio.shield(task)
+
+    return wrapper
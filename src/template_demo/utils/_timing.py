@@ -0,0 +1,394 @@
+"""Request-scoped trace context and per-request timing.
+
+- TimingMiddleware is a pure ASGI middleware that creates a RequestTiming per HTTP request,
+    binds it to a context variable and exposes the measured phases via a Server-Timing header.
+- Phases are routing, dependencies (incl. request parsing and validation), handler and serialization.
+- Finished requests are exported as TimingSpan to registered span exporters,
+    e.g. InMemorySpanExporter in tests. No network access is required.
+"""
+
+import functools
+import inspect
+import logging
+import re
+import secrets
+import threading
+import time
+import typing as t
+import uuid
+from collections.abc import Awaitable, Callable, MutableMapping
+from contextvars import ContextVar
+from typing import Annotated, Protocol
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._settings import load_settings
+
+logger = logging.getLogger(__name__)
+
+Scope = MutableMapping[str, t.Any]
+Message = MutableMapping[str, t.Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+PHASES = ("routing", "dependencies", "handler", "serialization")
+
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+_TIMED_ATTRIBUTE = "__request_timed__"
+
+
+class TimingSettings(BaseSettings):
+    """Settings for request timing."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_TIMING_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    enabled: Annotated[
+        bool,
+        Field(description="Enable request timing and trace context", default=True),
+    ]
+    server_timing_header: Annotated[
+        bool,
+        Field(description="Expose per-phase timings via the Server-Timing response header", default=True),
+    ]
+
+
+class TimingSpan(BaseModel):
+    """A finished request with its trace context and per-phase timings."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    request_id: str
+    status_code: int | None = None
+    start_time: float = Field(description="Start of the request as seconds since the epoch")
+    duration: float = Field(description="Duration of the request in seconds")
+    phases: dict[str, float] = Field(description="Duration of each phase in seconds")
+
+
+class SpanExporter(Protocol):
+    """Receiver of finished request spans."""
+
+    def export(self, span: TimingSpan) -> None:
+        """Export a finished span."""
+        ...
+
+
+class InMemorySpanExporter:
+    """Span exporter keeping finished spans in memory, e.g. for tests."""
+
+    def __init__(self) -> None:
+        """Initialize the exporter."""
+        self._spans: list[TimingSpan] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: TimingSpan) -> None:
+        """Keep the finished span.
+
+        Args:
+            span: The finished span.
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> list[TimingSpan]:
+        """Get the spans exported so far.
+
+        Returns:
+            list[TimingSpan]: Copy of the exported spans in order of completion.
+        """
+        with self._lock:
+            return self._spans.copy()
+
+    def clear(self) -> None:
+        """Forget all exported spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+_span_exporters: list[SpanExporter] = []
+
+
+def add_span_exporter(exporter: SpanExporter) -> None:
+    """Register a span exporter receiving all finished requests.
+
+    Args:
+        exporter: The exporter to register.
+    """
+    _span_exporters.append(exporter)
+
+
+def remove_span_exporter(exporter: SpanExporter) -> None:
+    """Unregister a previously registered span exporter.
+
+    Args:
+        exporter: The exporter to unregister.
+    """
+    if exporter in _span_exporters:
+        _span_exporters.remove(exporter)
+
+
+class RequestTiming:
+    """Trace context and timing marks of the current request."""
+
+    __slots__ = (
+        "finished_at",
+        "handler_finished_at",
+        "handler_started_at",
+        "parent_span_id",
+        "request_id",
+        "response_ready_at",
+        "route_matched_at",
+        "span_id",
+        "started_at",
+        "started_at_epoch",
+        "trace_id",
+    )
+
+    def __init__(self, trace_id: str, parent_span_id: str | None, request_id: str) -> None:
+        """Initialize the timing and start the clock.
+
+        Args:
+            trace_id: W3C trace id, 32 lowercase hex digits.
+            parent_span_id: Span id of the caller if propagated via traceparent.
+            request_id: Id of the request, echoed back via the X-Request-ID header.
+        """
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.request_id = request_id
+        self.started_at_epoch = time.time()
+        self.started_at = time.perf_counter()
+        self.route_matched_at: float | None = None
+        self.handler_started_at: float | None = None
+        self.handler_finished_at: float | None = None
+        self.response_ready_at: float | None = None
+        self.finished_at: float | None = None
+
+    @classmethod
+    def from_headers(cls, headers: t.Iterable[tuple[bytes, bytes]]) -> "RequestTiming":
+        """Create timing for a request, continuing the trace given by its traceparent header.
+
+        Args:
+            headers: Raw ASGI request headers.
+
+        Returns:
+            RequestTiming: The timing with a new or propagated trace context.
+        """
+        trace_id: str | None = None
+        parent_span_id: str | None = None
+        request_id: str | None = None
+        for key, value in headers:
+            if key == b"traceparent":
+                match = _TRACEPARENT_PATTERN.match(value.decode("latin-1").strip())
+                if match and match.group(1) != "0" * 32:
+                    trace_id, parent_span_id = match.group(1), match.group(2)
+            elif key == b"x-request-id":
+                candidate = value.decode("latin-1").strip()
+                if _REQUEST_ID_PATTERN.match(candidate):
+                    request_id = candidate
+        return cls(
+            trace_id=trace_id or secrets.token_hex(16),
+            parent_span_id=parent_span_id,
+            request_id=request_id or uuid.uuid4().hex,
+        )
+
+    def finish(self) -> None:
+        """Stop the clock unless already stopped."""
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        """Duration of the request in seconds, up to now if not yet finished."""
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def phases(self) -> dict[str, float]:
+        """Get duration of each phase reached by the request.
+
+        Returns:
+            dict[str, float]: Duration in seconds per phase, in order of occurrence.
+        """
+        marks = (
+            self.started_at,
+            self.route_matched_at,
+            self.handler_started_at,
+            self.handler_finished_at,
+            self.response_ready_at,
+        )
+        phases: dict[str, float] = {}
+        for name, begin, end in zip(PHASES, marks[:-1], marks[1:], strict=True):
+            if begin is None or end is None:
+                break
+            phases[name] = end - begin
+        return phases
+
+    def server_timing(self) -> str:
+        """Render the phases and total duration as a Server-Timing header value.
+
+        Returns:
+            str: The header value with durations in milliseconds.
+        """
+        metrics = [*self.phases().items(), ("total", self.duration)]
+        return ", ".join(f"{name};dur={duration * 1000:.3f}" for name, duration in metrics)
+
+
+_request_timing: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def get_request_timing() -> RequestTiming | None:
+    """Get trace context and timing of the request currently being handled.
+
+    Returns:
+        RequestTiming | None: The timing, or None if called outside of a timed request.
+    """
+    return _request_timing.get()
+
+
+def timed_endpoint(endpoint: Callable[..., t.Any]) -> Callable[..., t.Any]:
+    """Wrap an endpoint to mark start and end of the handler phase of the current request.
+
+    Generator endpoints and endpoints wrapped already are returned unchanged.
+
+    Args:
+        endpoint: The endpoint function.
+
+    Returns:
+        Callable[..., Any]: The wrapped endpoint, with signature and coroutine-ness preserved.
+    """
+    if (
+        getattr(endpoint, _TIMED_ATTRIBUTE, False)
+        or inspect.isgeneratorfunction(endpoint)
+        or inspect.isasyncgenfunction(endpoint)
+    ):
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:  # noqa: ANN401
+            timing = _request_timing.get()
+            if timing is None:
+                return await endpoint(*args, **kwargs)
+            timing.handler_started_at = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timing.handler_finished_at = time.perf_counter()
+
+        setattr(async_wrapper, _TIMED_ATTRIBUTE, True)
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:  # noqa: ANN401
+        # Sync endpoints run in a worker thread with a copy of the context, sharing the timing object
+        timing = _request_timing.get()
+        if timing is None:
+            return endpoint(*args, **kwargs)
+        timing.handler_started_at = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            timing.handler_finished_at = time.perf_counter()
+
+    setattr(sync_wrapper, _TIMED_ATTRIBUTE, True)
+    return sync_wrapper
+
+
+def _export(span: TimingSpan) -> None:
+    """Hand a finished span to all registered exporters.
+
+    Args:
+        span: The finished span.
+    """
+    for exporter in _span_exporters.copy():
+        try:
+            exporter.export(span)
+        except Exception:
+            logger.exception("Span exporter %r failed", exporter)
+
+
+class TimingMiddleware:
+    """ASGI middleware binding trace context and timing to each HTTP request."""
+
+    def __init__(self, app: ASGIApp, settings: TimingSettings | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI app to wrap.
+            settings: Timing settings, loaded from the environment if not given.
+        """
+        self.app = app
+        self.settings = settings or load_settings(TimingSettings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI request.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming.from_headers(scope.get("headers", []))
+        status_code: int | None = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                timing.finish()
+                headers = [*message.get("headers", []), (b"x-request-id", timing.request_id.encode("latin-1"))]
+                if self.settings.server_timing_header:
+                    headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = _request_timing.set(timing)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timing.reset(token)
+            timing.finish()
+            if _span_exporters:  # Skip building the span unless it is exported
+                _export(
+                    TimingSpan(
+                        name=f"{scope['method']} {_route_path(scope)}",
+                        trace_id=timing.trace_id,
+                        span_id=timing.span_id,
+                        parent_span_id=timing.parent_span_id,
+                        request_id=timing.request_id,
+                        status_code=status_code,
+                        start_time=timing.started_at_epoch,
+                        duration=timing.duration,
+                        phases=timing.phases(),
+                    )
+                )
+
+
+def _route_path(scope: Scope) -> str:
+    """Get the path template of the matched route, falling back to the raw path.
+
+    Args:
+        scope: The ASGI connection scope after handling the request.
+
+    Returns:
+        str: Path template such as /api/v1/hello/world, low-cardinality if a route matched.
+    """
+    path_format = getattr(scope.get("route"), "path_format", None)
+    if isinstance(path_format, str):
+        return f"{scope.get('root_path', '')}{path_format}"
+    return str(scope.get("path", ""))
@@ -0,0 +1,151 @@
+"""Warm process pool for CPU-bound work of the GUI.
+
+- Workers are spawned when the pool starts and import the configured modules upfront,
+    so the package is imported and booted once per worker instead of once per task.
+- Services are instantiated once per worker and reused across tasks, so their settings are loaded once.
+- Without a running pool, e.g. in tests, work runs on a thread of the calling process instead.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
+from typing import Annotated, Any
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._log import get_logger
+from ._service import BaseService
+from ._settings import load_settings
+
+logger = get_logger(__name__)
+
+
+class WorkerPoolSettings(BaseSettings):
+    """Settings for the worker pool."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_WORKER_POOL_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    size: Annotated[
+        int,
+        Field(description="Number of worker processes", ge=1, default=2),
+    ]
+    preload: Annotated[
+        list[str],
+        Field(
+            description="Modules imported by each worker on start",
+            examples=[[f"{__project_name__}.system"]],
+            default=[__project_name__],
+        ),
+    ]
+
+
+_pool: ProcessPoolExecutor | None = None
+_services: dict[type[BaseService], BaseService] = {}
+
+
+def _initialize_worker(modules: list[str]) -> None:
+    """Prepare a worker process, importing the given modules.
+
+    Args:
+        modules: Modules to import.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Shutdown is managed by the parent
+    for module in modules:
+        import_module(module)
+
+
+def _call_service(service_class: type[BaseService], method: str, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    """Call a method of the service instance of the current process, instantiating it on first use.
+
+    Args:
+        service_class: Class of the service.
+        method: Name of the method.
+        *args: Positional arguments of the method.
+        **kwargs: Keyword arguments of the method.
+
+    Returns:
+        Any: The return value of the method.
+    """
+    service = _services.get(service_class)
+    if service is None:
+        service = _services[service_class] = service_class()
+    return getattr(service, method)(*args, **kwargs)
+
+
+def start_worker_pool(settings: WorkerPoolSettings | None = None) -> ProcessPoolExecutor:
+    """Start the worker pool, spawning and initializing all workers in the background.
+
+    Args:
+        settings: Worker pool settings, loaded from the environment if not given.
+
+    Returns:
+        ProcessPoolExecutor: The pool, also used by run_service_in_worker from now on.
+    """
+    global _pool  # noqa: PLW0603
+    settings = settings or load_settings(WorkerPoolSettings)
+    stop_worker_pool()
+    _pool = ProcessPoolExecutor(
+        max_workers=settings.size,
+        # Spawned workers do not inherit threads or locks of the server process
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(settings.preload,),
+    )
+    # Workers are spawned on demand, one per submitted task, so warm up all of them now
+    warmups = [_pool.submit(os.getpid) for _ in range(settings.size)]
+    for warmup in warmups:
+        warmup.add_done_callback(_log_warmup_failure)
+    logger.debug("Started worker pool with %d workers", settings.size)
+    return _pool
+
+
+def _log_warmup_failure(future: Future[int]) -> None:
+    """Log a failed warmup of a worker.
+
+    Args:
+        future: Future of the warmup task.
+    """
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Failed to start worker", exc_info=future.exception())
+
+
+def stop_worker_pool() -> None:
+    """Stop the worker pool, cancelling pending tasks."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def run_service_in_worker(
+    service_class: type[BaseService],
+    method: str,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """Run a method of a service in the worker pool, or on a thread if the pool is not running.
+
+    Args:
+        service_class: Class of the service, instantiated once per worker.
+        method: Name of the method.
+        *args: Positional arguments of the method, must be picklable.
+        **kwargs: Keyword arguments of the method, must be picklable.
+
+    Returns:
+        Any: The return value of the method.
+    """
+    call = partial(_call_service, service_class, method, *args, **kwargs)
+    if _pool is None:
+        return await asyncio.to_thread(call)
+    return await asyncio.get_running_loop().run_in_executor(_pool, call)
@@ -1,12 +1,28 @@
-"""Boot sequence."""
+"""Boot sequence.
 
+- By default Sentry and Logfire are initialized before logging, blocking the boot until ready.
+- If background boot is enabled, both are initialized on a background thread instead. Log records
+    and uncaught exceptions are buffered meanwhile and replayed once the backends are ready,
+    so time to first output does not depend on instrumentation setup.
+"""
+
+import atexit
+import logging
 import os
 import sys
+import threading
 from pathlib import Path
+from types import TracebackType
+from typing import Annotated
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from ._log import logging_initialize
-from ._logfire import logfire_initialize
-from ._sentry import sentry_initialize
+from ._constants import __env_file__, __project_name__
+from ._log import _DeferredHandler, logging_initialize
+from ._logfire import LogfireSettings, logfire_initialize
+from ._sentry import SentrySettings, sentry_initialize
+from ._settings import load_settings
 
 _boot_called = False
 
@@ -16,6 +32,169 @@ if vendored_dir.is_dir() and str(vendored_dir) not in sys.path:
     sys.path.insert(0, str(vendored_dir))
 
 
+class BootSettings(BaseSettings):
+    """Settings for the boot sequence."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_BOOT_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    background: Annotated[
+        bool,
+        Field(
+            description=(
+                "Initialize Sentry and Logfire on a background thread. "
+                "Modules imported before Logfire is ready are not auto-traced."
+            ),
+            default=False,
+        ),
+    ]
+    buffer_size: Annotated[
+        int,
+        Field(
+            description="Maximum number of log records and exceptions buffered until the backends are ready",
+            gt=0,
+            default=1000,
+        ),
+    ]
+    flush_timeout: Annotated[
+        float,
+        Field(description="Seconds to wait at exit for the backends to get ready and flush", ge=0.0, default=2.0),
+    ]
+
+
+def _observability_configured() -> bool:
+    """Check if any observability backend is to be initialized.
+
+    Settings are validated on the calling thread, so invalid settings abort the boot as usual.
+
+    Returns:
+        bool: True if Sentry or Logfire is configured.
+    """
+    return load_settings(SentrySettings).dsn is not None or load_settings(LogfireSettings).token is not None
+
+
+class _DeferredExceptHook:
+    """Exception hook buffering uncaught exceptions until Sentry is ready."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the hook, chaining the current one.
+
+        Args:
+            capacity: Maximum number of exceptions buffered.
+        """
+        self.capacity = capacity
+        self.buffer: list[tuple[type[BaseException], BaseException, TracebackType | None]] = []
+        self.ready = False
+        self._lock = threading.Lock()
+        self._previous = sys.excepthook
+
+    def __call__(
+        self, exc_type: type[BaseException], exc_value: BaseException, exc_traceback: TracebackType | None
+    ) -> None:
+        """Buffer the exception unless ready, and pass it on to the previous hook.
+
+        Args:
+            exc_type: Type of the exception.
+            exc_value: The exception.
+            exc_traceback: Traceback of the exception.
+        """
+        with self._lock:
+            if not self.ready and len(self.buffer) < self.capacity:
+                self.buffer.append((exc_type, exc_value, exc_traceback))
+        self._previous(exc_type, exc_value, exc_traceback)
+
+    def replay(self, sentry_enabled: bool) -> None:
+        """Send buffered exceptions to Sentry and stop buffering.
+
+        Args:
+            sentry_enabled: Whether Sentry was initialized; if not, buffered exceptions are discarded.
+        """
+        with self._lock:
+            self.ready = True
+            buffered, self.buffer = self.buffer, []
+        if sentry_enabled and buffered:
+            import sentry_sdk  # noqa: PLC0415
+
+            for exc_info in buffered:
+                sentry_sdk.capture_exception(exc_info)
+
+
+class _BackgroundBoot:
+    """Initialization of Sentry and Logfire on a background thread."""
+
+    def __init__(self, modules_to_instrument: list[str], settings: BootSettings) -> None:
+        """Initialize the background boot.
+
+        Args:
+            modules_to_instrument: Modules to be instrumented by Logfire.
+            settings: Boot settings.
+        """
+        self.modules_to_instrument = modules_to_instrument
+        self.settings = settings
+        self.sentry_enabled = False
+        self.logfire_enabled = False
+        self.deferred_handler = _DeferredHandler(capacity=settings.buffer_size)
+        self.excepthook = _DeferredExceptHook(capacity=settings.buffer_size)
+        self.thread = threading.Thread(target=self._run, name=f"{__project_name__}-boot", daemon=True)
+
+    def start(self) -> None:
+        """Initialize logging with buffering, and start initializing the backends."""
+        logging_initialize(additional_handlers=[self.deferred_handler])
+        sys.excepthook = self.excepthook
+        atexit.register(self.flush)
+        self.thread.start()
+
+    def _run(self) -> None:
+        """Initialize the backends, then replay buffered log records and exceptions."""
+        targets: list[logging.Handler] = []
+        replay_only: list[logging.Handler] = []
+        try:
+            self._initialize_backends(targets, replay_only)
+        except Exception:
+            logging.getLogger(__name__).exception("Failed to initialize observability backends")
+        finally:
+            self.deferred_handler.replay(targets, replay_only)
+            self.excepthook.replay(self.sentry_enabled)
+
+    def _initialize_backends(self, targets: list[logging.Handler], replay_only: list[logging.Handler]) -> None:
+        """Initialize Sentry and Logfire.
+
+        Args:
+            targets: Receives handlers for buffered and subsequent log records.
+            replay_only: Receives handlers for buffered log records only.
+        """
+        self.sentry_enabled = sentry_initialize()
+        if self.sentry_enabled:
+            # Sentry's logging integration captures records from now on, buffered ones are replayed
+            from sentry_sdk.integrations.logging import BreadcrumbHandler, EventHandler  # noqa: PLC0415
+
+            replay_only += [EventHandler(level=logging.ERROR), BreadcrumbHandler(level=logging.INFO)]
+        # Modules imported meanwhile cannot be auto-traced anymore
+        self.logfire_enabled = logfire_initialize(self.modules_to_instrument, check_imported_modules="ignore")
+        if self.logfire_enabled:
+            import logfire  # noqa: PLC0415
+
+            targets.append(logfire.LogfireLoggingHandler())
+
+    def flush(self) -> None:
+        """Wait for the backends to get ready, and flush them, bounded by the flush timeout."""
+        self.thread.join(self.settings.flush_timeout)
+        if self.thread.is_alive():
+            return
+        if self.sentry_enabled:
+            import sentry_sdk  # noqa: PLC0415
+
+            sentry_sdk.flush(timeout=self.settings.flush_timeout)
+        if self.logfire_enabled:
+            import logfire  # noqa: PLC0415
+
+            logfire.force_flush(timeout_millis=int(self.settings.flush_timeout * 1000))
+
+
 def boot(modules_to_instrument: list[str]) -> None:
     """Boot the application.
 
@@ -28,15 +207,19 @@ def boot(modules_to_instrument: list[str]) -> None:
     if _boot_called:
         return
     _boot_called = True
-    sentry_initialize()
-    log_to_logfire = logfire_initialize(modules_to_instrument)
-    logging_initialize(log_to_logfire)
+    settings = load_settings(BootSettings)
+    if settings.background and _observability_configured():
+        _BackgroundBoot(modules_to_instrument, settings).start()
+    else:
+        sentry_initialize()
+        log_to_logfire = logfire_initialize(modules_to_instrument)
+        logging_initialize(log_to_logfire)
     _amend_library_path()
     _parse_env_args()
     _log_boot_message()
 
 
-from ._constants import __project_name__, __version__  # noqa: E402
+from ._constants import __version__  # noqa: E402
 from ._log import get_logger  # noqa: E402
 from ._process import get_process_info  # noqa: E402
 
@@ -0,0 +1,99 @@
+"""Thin client forwarding invocations of the template-demo CLI to its warm daemon.
+
+- Imports the standard library only, so it starts within milliseconds. Start the daemon via
+    `template-demo system daemon start`.
+- Falls back to running the CLI in-process if no daemon is listening.
+- The socket path is read from TEMPLATE_DEMO_DAEMON_SOCKET_PATH, defaulting to ~/.template_demo/daemon.sock.
+    Other than the daemon, the client does not read .env files.
+- See template_demo.utils._daemon for the protocol.
+"""
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+from pathlib import Path
+from typing import Any
+
+_PROJECT_NAME = "template_demo"
+_LENGTH = struct.Struct("!I")
+_FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT")
+
+
+def _socket_path() -> Path:
+    """Get path of the socket the daemon listens on.
+
+    Returns:
+        Path: The socket path.
+    """
+    configured = os.getenv(f"{_PROJECT_NAME.upper()}_DAEMON_SOCKET_PATH", "").strip()
+    return Path(configured) if configured else Path.home() / f".{_PROJECT_NAME}" / "daemon.sock"
+
+
+def _send_message(sock: socket.socket, message: dict[str, Any], fds: list[int]) -> None:
+    payload = json.dumps(message).encode("utf-8")
+    socket.send_fds(sock, [_LENGTH.pack(len(payload))], fds)
+    sock.sendall(payload)
+
+
+def _recv_message(sock: socket.socket) -> dict[str, Any]:
+    data = b""
+    length: int | None = None
+    while length is None or len(data) < length:
+        chunk = sock.recv(_LENGTH.size - len(data) if length is None else length - len(data))
+        if not chunk:
+            message = "Daemon closed the connection"
+            raise ConnectionError(message)
+        data += chunk
+        if length is None and len(data) == _LENGTH.size:
+            (length,), data = _LENGTH.unpack(data), b""
+    return dict(json.loads(data))
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run an invocation in the daemon, with the environment, working directory and standard streams of this process.
+
+    Signals such as SIGINT are forwarded to the process running the invocation.
+
+    Args:
+        argv: The command line, including the program name.
+
+    Returns:
+        int | None: Exit code of the invocation, or None if no daemon is listening.
+    """
+    if not (hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")):
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(_socket_path()))
+            _send_message(
+                sock,
+                {"type": "run", "argv": argv, "env": dict(os.environ), "cwd": str(Path.cwd())},
+                [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()],
+            )
+            pid = int(_recv_message(sock)["pid"])
+        except (OSError, KeyError, ValueError):
+            return None  # Invocation did not start
+        for name in _FORWARDED_SIGNALS:
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), lambda signum, _frame: os.kill(pid, signum))
+        try:
+            return int(_recv_message(sock)["exit_code"])
+        except (OSError, KeyError, ValueError):
+            return 1
+
+
+def main() -> None:
+    """Entrypoint of the thin client."""
+    code = forward(sys.argv)
+    if code is None:
+        from template_demo.cli import cli  # noqa: PLC0415
+
+        cli()
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmarks quantifying the per-request overhead of mounting an app per API version."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import pytest
+
+from template_demo.api import APISettings, api, create_app
+from template_demo.utils._timing import ASGIApp, Message
+
+NUMBER_OF_REQUESTS = 2000
+PATHS = ("/api/v1/hello/echo/hi", "/api/v2/hello/world")
+
+
+async def _request(app: ASGIApp, path: str) -> int:
+    """Send a GET request to an ASGI app directly, i.e. without the overhead of a client or server.
+
+    Args:
+        app: The app.
+        path: The path of the request.
+
+    Returns:
+        int: The status code of the response.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    status = 0
+
+    async def receive() -> Message:  # noqa: RUF029
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _measure(app: ASGIApp, path: str) -> float:
+    """Measure the mean duration of requests in seconds, best of several repeats.
+
+    Args:
+        app: The app.
+        path: The path of the requests.
+
+    Returns:
+        float: Mean duration per request.
+    """
+    assert await _request(app, path) == 200
+    durations = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(NUMBER_OF_REQUESTS):
+            await _request(app, path)
+        durations.append((time.perf_counter() - start) / NUMBER_OF_REQUESTS)
+    return min(durations)
+
+
+@pytest.mark.long_running
+@pytest.mark.benchmark
+def test_benchmark_flat_routing(record_property: Callable[[str, object], None]) -> None:
+    """Quantify per-request savings of routing all API versions in a single router over mounting an app each."""
+    flat_api = create_app(APISettings(flat=True))
+
+    for path in PATHS:
+        mounted = asyncio.run(_measure(api, path))
+        flat = asyncio.run(_measure(flat_api, path))
+        name = path.removeprefix("/api/").replace("/", "_")
+        record_property(f"{name}_mounted_us", round(mounted * 1e6, 3))
+        record_property(f"{name}_flat_us", round(flat * 1e6, 3))
+        print(  # noqa: T201
+            f"{path}: mounted {mounted * 1e6:.1f}us, flat {flat * 1e6:.1f}us, "
+            f"saving {(mounted - flat) * 1e6:.1f}us per request"
+        )
+        assert flat < mounted
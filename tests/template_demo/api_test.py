@@ -3,7 +3,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from template_demo.api import api
+from template_demo.api import APISettings, api, create_app, create_version_app
 
 
 @pytest.fixture
@@ -17,3 +17,50 @@ def test_root_endpoint_returns_404(client: TestClient) -> None:
     response = client.get("/")
     assert response.status_code == 404
     assert "Not Found" in response.json()["detail"]
+
+
+def test_flat_api_routes_versions_like_mounted_api(client: TestClient) -> None:
+    """Test that the flat API serves the same routes, schemas and docs per API version as the mounted API."""
+    flat_client = TestClient(create_app(APISettings(flat=True)))
+
+    for path in ("/api/v1/hello/world", "/api/v2/hello/world", "/api/v1/hello/echo/hi", "/api/v1/openapi.json"):
+        flat_response = flat_client.get(path)
+        assert flat_response.status_code == 200
+        assert flat_response.json() == client.get(path).json()
+    assert flat_client.post("/api/v2/hello/echo", json={"text": "hi"}).json() == {"text": "HI"}
+    assert flat_client.get("/api/v2/hello/echo/hi").status_code == 404
+    assert flat_client.get("/api/openapi.json").json()["paths"] == {}
+
+    response = flat_client.get("/api/v2/docs")
+    assert response.status_code == 200
+    assert "/api/v2/openapi.json" in response.text
+    assert "/api/v2/docs/oauth2-redirect" in response.text
+    assert flat_client.get("/api/v2/docs/oauth2-redirect").status_code == 200
+    assert "/api/v1/openapi.json" in flat_client.get("/api/v1/redoc").text
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_lazy_api_adds_versions_on_first_request(flat: bool) -> None:
+    """Test that a lazy API adds API versions on the first request to them."""
+    app = create_app(APISettings(lazy=True, flat=flat))
+    client = TestClient(app)
+    assert app.state.cached_openapi == {}
+
+    assert client.get("/api/v1/hello/world").status_code == 200
+    assert list(app.state.cached_openapi) == ["v1"]
+    assert client.get("/api/v2/openapi.json").json()["info"]["version"] == "2.0.0"
+    assert client.get("/api/v3/hello/world").status_code == 404
+    assert list(app.state.cached_openapi) == ["v1", "v2"]
+
+
+def test_created_apps_are_isolated() -> None:
+    """Test that apps created by the factory do not share state or routes."""
+    first, second = create_app(), create_app()
+    first.add_api_route("/only-first", lambda: {"first": True})
+
+    assert TestClient(first).get("/api/only-first").status_code == 200
+    assert TestClient(second).get("/api/only-first").status_code == 404
+    assert first.state.cached_openapi["v1"] is not second.state.cached_openapi["v1"]
+    assert create_version_app("v1") is not create_version_app("v1")
+    with pytest.raises(ValueError, match="Unknown API version"):
+        create_version_app("v0")
@@ -1,7 +1,10 @@
 """Tests to verify the GUI functionality of the hello module."""
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from nicegui.testing import User
 
+from template_demo.hello._gui import PLOT_PATH, _render_plot, plot_svg
 from template_demo.utils import gui_register_pages
 
 
@@ -22,3 +25,29 @@ async def test_gui_index(user: User) -> None:
     await user.should_see("Ok")
     user.find(marker="BUTTON_OK").click()
     await user.should_see("You chose")
+
+
+def test_plot_is_rendered_once_and_served_with_caching_headers() -> None:
+    """Test that the plot is rendered once per rounded parameters, and revalidated via its entity tag."""
+    _render_plot.cache_clear()
+    app = FastAPI()
+    app.add_api_route(PLOT_PATH, plot_svg, methods=["GET"])
+    client = TestClient(app)
+
+    response = client.get(PLOT_PATH, params={"start": 0.0, "stop": 5.0})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/svg+xml"
+    assert b"<svg" in response.content
+    assert "max-age" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    assert client.get(PLOT_PATH, params={"start": 0.0, "stop": 5.0}).content == response.content
+    assert client.get(PLOT_PATH, params={"start": 0.04, "stop": 4.96}).headers["etag"] == etag
+    assert _render_plot.cache_info().misses == 1
+
+    response = client.get(PLOT_PATH, params={"start": 0.0, "stop": 5.0}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+
+    assert client.get(PLOT_PATH, params={"start": 1.0, "stop": 5.0}).headers["etag"] != etag
+    assert client.get(PLOT_PATH, params={"start": 1000.0}).status_code == 422
@@ -0,0 +1,90 @@
+"""Benchmarks quantifying the per-call overhead of logfire auto-tracing on the hello service."""
+
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+
+import pytest
+
+# Auto-tracing hooks into the import of modules, so each configuration is measured in a fresh interpreter.
+_BENCHMARK_SCRIPT = """
+import json
+import sys
+import timeit
+
+min_duration, number = sys.argv[1], int(sys.argv[2])
+if min_duration != "off":
+    import logfire
+
+    # Logfire is initialized on import of the package from LogfireSettings, as in the application,
+    # except that spans are not sent, so the fake token causes no network traffic
+    configure = logfire.configure
+    logfire.configure = lambda **kwargs: configure(**{**kwargs, "send_to_logfire": False})
+
+from template_demo.hello import Service
+from template_demo.hello._models import Utterance
+
+service = Service()
+utterance = Utterance(text="hello")
+calls = {"echo": lambda: service.echo(utterance), "get_hello_world": service.get_hello_world}
+result = {}
+for name, call in calls.items():
+    call()
+    result[name] = min(timeit.repeat(call, number=number, repeat=5)) / number
+print(json.dumps(result))
+"""
+
+NUMBER_OF_CALLS = 2000
+
+
+def _measure(min_duration: str) -> dict[str, float]:
+    """Measure the mean duration of service calls in seconds, best of several repeats.
+
+    Args:
+        min_duration: Threshold for auto-tracing in seconds, or "off" to measure without tracing.
+
+    Returns:
+        dict[str, float]: Mean duration per call by service method.
+    """
+    env = {key: value for key, value in os.environ.items() if not key.startswith("TEMPLATE_DEMO_LOGFIRE_")}
+    if min_duration == "off":
+        env["TEMPLATE_DEMO_LOGFIRE_TOKEN"] = ""
+    else:
+        env.update({
+            "TEMPLATE_DEMO_LOGFIRE_TOKEN": "benchmark",
+            "TEMPLATE_DEMO_LOGFIRE_AUTO_TRACING_MIN_DURATION": min_duration,
+            "TEMPLATE_DEMO_LOGFIRE_INSTRUMENT_SYSTEM_METRICS": "false",
+            "TEMPLATE_DEMO_LOGFIRE_SAMPLING_RATIO": "1.0",
+        })
+    result = subprocess.run(
+        [sys.executable, "-c", _BENCHMARK_SCRIPT, min_duration, str(NUMBER_OF_CALLS)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+@pytest.mark.long_running
+@pytest.mark.benchmark
+def test_benchmark_auto_tracing_overhead(record_property: Callable[[str, object], None]) -> None:
+    """Quantify per-call overhead of auto-tracing with and without duration threshold."""
+    baseline = _measure("off")
+    traced_always = _measure("0")
+    traced_above_threshold = _measure("0.01")
+
+    for name, duration in baseline.items():
+        overhead_always = traced_always[name] - duration
+        overhead_threshold = traced_above_threshold[name] - duration
+        record_property(f"{name}_baseline_us", round(duration * 1e6, 3))
+        record_property(f"{name}_overhead_min_duration_0_us", round(overhead_always * 1e6, 3))
+        record_property(f"{name}_overhead_min_duration_10ms_us", round(overhead_threshold * 1e6, 3))
+        print(  # noqa: T201
+            f"{name}: baseline {duration * 1e6:.2f}us, "
+            f"overhead with min_duration=0 {overhead_always * 1e6:.2f}us, "
+            f"with min_duration=0.01 {overhead_threshold * 1e6:.2f}us"
+        )
+        assert traced_above_threshold[name] < traced_always[name]
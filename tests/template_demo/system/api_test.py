@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from template_demo.api import api
 from template_demo.system._service import Service
+from template_demo.utils import JobQueue, JobSettings
 
 HEALTH_PATH_V1 = "/api/v1/system/health"
 HEALTH_PATH_V2 = "/api/v2/system/health"
@@ -23,6 +24,10 @@ SERVICE_IS_UNHEALTHY = "System marked as unhealthy"
 INFO_PATH_V1 = "/api/v1/system/info"
 INFO_PATH_V2 = "/api/v2/system/info"
 
+INFO_JOBS_PATH_V1 = "/api/v1/system/info/jobs"
+
+DIAGNOSTICS_PATH_V1 = "/api/v1/system/diagnostics"
+
 RUNTIME = "runtime"
 ENVIRONMENT = "environment"
 
@@ -97,7 +102,8 @@ def test_info_endpoint(client: TestClient) -> None:
     response = client.get(f"{INFO_PATH_V2}?token=wrong")
     assert response.status_code == 403
 
-    # Test with valid token (patched validation)
+    # Test with valid token (patched validation), from another address, as clients are rate limited by address
+    client = TestClient(api, client=("authorized", 50000))
     with patch.object(Service, "is_token_valid", return_value=True):
         response = client.get(f"{INFO_PATH_V1}?token=valid_token")
         assert response.status_code == 200
@@ -108,3 +114,57 @@ def test_info_endpoint(client: TestClient) -> None:
         assert response.status_code == 200
         assert RUNTIME in response.json()
         assert ENVIRONMENT in response.json()[RUNTIME]
+
+
+def test_info_job_endpoints(client: TestClient) -> None:
+    """Test that info jobs are submitted, shared by concurrent requesters and long-polled for the info."""
+    assert client.post(f"{INFO_JOBS_PATH_V1}?token=wrong").status_code == 403
+    assert client.get(f"{INFO_JOBS_PATH_V1}/unknown?token=wrong").status_code == 403
+
+    queue = JobQueue("test", JobSettings())
+    with (
+        patch("template_demo.system._service._info_jobs", queue),
+        patch.object(Service, "is_token_valid", return_value=True),
+        patch.object(Service, "cached_info", return_value={RUNTIME: {ENVIRONMENT: {}}}) as cached_info,
+    ):
+        response = client.post(f"{INFO_JOBS_PATH_V1}?token=valid_token")
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+        assert response.headers["location"] == f"{INFO_JOBS_PATH_V1}/{job_id}"
+
+        response = client.get(f"{INFO_JOBS_PATH_V1}/{job_id}?token=valid_token&wait=5")
+        assert response.status_code == 200
+        assert response.json()["state"] == "succeeded"
+        assert ENVIRONMENT in response.json()["result"][RUNTIME]
+
+        assert client.post(f"{INFO_JOBS_PATH_V1}?token=valid_token").json()["id"] == job_id
+        cached_info.assert_called_once_with(True, False)
+
+        assert client.get(f"{INFO_JOBS_PATH_V1}/unknown?token=valid_token").status_code == 404
+    queue.shutdown()
+
+
+def test_diagnostics_endpoints(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that diagnostics endpoints are disabled by default, require the token and enforce the limits."""
+    assert client.get(f"{DIAGNOSTICS_PATH_V1}/sleep?token=valid_token&seconds=0").status_code == 404
+
+    monkeypatch.setenv("TEMPLATE_DEMO_SYSTEM_DIAGNOSTICS_ENABLED", "true")
+    monkeypatch.setenv("TEMPLATE_DEMO_SYSTEM_DIAGNOSTICS_MAX_SECONDS", "1")
+    monkeypatch.setenv("TEMPLATE_DEMO_SYSTEM_DIAGNOSTICS_MAX_MEGABYTES", "8")
+    assert client.get(f"{DIAGNOSTICS_PATH_V1}/sleep?token=wrong&seconds=0").status_code == 403
+
+    with patch.object(Service, "is_token_valid", return_value=True):
+        response = client.get(f"{DIAGNOSTICS_PATH_V1}/sleep?token=valid_token&seconds=0.01")
+        assert response.status_code == 200
+        assert response.json()["seconds"] >= 0.01
+
+        response = client.get(f"{DIAGNOSTICS_PATH_V1}/cpu?token=valid_token&seconds=0.01&on_event_loop=true")
+        assert response.status_code == 200
+        assert response.json()["iterations"] > 0
+
+        response = client.get(f"{DIAGNOSTICS_PATH_V1}/memory?token=valid_token&megabytes=2&seconds=0")
+        assert response.status_code == 200
+        assert response.json()["bytes"] == 2 * 1024 * 1024
+
+        assert client.get(f"{DIAGNOSTICS_PATH_V1}/cpu?token=valid_token&seconds=2").status_code == 400
+        assert client.get(f"{DIAGNOSTICS_PATH_V1}/memory?token=valid_token&megabytes=9").status_code == 400
@@ -148,3 +148,9 @@ def test_sleep(runner: CliRunner) -> None:
     """Check sleep."""
     result = runner.invoke(cli, ["system", "sleep"])
     assert result.exit_code == 0
+
+
+def test_sleep_asynchronous(runner: CliRunner) -> None:
+    """Check sleep on an event loop."""
+    result = runner.invoke(cli, ["system", "sleep", "--seconds", "0.01", "--asynchronous"])
+    assert result.exit_code == 0
@@ -1,9 +1,11 @@
 """Tests of the system service."""
 
+import asyncio
 import os
+from typing import Any
 from unittest import mock
 
-from template_demo.system._service import Service
+from template_demo.system._service import Service, _info_cache
 
 
 def test_is_token_valid() -> None:
@@ -34,3 +36,91 @@ def test_is_token_valid_when_not_set() -> None:
         # Should return False for any token when no token is set
         assert service.is_token_valid("any-token") is False
         assert service.is_token_valid("") is False
+
+
+def _unfiltered_info(environ: dict[str, str], settings: dict[str, Any]) -> dict[str, Any]:
+    """Assemble info as computed unfiltered and including environ, with empty sections otherwise.
+
+    Args:
+        environ: Environment variables of the runtime section.
+        settings: The settings section.
+
+    Returns:
+        dict[str, Any]: The info.
+    """
+    return Service._assemble_info({
+        "package": {},
+        "runtime": {"host": {"os": {}, "machine": {}, "uptime": {}}, "environ": environ},
+        "cpu": {},
+        "network": {},
+        "settings": settings,
+    })
+
+
+def test_cached_info_is_shared_across_arguments_within_ttl() -> None:
+    """Test that info is computed once within the TTL, unfiltered, and views for other arguments derive from it."""
+    _info_cache.clear()
+    info = _unfiltered_info({"API_TOKEN": "secret", "HOME": "/home"}, {"TEMPLATE_DEMO_SYSTEM_TOKEN": "secret"})
+    with (
+        mock.patch.dict(os.environ, {"TEMPLATE_DEMO_SYSTEM_INFO_CACHE_TTL": "60"}),
+        mock.patch.object(Service, "info", return_value=info) as compute,
+        mock.patch.object(Service, "_info_settings", return_value={"TEMPLATE_DEMO_SYSTEM_TOKEN": "**********"}),
+    ):
+        service = Service()
+        unfiltered = service.cached_info(include_environ=True, filter_secrets=False)
+        filtered = service.cached_info(include_environ=True, filter_secrets=True)
+        default = service.cached_info()
+    compute.assert_called_once_with(include_environ=True, filter_secrets=False)
+    assert unfiltered == info
+    assert filtered["runtime"]["environ"] == {"HOME": "/home"}
+    assert filtered["settings"] == {"TEMPLATE_DEMO_SYSTEM_TOKEN": "**********"}
+    assert "environ" not in default["runtime"]
+    assert default["settings"] == {"TEMPLATE_DEMO_SYSTEM_TOKEN": "**********"}
+    _info_cache.clear()
+
+
+def test_cached_info_disabled_with_zero_ttl() -> None:
+    """Test that info is computed on every call if the TTL is 0."""
+    _info_cache.clear()
+    with (
+        mock.patch.dict(os.environ, {"TEMPLATE_DEMO_SYSTEM_INFO_CACHE_TTL": "0"}),
+        mock.patch.object(Service, "info", return_value=_unfiltered_info({}, {})) as info,
+    ):
+        service = Service()
+        service.cached_info(filter_secrets=False)
+        service.cached_info(filter_secrets=False)
+    assert info.call_count == 2
+    _info_cache.clear()
+
+
+def test_info_sections_are_streamed_and_cached() -> None:
+    """Test that sections are streamed as computed, assemble into the info, and are served from the cache.
+
+    Services of other modules are instantiated once per stream, instead of once per section.
+    """
+    _info_cache.clear()
+
+    async def collect(service: Service) -> dict[str, dict[str, Any]]:
+        return {name: section async for name, section in service.info_sections()}
+
+    with (
+        mock.patch.dict(os.environ, {"TEMPLATE_DEMO_SYSTEM_INFO_CACHE_TTL": "60"}),
+        mock.patch.object(Service, "_info_cpu", return_value={"percent": 1.0}),
+        mock.patch.object(Service, "_info_network", return_value={"hostname": "host"}),
+        mock.patch.object(Service, "_module_services", side_effect=Service._module_services) as module_services,
+    ):
+        service = Service()
+        sections = asyncio.run(collect(service))
+        assert module_services.call_count == 1
+        assert set(sections) == set(service.info_section_names())
+
+        info = service.cached_info()
+        assert info["runtime"]["host"]["machine"]["cpu"] == {"percent": 1.0}
+        assert info["runtime"]["host"]["network"] == {"hostname": "host"}
+        assert list(info["runtime"]["host"]) == ["os", "machine", "network", "uptime"]
+        assert info["package"] == sections["package"]
+        assert Service._split_info(info) == sections
+        assert asyncio.run(collect(service)) == sections
+        assert "environ" not in sections["runtime"]
+        assert set(Service.info()) == set(info)
+    _info_cache.clear()
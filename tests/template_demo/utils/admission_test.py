@@ -0,0 +1,79 @@
+"""Tests for admission control of HTTP requests."""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from template_demo.utils import AdmissionMiddleware, AdmissionSettings
+from template_demo.utils._admission import DEFAULT_LIMIT_KEY
+
+
+def _app(settings: AdmissionSettings) -> tuple[AdmissionMiddleware, asyncio.Event, httpx.AsyncClient]:
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/v1/slow")
+    async def slow() -> str:
+        await release.wait()
+        return "slow"
+
+    @app.get("/v1/fast")
+    async def fast() -> str:
+        return "fast"
+
+    middleware = AdmissionMiddleware(app, settings, prefixes=["v1"])
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://testserver")
+    return middleware, release, client
+
+
+def test_limit_key_strips_prefixes_and_matches_longest_route() -> None:
+    """Test that limits are matched by the path below the root path and API version."""
+    middleware = AdmissionMiddleware(
+        FastAPI(), AdmissionSettings(limits={"/system": 4, "/system/info": 2}), prefixes=["v1", "v2"]
+    )
+
+    def key(path: str) -> str:
+        return middleware.limit_key({"path": f"/api{path}", "root_path": "/api"})
+
+    assert key("/v1/system/info") == "/system/info"
+    assert key("/v2/system/info/") == "/system/info"
+    assert key("/v1/system/health") == "/system"
+    assert key("/v1/system-info") == DEFAULT_LIMIT_KEY
+    assert key("/v3/system/info") == DEFAULT_LIMIT_KEY
+
+
+async def test_saturated_route_is_rejected_without_starving_others() -> None:
+    """Test that requests beyond the limit and queue of a route are rejected fast, while other routes are served."""
+    middleware, release, client = _app(
+        AdmissionSettings(limits={"/slow": 1}, max_queue=1, queue_timeout=5, retry_after=2)
+    )
+    async with client:
+        admitted = asyncio.create_task(client.get("/v1/slow"))
+        queued = asyncio.create_task(client.get("/v1/slow"))
+        await asyncio.sleep(0.1)
+
+        rejected = await client.get("/v1/slow")
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "2"
+        assert (await client.get("/v1/fast")).text == '"fast"'
+
+        release.set()
+        assert (await admitted).status_code == 200
+        assert (await queued).status_code == 200
+    assert middleware.rejected == {("/slow", "queue_full"): 1}
+
+
+async def test_queued_request_is_rejected_after_timeout() -> None:
+    """Test that requests waiting for admission longer than the queue timeout are rejected."""
+    middleware, release, client = _app(AdmissionSettings(default_limit=1, max_queue=1, queue_timeout=0.05))
+    async with client:
+        admitted = asyncio.create_task(client.get("/v1/slow"))
+        await asyncio.sleep(0.05)
+
+        assert (await client.get("/v1/fast")).status_code == 503
+
+        release.set()
+        assert (await admitted).status_code == 200
+        assert (await client.get("/v1/fast")).status_code == 200
+    assert middleware.rejected == {(DEFAULT_LIMIT_KEY, "timeout"): 1}
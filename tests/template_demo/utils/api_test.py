@@ -0,0 +1,41 @@
+"""Tests for versioned API routers."""
+
+from fastapi.testclient import TestClient
+
+from template_demo.api import create_app
+from template_demo.utils import VersionedAPIRouter
+
+
+def test_versioned_routers_share_implementation_class() -> None:
+    """Test that all versioned routers are instances of a single class, looked up by API version."""
+    with VersionedAPIRouter.scoped():
+        first = VersionedAPIRouter("v1", prefix="/first")
+        second = VersionedAPIRouter("v2", prefix="/second")
+        third = VersionedAPIRouter("v1", prefix="/third")
+
+        assert type(first) is type(second)
+        assert VersionedAPIRouter.get_instances("v1") == [first, third]
+        assert VersionedAPIRouter.get_instances("v2") == [second]
+        assert VersionedAPIRouter.get_instances("v3") == []
+        assert VersionedAPIRouter.get_instances() == [first, third, second]
+
+        VersionedAPIRouter.clear_instances()
+        assert VersionedAPIRouter.get_instances() == []
+
+
+def test_scoped_routers_do_not_leak_into_other_apps() -> None:
+    """Test that routers created in a scope are included only in apps created within the scope."""
+    create_app()  # Import modules, registering their routers outside of the scope
+    routers = VersionedAPIRouter.get_instances()
+
+    with VersionedAPIRouter.scoped():
+        router = VersionedAPIRouter("v1", prefix="/scoped")
+        router.get("/ping")(lambda: "pong")  # type: ignore[attr-defined]
+        client = TestClient(create_app())
+        assert client.get("/api/v1/scoped/ping").json() == "pong"
+        assert client.get("/api/v1/hello/world").status_code == 404
+
+    assert VersionedAPIRouter.get_instances() == routers
+    client = TestClient(create_app())
+    assert client.get("/api/v1/scoped/ping").status_code == 404
+    assert client.get("/api/v1/hello/world").status_code == 200
@@ -0,0 +1,121 @@
+"""Tests for the boot sequence."""
+
+import importlib
+import logging
+import sys
+from unittest import mock
+
+import pytest
+
+from template_demo.utils._log import _DeferredHandler
+from template_demo.utils.boot import BootSettings, _BackgroundBoot, _DeferredExceptHook
+
+# The boot function shadows the boot submodule as attribute of the utils package
+boot_module = importlib.import_module("template_demo.utils.boot")
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler collecting the messages of emitted records."""
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_deferred_handler_buffers_and_replays() -> None:
+    """Test that buffered records are replayed once, and subsequent records are passed to targets only."""
+    handler = _DeferredHandler(capacity=10)
+    target = _CollectingHandler()
+    replay_only = _CollectingHandler(level=logging.ERROR)
+
+    handler.handle(_record("early info"))
+    handler.handle(_record("early error", logging.ERROR))
+    assert target.messages == []
+
+    handler.replay([target], [replay_only])
+    handler.handle(_record("late error", logging.ERROR))
+
+    assert target.messages == ["early info", "early error", "late error"]
+    assert replay_only.messages == ["early error"]
+    assert handler.buffer == []
+
+
+def test_deferred_handler_drops_beyond_capacity() -> None:
+    """Test that records beyond capacity are dropped and counted instead of growing the buffer."""
+    handler = _DeferredHandler(capacity=2)
+
+    for i in range(5):
+        handler.handle(_record(f"message {i}"))
+
+    assert [record.getMessage() for record in handler.buffer] == ["message 0", "message 1"]
+    assert handler.dropped == 3
+
+
+def test_deferred_excepthook_buffers_until_ready() -> None:
+    """Test that uncaught exceptions are chained, buffered and captured by Sentry on replay."""
+    previous = mock.Mock()
+    with mock.patch.object(sys, "excepthook", previous):
+        hook = _DeferredExceptHook(capacity=1)
+    error = ValueError("boom")
+
+    hook(ValueError, error, None)
+    hook(ValueError, ValueError("dropped"), None)
+    assert previous.call_count == 2
+
+    with mock.patch("sentry_sdk.capture_exception") as capture_exception:
+        hook.replay(sentry_enabled=True)
+        hook(ValueError, ValueError("late"), None)
+
+    capture_exception.assert_called_once_with((ValueError, error, None))
+    assert hook.buffer == []
+
+
+def test_background_boot_replays_records_to_logfire() -> None:
+    """Test that records logged while the backends initialize reach logfire once ready."""
+    logfire_handler = _CollectingHandler()
+    background = _BackgroundBoot(["template_demo"], BootSettings(background=True, buffer_size=10, flush_timeout=1.0))
+    background.deferred_handler.handle(_record("booting"))
+
+    with (
+        mock.patch.object(boot_module, "sentry_initialize", return_value=False),
+        mock.patch.object(boot_module, "logfire_initialize", return_value=True) as logfire_initialize,
+        mock.patch("logfire.LogfireLoggingHandler", return_value=logfire_handler),
+        mock.patch("logfire.force_flush") as force_flush,
+    ):
+        background.thread.start()
+        background.flush()
+
+    logfire_initialize.assert_called_once_with(["template_demo"], check_imported_modules="ignore")
+    force_flush.assert_called_once_with(timeout_millis=1000)
+    background.deferred_handler.handle(_record("ready"))
+    assert logfire_handler.messages == ["booting", "ready"]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_boot_initializes_in_foreground_unless_configured(background: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that boot initializes synchronously unless background boot is enabled and a backend is configured."""
+    monkeypatch.setenv("TEMPLATE_DEMO_BOOT_BACKGROUND", str(background))
+    monkeypatch.setenv("TEMPLATE_DEMO_SENTRY_DSN", "")
+    monkeypatch.setenv("TEMPLATE_DEMO_LOGFIRE_TOKEN", "")
+    monkeypatch.setattr(boot_module, "_boot_called", False)
+
+    with (
+        mock.patch.object(boot_module, "sentry_initialize", return_value=False) as sentry_initialize,
+        mock.patch.object(boot_module, "logfire_initialize", return_value=False),
+        mock.patch.object(boot_module, "logging_initialize") as logging_initialize,
+        mock.patch.object(boot_module, "_BackgroundBoot") as background_boot,
+        mock.patch.object(boot_module, "_amend_library_path"),
+        mock.patch.object(boot_module, "_log_boot_message"),
+    ):
+        boot_module.boot(["template_demo"])
+
+    sentry_initialize.assert_called_once_with()
+    logging_initialize.assert_called_once_with(False)
+    background_boot.assert_not_called()
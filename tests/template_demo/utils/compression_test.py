@@ -0,0 +1,153 @@
+"""Tests for compression of HTTP responses."""
+
+import asyncio
+import gzip
+import json
+import zlib
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from template_demo.api import api
+from template_demo.utils import CompressionMiddleware, CompressionSettings
+from template_demo.utils._compression import negotiate_encoding
+from template_demo.utils._timing import Message, Receive, Scope, Send
+
+PAYLOAD = json.dumps({"items": list(range(2000))}).encode()
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("zstd;q=0, gzip", "gzip"),
+        ("*", "zstd"),
+        ("*;q=0, gzip", "gzip"),
+        ("identity", None),
+        ("gzip;q=invalid", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None) -> None:
+    """Test that the accepted encoding with the highest quality is chosen, ties broken by preference."""
+    assert negotiate_encoding(accept_encoding, ["zstd", "br", "gzip"]) == expected
+
+
+def _app(settings: CompressionSettings) -> tuple[CompressionMiddleware, TestClient]:
+    app = FastAPI()
+
+    @app.get("/static")
+    def static(request: Request) -> Response:
+        if '"v1"' in {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}:
+            return Response(status_code=304, headers={"ETag": '"v1"'})
+        return Response(PAYLOAD, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/dynamic")
+    def dynamic() -> Response:
+        return Response(PAYLOAD, media_type="application/json")
+
+    @app.get("/small")
+    def small() -> Response:
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/image")
+    def image() -> Response:
+        return Response(PAYLOAD, media_type="image/png")
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        def chunks() -> Iterator[bytes]:
+            for i in range(0, len(PAYLOAD), 1000):
+                yield PAYLOAD[i : i + 1000]
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    middleware = CompressionMiddleware(app, settings)
+    return middleware, TestClient(middleware)
+
+
+def test_compression_middleware_compresses_by_negotiation() -> None:
+    """Test that large compressible bodies are compressed, streamed bodies chunk by chunk."""
+    _, client = _app(CompressionSettings(minimum_size=100))
+
+    response = client.get("/dynamic", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(PAYLOAD)
+    assert response.content == PAYLOAD
+
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content == PAYLOAD
+
+    for path, encoding in (("/dynamic", "identity"), ("/small", "gzip"), ("/image", "gzip")):
+        response = client.get(path, headers={"Accept-Encoding": encoding})
+        assert "content-encoding" not in response.headers
+
+
+def test_compression_middleware_flushes_each_streamed_chunk() -> None:
+    """Test that each chunk of a streamed body can be decompressed as soon as it is sent, e.g. server-sent events."""
+    events = [f"data: {i}{'x' * 500}\n\n".encode() for i in range(3)]
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/event-stream")]})
+        for i, event in enumerate(events):
+            await send({"type": "http.response.body", "body": event, "more_body": i < len(events) - 1})
+
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    middleware = CompressionMiddleware(app, CompressionSettings())
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(middleware(scope, receive=None, send=send))  # type: ignore[arg-type]
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    chunks = [message["body"] for message in sent if message["type"] == "http.response.body"]
+    assert [decompressor.decompress(chunk) for chunk in chunks] == events
+
+
+def test_compression_middleware_caches_static_payloads() -> None:
+    """Test that compressed variants of responses with an ETag are cached by content."""
+    middleware, client = _app(CompressionSettings(minimum_size=100, cache_size=1))
+
+    for _ in range(2):
+        response = client.get("/static", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == PAYLOAD
+    client.get("/dynamic", headers={"Accept-Encoding": "gzip"})
+
+    assert len(middleware._cache) == 1
+    assert gzip.decompress(next(iter(middleware._cache.values()))) == PAYLOAD
+
+
+def test_compression_middleware_gives_encoded_variants_their_own_etag() -> None:
+    """Test that compressed variants get an ETag suffixed by the encoding, which the app can revalidate."""
+    _, client = _app(CompressionSettings(minimum_size=100))
+
+    assert client.get("/static", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"v1"'
+    response = client.get("/static", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["etag"] == '"v1-gzip"'
+
+    response = client.get("/static", headers={"Accept-Encoding": "gzip", "If-None-Match": '"v1-gzip"'})
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"v1-gzip"'
+    response = client.get("/static", headers={"Accept-Encoding": "gzip", "If-None-Match": '"v1"'})
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"v1"'
+
+
+def test_api_compresses_openapi_schema() -> None:
+    """Test that the API compresses its OpenAPI schemas."""
+    response = TestClient(api).get("/api/v1/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "openapi" in response.json()
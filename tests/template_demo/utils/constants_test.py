@@ -0,0 +1,36 @@
+"""Tests for constants derived from package metadata."""
+
+import sys
+import types
+from importlib import metadata
+from unittest import mock
+
+from template_demo.utils import _constants
+from template_demo.utils._constants import _package_metadata, _PackageMetadata
+
+
+def test_package_metadata_from_distribution_matches_importlib() -> None:
+    """Test that the one-pass snapshot agrees with the individual importlib.metadata lookups."""
+    snapshot = _PackageMetadata.from_distribution("template_demo")
+
+    assert snapshot.version == metadata.version("template_demo")
+    assert snapshot.author_email == _constants.__author_email__
+    assert snapshot.urls["Source"] == _constants.__repository_url__
+    assert _constants.get_project_url_by_label("Documentation") == snapshot.urls["Documentation"]
+    assert not _constants.get_project_url_by_label("Unknown")
+
+
+def test_package_metadata_prefers_generated_snapshot() -> None:
+    """Test that a snapshot generated at build time is used instead of reading the dist-info."""
+    generated = types.ModuleType("template_demo.utils._metadata_snapshot")
+    generated.SNAPSHOT = {"version": "9.9.9", "author_name": None, "author_email": None, "urls": {}}  # type: ignore[attr-defined]
+    _package_metadata.cache_clear()
+    try:
+        with (
+            mock.patch.dict(sys.modules, {generated.__name__: generated}),
+            mock.patch.object(_PackageMetadata, "from_distribution") as from_distribution,
+        ):
+            assert _package_metadata() == _PackageMetadata(version="9.9.9")
+        from_distribution.assert_not_called()
+    finally:
+        _package_metadata.cache_clear()
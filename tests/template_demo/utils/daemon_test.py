@@ -0,0 +1,82 @@
+"""Tests for the CLI daemon and its thin client."""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from template_demo.utils import DaemonSettings, daemon_request, is_daemon_supported, start_daemon
+from template_demo.utils._daemon import recv_message, send_message
+
+pytestmark = pytest.mark.skipif(not is_daemon_supported(), reason="Daemon requires Unix domain sockets and fork")
+
+CLIENT = [sys.executable, "-c", "import template_demo_client; template_demo_client.main()"]
+
+
+@pytest.fixture
+def socket_path() -> Generator[Path, None, None]:
+    """Provide a socket path short enough for Unix domain sockets, stopping any daemon listening on it.
+
+    Yields:
+        Path: The socket path.
+    """
+    directory = Path(tempfile.mkdtemp(prefix="td-"))
+    path = directory / "daemon.sock"
+    yield path
+    daemon_request({"type": "stop"}, path)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_daemon_messages_pass_file_descriptors() -> None:
+    """Test that messages are framed by length and carry file descriptors."""
+    left, right = socket.socketpair()
+    read_fd, write_fd = os.pipe()
+    with left, right:
+        send_message(left, {"type": "run", "argv": ["template-demo"] * 1000}, [write_fd])
+        message, fds = recv_message(right)
+    os.close(write_fd)
+
+    assert message == {"type": "run", "argv": ["template-demo"] * 1000}
+    assert len(fds) == 1
+    os.write(fds[0], b"passed")
+    os.close(fds[0])
+    assert os.read(read_fd, 6) == b"passed"
+    os.close(read_fd)
+
+
+def test_daemon_serves_client_invocations(socket_path: Path) -> None:
+    """Test that the client forwards argv, env and stdio, and receives the exit code."""
+    status = start_daemon(DaemonSettings(socket_path=socket_path, start_timeout=30))
+    assert status["requests"] == 0
+    env = {**os.environ, "TEMPLATE_DEMO_DAEMON_SOCKET_PATH": str(socket_path)}
+
+    result = subprocess.run([*CLIENT, "hello", "world"], capture_output=True, text=True, env=env, check=False)
+    assert result.returncode == 0
+    assert "Hello, world!" in result.stdout
+
+    result = subprocess.run([*CLIENT, "hello", "unknown"], capture_output=True, text=True, env=env, check=False)
+    assert result.returncode == 2
+    assert "No such command" in result.stderr
+
+    status = daemon_request({"type": "status"}, socket_path)
+    assert status is not None
+    assert status["requests"] == 2
+    assert status["pid"] != os.getpid()
+
+    assert daemon_request({"type": "stop"}, socket_path) == {"stopping": True}
+
+
+def test_client_falls_back_to_in_process_without_daemon(socket_path: Path) -> None:
+    """Test that the client runs the CLI itself if no daemon is listening."""
+    env = {**os.environ, "TEMPLATE_DEMO_DAEMON_SOCKET_PATH": str(socket_path)}
+
+    result = subprocess.run([*CLIENT, "hello", "world"], capture_output=True, text=True, env=env, check=False)
+
+    assert result.returncode == 0
+    assert "Hello, world!" in result.stdout
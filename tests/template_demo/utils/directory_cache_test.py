@@ -0,0 +1,107 @@
+"""Tests for the directory cache."""
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from template_demo.utils._directory_cache import DirectoryCache
+
+
+class _Loader:
+    """Lists a directory, counting calls."""
+
+    def __init__(self) -> None:
+        """Initialize the loader."""
+        self.calls = 0
+
+    def __call__(self, path: Path) -> list[str]:
+        """List a directory.
+
+        Args:
+            path: The directory.
+
+        Returns:
+            list[str]: Sorted names of the entries.
+        """
+        self.calls += 1
+        return sorted(entry.name for entry in path.iterdir())
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is available on Linux only")
+def test_directory_cache_invalidates_on_inotify_events(tmp_path: Path) -> None:
+    """Test that values are reused until entries of the directory are created, moved or deleted."""
+    cache: DirectoryCache[list[str]] = DirectoryCache(capacity=4)
+    load = _Loader()
+    (tmp_path / "a").touch()
+
+    assert cache.get(tmp_path, load) == ["a"]
+    assert cache.get(tmp_path, load) == ["a"]
+    assert load.calls == 1
+
+    (tmp_path / "a").rename(tmp_path / "b")
+    assert cache.get(tmp_path, load) == ["b"]
+    (tmp_path / "b").unlink()
+    assert cache.get(tmp_path, load) == []
+    assert cache.get(tmp_path, load) == []
+    assert load.calls == 3
+    cache.clear()
+
+
+def test_directory_cache_falls_back_to_modification_time(tmp_path: Path) -> None:
+    """Test that values are validated by the modification time of the directory without inotify."""
+    cache: DirectoryCache[list[str]] = DirectoryCache(capacity=4)
+    cache._inotify_available = False
+    load = _Loader()
+    past = time.time() - 60
+    os.utime(tmp_path, (past, past))
+
+    assert cache.get(tmp_path, load) == []
+    assert cache.get(tmp_path, load) == []
+    assert load.calls == 1
+
+    (tmp_path / "a").touch()
+    assert cache.get(tmp_path, load) == ["a"]
+    assert load.calls == 2
+    # Recently modified, so not cached as further changes may not change the modification time
+    assert cache.get(tmp_path, load) == ["a"]
+    assert load.calls == 3
+
+
+def test_directory_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test that the least recently used directory is evicted, and no longer watched."""
+    cache: DirectoryCache[list[str]] = DirectoryCache(capacity=2)
+    load = _Loader()
+    directories = [tmp_path / name for name in ("a", "b", "c")]
+    for directory in directories:
+        directory.mkdir()
+        os.utime(directory, (time.time() - 60, time.time() - 60))
+
+    cache.get(directories[0], load)
+    cache.get(directories[1], load)
+    cache.get(directories[0], load)
+    cache.get(directories[2], load)
+    assert len(cache) == 2
+    assert load.calls == 3
+    cache.get(directories[0], load)
+    assert load.calls == 3
+    cache.get(directories[1], load)
+    assert load.calls == 4
+    assert len(cache._paths) <= 2
+    cache.clear()
+    assert len(cache) == 0
+    assert cache._paths == {}
+
+
+def test_directory_cache_does_not_cache_failed_loads(tmp_path: Path) -> None:
+    """Test that errors of loading propagate and nothing is cached or watched."""
+    cache: DirectoryCache[list[str]] = DirectoryCache(capacity=2)
+    load = mock.Mock(side_effect=PermissionError("denied"))
+
+    with pytest.raises(PermissionError):
+        cache.get(tmp_path, load)
+    assert len(cache) == 0
+    assert cache._paths == {}
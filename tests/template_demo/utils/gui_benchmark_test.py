@@ -0,0 +1,54 @@
+"""Benchmarks quantifying the cost of listing large directories in the local file picker."""
+
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from template_demo.utils._gui import _directory_cache, _list_directory, _scan_directory
+
+NUMBER_OF_FILES = 100_000
+NUMBER_OF_DIRECTORIES = 1_000
+
+
+def _list_directory_with_glob(path: Path) -> list[tuple[str, str, bool]]:
+    """List a directory like the file picker did before switching to os.scandir.
+
+    Args:
+        path: The directory.
+
+    Returns:
+        list[tuple[str, str, bool]]: Name, path and whether the entry is a directory.
+    """
+    paths = [p for p in path.glob("*") if not p.name.startswith(".")]
+    paths.sort(key=lambda p: p.name.lower())
+    paths.sort(key=lambda p: not p.is_dir())
+    return [(p.name, str(p), p.is_dir()) for p in paths]
+
+
+@pytest.mark.long_running
+@pytest.mark.benchmark
+def test_benchmark_list_large_directory(tmp_path: Path, record_property: Callable[[str, object], None]) -> None:
+    """Quantify listing a synthetic directory with many files, via glob, via os.scandir, and from the cache."""
+    for i in range(NUMBER_OF_FILES):
+        (tmp_path / f"file_{i}.txt").touch()
+    for i in range(NUMBER_OF_DIRECTORIES):
+        (tmp_path / f"dir_{i}").mkdir()
+
+    assert [tuple(entry) for entry in _scan_directory(tmp_path)] == _list_directory_with_glob(tmp_path)
+    with_glob = min(timeit.repeat(lambda: _list_directory_with_glob(tmp_path), number=1, repeat=3))
+    with_scandir = min(timeit.repeat(lambda: _scan_directory(tmp_path), number=1, repeat=3))
+    _list_directory(tmp_path)
+    revisit = min(timeit.repeat(lambda: _list_directory(tmp_path), number=1, repeat=3))
+    _directory_cache.clear()
+
+    record_property("glob_ms", round(with_glob * 1e3, 3))
+    record_property("scandir_ms", round(with_scandir * 1e3, 3))
+    record_property("revisit_ms", round(revisit * 1e3, 3))
+    print(  # noqa: T201
+        f"{NUMBER_OF_FILES} files: glob {with_glob * 1e3:.1f}ms, scandir {with_scandir * 1e3:.1f}ms, "
+        f"revisit {revisit * 1e3:.1f}ms"
+    )
+    assert with_scandir < with_glob
+    assert revisit < with_scandir
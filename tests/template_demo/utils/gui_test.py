@@ -1,5 +1,6 @@
 """Tests for GUI module."""
 
+from pathlib import Path
 from unittest import mock
 
 import pytest
@@ -7,6 +8,7 @@ import pytest
 from template_demo.utils._constants import __project_name__
 from template_demo.utils._gui import (
     BasePageBuilder,
+    _list_directory,
     gui_register_pages,
     gui_run,
 )
@@ -141,3 +143,23 @@ def test_gui_run_with_api(
         mock_app.mount.assert_called_once_with("/api", mock_api)
         mock_register_pages.assert_called_once()
         mock_ui.run.assert_called_once()
+
+
+def test_list_directory_sorts_directories_first(tmp_path: Path) -> None:
+    """Test that directories are listed first, then files, each by case-insensitive name.
+
+    Args:
+        tmp_path: Temporary directory
+    """
+    for name in ("b.txt", "A.txt", ".hidden"):
+        (tmp_path / name).touch()
+    for name in ("z", "Y"):
+        (tmp_path / name).mkdir()
+
+    entries = _list_directory(tmp_path)
+
+    assert [entry.name for entry in entries] == ["Y", "z", "A.txt", "b.txt"]
+    assert [entry.is_dir for entry in entries] == [True, True, False, False]
+    assert entries[0].path == str(tmp_path / "Y")
+    assert ".hidden" in [entry.name for entry in _list_directory(tmp_path, show_hidden_files=True)]
+    assert _list_directory(tmp_path / "missing") == []
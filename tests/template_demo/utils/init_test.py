@@ -0,0 +1,49 @@
+"""Tests for lazy exports of the utilities module."""
+
+import os
+import subprocess
+import sys
+from importlib.metadata import entry_points
+
+import pytest
+
+import template_demo.utils
+
+
+def test_lazy_exports_resolve() -> None:
+    """Test that all exported symbols resolve and are listed by dir."""
+    for name in template_demo.utils.__all__:
+        getattr(template_demo.utils, name)
+    assert set(template_demo.utils.__all__) <= set(dir(template_demo.utils))
+
+
+def test_unknown_attribute_raises() -> None:
+    """Test that accessing a symbol not exported raises AttributeError."""
+    with pytest.raises(AttributeError, match="has no attribute 'does_not_exist'"):
+        template_demo.utils.does_not_exist  # noqa: B018
+
+
+@pytest.mark.parametrize("disable_pydantic_plugins", [False, True])
+def test_library_use_does_not_import_observability_stack(disable_pydantic_plugins: bool) -> None:
+    """Test that using the hello service as a library imports neither Sentry nor Logfire.
+
+    Known exception: pydantic loads its plugins on definition of the first model, and loading the logfire plugin,
+    installed along with logfire, imports logfire. Without plugins, neither is imported.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("TEMPLATE_DEMO_LOGFIRE_", "TEMPLATE_DEMO_SENTRY_", "PYDANTIC_DISABLE_PLUGINS"))
+    }
+    if disable_pydantic_plugins:
+        env["PYDANTIC_DISABLE_PLUGINS"] = "__all__"
+    script = (
+        "import sys\n"
+        "from template_demo.hello import Service\n"
+        "Service().get_hello_world()\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'logfire', 'sentry_sdk'}))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, env=env, text=True)
+    logfire_plugin = "logfire-plugin" in {entry_point.name for entry_point in entry_points(group="pydantic")}
+    expected = ["logfire"] if logfire_plugin and not disable_pydantic_plugins else []
+    assert result.stdout.strip().splitlines()[-1] == str(expected)
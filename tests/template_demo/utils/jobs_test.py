@@ -0,0 +1,95 @@
+"""Tests for background jobs."""
+
+import threading
+
+import pytest
+
+from template_demo.utils import JobQueue, JobQueueFullError, JobSettings, JobStatus
+
+
+def test_jobs_in_flight_and_recent_results_are_shared() -> None:
+    """Test that equivalent jobs share the job in flight, and its result for reuse_for seconds."""
+    queue = JobQueue("test", JobSettings(max_workers=1))
+    release = threading.Event()
+    calls = []
+
+    def work(value: int) -> int:
+        calls.append(value)
+        release.wait(5)
+        return value * 2
+
+    try:
+        job = queue.submit("key", work, 21, reuse_for=60)
+        assert queue.submit("key", work, 21, reuse_for=60) is job
+        release.set()
+        job.future.result(5)
+
+        assert queue.submit("key", work, 21, reuse_for=60) is job
+        rerun = queue.submit("key", work, 21)
+        assert rerun is not job
+        assert rerun.future.result(5) == 42
+        assert queue.get(job.id) is job
+        status = job.status()
+        assert status.state == JobStatus.State.SUCCEEDED
+        assert status.result == 42
+        assert status.finished_at is not None
+    finally:
+        queue.shutdown()
+    assert calls == [21, 21]
+
+
+def test_failed_jobs_are_reported_and_not_reused() -> None:
+    """Test that failed jobs report their error, and equivalent jobs submitted afterwards run again."""
+    queue = JobQueue("test", JobSettings())
+    try:
+        job = queue.submit("key", lambda: 1 / 0, reuse_for=60)
+        job.future.exception(5)
+        status = job.status()
+        assert status.state == JobStatus.State.FAILED
+        assert "ZeroDivisionError" in str(status.error)
+        assert queue.submit("key", lambda: 1, reuse_for=60) is not job
+    finally:
+        queue.shutdown()
+
+
+def test_submission_is_rejected_when_too_many_jobs_are_pending() -> None:
+    """Test that jobs beyond the workers and pending limit are rejected."""
+    queue = JobQueue("test", JobSettings(max_workers=1, max_pending=1))
+    release = threading.Event()
+    try:
+        running = queue.submit("running", release.wait, 5)
+        while not running.future.running():
+            release.wait(0.01)
+        queue.submit("pending", release.wait, 5)
+        with pytest.raises(JobQueueFullError):
+            queue.submit("rejected", release.wait, 5)
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_finished_jobs_are_forgotten_after_result_ttl() -> None:
+    """Test that finished jobs cannot be retrieved once their result expired."""
+    queue = JobQueue("test", JobSettings(result_ttl=0.01))
+    try:
+        job = queue.submit("key", lambda: 1)
+        job.future.result(5)
+        threading.Event().wait(0.05)
+        assert queue.get(job.id) is None
+    finally:
+        queue.shutdown()
+
+
+async def test_wait_long_polls_without_cancelling() -> None:
+    """Test that waiting for a job times out without cancelling it, and returns once it finished."""
+    queue = JobQueue("test", JobSettings())
+    release = threading.Event()
+    try:
+        job = queue.submit("key", release.wait, 5)
+        assert not await job.wait(0.05)
+        release.set()
+        assert await job.wait(5)
+        assert job.status().state == JobStatus.State.SUCCEEDED
+    finally:
+        release.set()
+        queue.shutdown()
@@ -1,13 +1,33 @@
 """Tests for logging configuration and utilities."""
 
+import gzip
+import json
+import logging
+import sys
 import tempfile
 from pathlib import Path
+from queue import Queue
 from unittest import mock
 
 import pytest
 
 from template_demo.utils import get_logger
-from template_demo.utils._log import _validate_file_name, logging_initialize
+from template_demo.utils._log import (
+    LogSettings,
+    RateLimitingFilter,
+    _BatchingFileHandler,
+    _BatchingRotatingFileHandler,
+    _JSONFormatter,
+    _LogFileCompressor,
+    _LogQueueHandler,
+    _stop_queue_listener,
+    _TextFormatter,
+    _validate_file_compression,
+    _validate_file_name,
+    _wait_for_log_compression,
+    get_log_queue_stats,
+    logging_initialize,
+)
 
 log = get_logger(__name__)
 
@@ -116,6 +136,11 @@ def test_logging_initialize_with_defaults() -> None:
         mock_settings.file_enabled = False
         mock_settings.console_enabled = False
         mock_settings.level = "INFO"
+        mock_settings.filter_sample_rate_debug = 1.0
+        mock_settings.filter_sample_rate_info = 1.0
+        mock_settings.filter_rate_limit = 0
+        mock_settings.filter_dedup_window = 0
+        mock_settings.filter_report_interval = 60
         mock_load_settings.return_value = mock_settings
 
         # Call the function
@@ -126,3 +151,278 @@ def test_logging_initialize_with_defaults() -> None:
         call_kwargs = mock_basic_config.call_args.kwargs
         assert call_kwargs["level"] == "INFO"
         assert call_kwargs["handlers"] == []
+
+
+def test_log_queue_handler_drops_records_if_queue_full() -> None:
+    """Test that the queue handler drops and counts records instead of blocking if the queue is full."""
+    handler = _LogQueueHandler(Queue(maxsize=1), block_on_overflow=False)
+    for i in range(3):
+        handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "message %s", (i,), None))
+
+    assert handler.enqueued == 1
+    assert handler.overflowed == 2
+    assert handler.dropped == 2
+    assert handler.queue.get_nowait().getMessage() == "message 0"
+
+
+def test_log_queue_handler_keeps_exc_info() -> None:
+    """Test that prepared records keep exc_info, so downstream handlers can render tracebacks."""
+    handler = _LogQueueHandler(Queue(), block_on_overflow=False)
+    try:
+        _ = 1 / 0
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed %s", ("here",), exc_info)
+
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "failed here"
+    assert prepared.args is None
+    assert prepared.exc_info is exc_info
+    assert record.args == ("here",)
+
+
+def test_batching_file_handler_flushes_per_batch() -> None:
+    """Test that the batching file handler only flushes once a batch is complete."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = Path(temp_dir) / "test.log"
+        handler = _BatchingFileHandler(str(log_file), batch_size=3, flush_interval=3600)
+        try:
+            for i in range(2):
+                handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, f"message {i}", None, None))
+            assert not log_file.read_text(encoding="utf-8")
+
+            handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "message 2", None, None))
+            assert log_file.read_text(encoding="utf-8").splitlines() == ["message 0", "message 1", "message 2"]
+
+            handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "message 3", None, None))
+            handler.flush()
+            assert log_file.read_text(encoding="utf-8").splitlines()[-1] == "message 3"
+        finally:
+            handler.close()
+
+
+def test_logging_initialize_with_queue() -> None:
+    """Test that logging_initialize attaches a queue handler feeding the file handler on a background thread."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = Path(temp_dir) / "test.log"
+        with (
+            mock.patch("template_demo.utils._log.load_settings") as mock_load_settings,
+            mock.patch("logging.basicConfig") as mock_basic_config,
+        ):
+            mock_settings = mock.MagicMock()
+            mock_settings.file_enabled = True
+            mock_settings.file_name = str(log_file)
+            mock_settings.file_flush_batch_size = 100
+            mock_settings.file_flush_interval = 3600
+            mock_settings.file_format = "text"
+            mock_settings.file_rotation = "none"
+            mock_settings.console_enabled = False
+            mock_settings.queue_enabled = True
+            mock_settings.queue_size = 10
+            mock_settings.queue_overflow = "drop"
+            mock_settings.level = "INFO"
+            mock_settings.filter_sample_rate_debug = 1.0
+            mock_settings.filter_sample_rate_info = 1.0
+            mock_settings.filter_rate_limit = 0
+            mock_settings.filter_dedup_window = 0
+            mock_settings.filter_report_interval = 60
+            mock_load_settings.return_value = mock_settings
+
+            logging_initialize()
+
+        try:
+            handlers = mock_basic_config.call_args.kwargs["handlers"]
+            assert len(handlers) == 1
+            queue_handler = handlers[0]
+            assert isinstance(queue_handler, _LogQueueHandler)
+
+            queue_handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "queued message", None, None))
+            assert get_log_queue_stats()["enqueued"] == 1
+        finally:
+            _stop_queue_listener()
+
+        assert "queued message" in log_file.read_text(encoding="utf-8")
+
+
+def test_logging_initialize_detaches_handlers_of_previous_initialization() -> None:
+    """Test that initializing again detaches the queue handler of the stopped listener from the root logger."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root_logger = logging.getLogger()
+        with (
+            mock.patch("template_demo.utils._log.load_settings") as mock_load_settings,
+            mock.patch(
+                "logging.basicConfig", side_effect=lambda **kwargs: root_logger.addHandler(kwargs["handlers"][0])
+            ),
+        ):
+            mock_settings = mock.MagicMock()
+            mock_settings.file_enabled = True
+            mock_settings.file_name = str(Path(temp_dir) / "test.log")
+            mock_settings.file_flush_batch_size = 100
+            mock_settings.file_flush_interval = 3600
+            mock_settings.file_format = "text"
+            mock_settings.file_rotation = "none"
+            mock_settings.console_enabled = False
+            mock_settings.queue_enabled = True
+            mock_settings.queue_size = 10
+            mock_settings.queue_overflow = "drop"
+            mock_settings.level = "INFO"
+            mock_settings.filter_sample_rate_debug = 1.0
+            mock_settings.filter_sample_rate_info = 1.0
+            mock_settings.filter_rate_limit = 0
+            mock_settings.filter_dedup_window = 0
+            mock_settings.filter_report_interval = 60
+            mock_load_settings.return_value = mock_settings
+
+            try:
+                logging_initialize()
+                first = [handler for handler in root_logger.handlers if isinstance(handler, _LogQueueHandler)]
+                logging_initialize()
+                second = [handler for handler in root_logger.handlers if isinstance(handler, _LogQueueHandler)]
+            finally:
+                _stop_queue_listener()
+                for handler in root_logger.handlers[:]:
+                    if isinstance(handler, _LogQueueHandler):
+                        root_logger.removeHandler(handler)
+
+        assert len(first) == 1
+        assert len(second) == 1
+        assert second[0] is not first[0]
+
+
+def test_text_formatter_matches_format_string() -> None:
+    """Test that the precompiled text formatter renders the same line as the equivalent format string."""
+    record = logging.LogRecord("test", logging.WARNING, __file__, 1, "value is %d", (42,), None)
+    expected = logging.Formatter(
+        fmt="%(asctime)s %(process)d %(levelname)s %(name)s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    ).format(record)
+
+    assert _TextFormatter().format(record) == expected
+
+
+def test_json_formatter_renders_compact_json_lines() -> None:
+    """Test that the JSON formatter renders one compact JSON object per record, including exceptions."""
+    try:
+        _ = 1 / 0
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed with %s", ("ünïcode",), exc_info)
+
+    line = _JSONFormatter().format(record)
+
+    assert "\n" not in line
+    assert ", " not in line.split('"exception"')[0]
+    data = json.loads(line)
+    assert data["level"] == "ERROR"
+    assert data["logger"] == "test"
+    assert data["message"] == "failed with ünïcode"
+    assert "ZeroDivisionError" in data["exception"]
+
+
+def test_validate_file_compression() -> None:
+    """Test that zstd compression is rejected if not available."""
+    assert _validate_file_compression("gzip") == "gzip"
+    with (
+        mock.patch("template_demo.utils._log._is_zstd_available", return_value=False),
+        pytest.raises(ValueError, match=r"zstd compression requires"),
+    ):
+        _validate_file_compression("zstd")
+
+
+def test_rotating_file_handler_compresses_rotated_files() -> None:
+    """Test that size based rotation compresses rotated log files with gzip in the background."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_file = Path(temp_dir) / "test.log"
+        handler = _BatchingRotatingFileHandler(
+            str(log_file), maxBytes=100, backupCount=2, batch_size=1, flush_interval=0
+        )
+        compressor = _LogFileCompressor("gzip")
+        handler.namer = compressor.namer
+        handler.rotator = compressor.rotator
+        handler.setFormatter(_TextFormatter())
+        try:
+            for i in range(10):
+                handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, f"message {i:02d}", None, None))
+        finally:
+            handler.close()
+        _wait_for_log_compression()
+
+        rotated = sorted(path.name for path in Path(temp_dir).iterdir())
+        assert rotated == ["test.log", "test.log.1.gz", "test.log.2.gz"]
+        with gzip.open(Path(temp_dir) / "test.log.1.gz", "rt", encoding="utf-8") as f:
+            assert "message" in f.read()
+
+
+def _record(name: str = "test", level: int = logging.INFO, msg: str = "message") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+def test_rate_limiting_filter_passes_all_records_by_default() -> None:
+    """Test that sampling, rate limiting and deduplication are all opt-in."""
+    log_filter = RateLimitingFilter(LogSettings.model_construct())
+
+    assert all(log_filter.filter(_record(msg="same")) for _ in range(2000))
+
+
+def test_rate_limiting_filter_samples_debug_and_info() -> None:
+    """Test that DEBUG and INFO records are sampled, while warnings and errors always pass."""
+    log_filter = RateLimitingFilter(
+        LogSettings.model_construct(filter_sample_rate_debug=0.0, filter_sample_rate_info=0.0, filter_rate_limit=0)
+    )
+
+    assert log_filter.filter(_record(level=logging.DEBUG)) is False
+    assert log_filter.filter(_record(level=logging.INFO)) is False
+    assert log_filter.filter(_record(level=logging.WARNING)) is True
+    assert log_filter.filter(_record(level=logging.ERROR)) is True
+
+
+def test_rate_limiting_filter_limits_per_logger() -> None:
+    """Test that each logger is rate limited separately, but errors are never rate limited."""
+    log_filter = RateLimitingFilter(
+        LogSettings.model_construct(filter_rate_limit=0.001, filter_rate_limit_burst=2, filter_report_interval=3600)
+    )
+
+    assert [log_filter.filter(_record("chatty")) for _ in range(4)] == [True, True, False, False]
+    assert log_filter.filter(_record("quiet")) is True
+    assert log_filter.filter(_record("chatty", level=logging.ERROR)) is True
+
+
+def test_rate_limiting_filter_deduplicates_within_window() -> None:
+    """Test that identical records are suppressed within the deduplication window."""
+    log_filter = RateLimitingFilter(
+        LogSettings.model_construct(filter_rate_limit=0, filter_dedup_window=3600, filter_report_interval=3600)
+    )
+
+    assert log_filter.filter(_record(msg="same")) is True
+    assert log_filter.filter(_record(msg="same")) is False
+    assert log_filter.filter(_record(msg="different")) is True
+    assert log_filter.filter(_record(level=logging.WARNING, msg="same")) is True
+
+
+def test_rate_limiting_filter_judges_record_once() -> None:
+    """Test that a record passing several handlers is judged only once."""
+    log_filter = RateLimitingFilter(
+        LogSettings.model_construct(filter_rate_limit=0.001, filter_rate_limit_burst=1, filter_report_interval=3600)
+    )
+    record = _record()
+
+    assert log_filter.filter(record) is True
+    assert log_filter.filter(record) is True
+    assert log_filter.filter(_record()) is False
+
+
+def test_rate_limiting_filter_reports_suppressed_records(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that counts of suppressed records are reported periodically."""
+    log_filter = RateLimitingFilter(
+        LogSettings.model_construct(filter_rate_limit=0, filter_dedup_window=3600, filter_report_interval=60)
+    )
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            log_filter.filter(_record("chatty", msg="same"))
+        log_filter._last_report -= 60
+        log_filter.filter(_record("chatty", msg="other"))
+
+    reports = [record.getMessage() for record in caplog.records if "Suppressed" in record.getMessage()]
+    assert reports == ["Suppressed 2 log records in the last 60 seconds: chatty (duplicate): 2"]
@@ -0,0 +1,92 @@
+"""Tests for Logfire integration."""
+
+import os
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+
+from template_demo.utils import LogfireSettings
+from template_demo.utils._logfire import _auto_tracing_filter, logfire_initialize
+
+
+@pytest.fixture
+def mock_environment() -> Generator[None, None, None]:
+    """Fixture to set up the environment for testing."""
+    with mock.patch.dict(os.environ, {}, clear=True):
+        yield
+
+
+def _module(name: str) -> mock.Mock:
+    module = mock.Mock()
+    module.name = name
+    module.parts_start_with.side_effect = lambda prefixes: any(
+        name == prefix or name.startswith(f"{prefix}.") for prefix in prefixes
+    )
+    return module
+
+
+def test_auto_tracing_filter_includes_submodules_and_honors_excludes() -> None:
+    """Test that module prefixes match submodules and excludes take precedence."""
+    should_trace = _auto_tracing_filter(include=["template_demo.hello"], exclude=["template_demo.hello._gui"])
+
+    assert should_trace(_module("template_demo.hello"))
+    assert should_trace(_module("template_demo.hello._service"))
+    assert not should_trace(_module("template_demo.hello._gui"))
+    assert not should_trace(_module("template_demo.system._service"))
+    assert not should_trace(_module("template_demo.hello_world"))
+
+
+def test_auto_tracing_filter_with_empty_include_traces_nothing() -> None:
+    """Test that an empty include list disables auto-tracing."""
+    assert not _auto_tracing_filter(include=[], exclude=[])(_module("template_demo.hello"))
+
+
+def test_logfire_initialize_without_token(mock_environment: None) -> None:
+    """Test that logfire is not configured without token."""
+    with mock.patch("logfire.configure") as mock_configure:
+        assert logfire_initialize(["template_demo.hello"]) is False
+        mock_configure.assert_not_called()
+
+
+def test_logfire_initialize_applies_settings(mock_environment: None) -> None:
+    """Test that tracing threshold, modules, sampling and batching are taken from the settings."""
+    settings = LogfireSettings.model_validate({
+        "token": "token",
+        "auto_tracing_min_duration": 0.05,
+        "auto_tracing_exclude_modules": ["template_demo.hello._gui"],
+        "sampling_ratio": 0.25,
+        "batch_schedule_delay_millis": 2000,
+    })
+    with (
+        mock.patch("template_demo.utils._logfire.load_settings", return_value=settings),
+        mock.patch("logfire.configure") as mock_configure,
+        mock.patch("logfire.instrument_pydantic"),
+        mock.patch("logfire.install_auto_tracing") as mock_install_auto_tracing,
+    ):
+        assert logfire_initialize(["template_demo.hello"]) is True
+
+        assert mock_configure.call_args.kwargs["sampling"].head == pytest.approx(0.25)
+        assert os.environ["OTEL_BSP_SCHEDULE_DELAY"] == "2000"
+        assert os.environ["OTEL_BSP_MAX_QUEUE_SIZE"] == "2048"
+        assert mock_install_auto_tracing.call_args.kwargs["min_duration"] == pytest.approx(0.05)
+        should_trace = mock_install_auto_tracing.call_args.kwargs["modules"]
+        assert should_trace(_module("template_demo.hello._service"))
+        assert not should_trace(_module("template_demo.hello._gui"))
+
+
+def test_logfire_initialize_keeps_explicit_batching_environment(mock_environment: None) -> None:
+    """Test that OTEL_BSP_* variables set explicitly take precedence over settings."""
+    os.environ["OTEL_BSP_SCHEDULE_DELAY"] = "100"
+    with (
+        mock.patch(
+            "template_demo.utils._logfire.load_settings",
+            return_value=LogfireSettings.model_validate({"token": "token", "batch_schedule_delay_millis": 2000}),
+        ),
+        mock.patch("logfire.configure"),
+        mock.patch("logfire.instrument_pydantic"),
+        mock.patch("logfire.install_auto_tracing"),
+    ):
+        logfire_initialize(["template_demo.hello"])
+
+    assert os.environ["OTEL_BSP_SCHEDULE_DELAY"] == "100"
@@ -0,0 +1,64 @@
+"""Tests for OpenAPI documents served pre-serialized."""
+
+import gzip
+import json
+import time
+from pathlib import Path
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from template_demo.api import api, create_version_app
+from template_demo.constants import API_VERSIONS
+from template_demo.utils import CachedOpenAPI, load_openapi_snapshot
+from template_demo.utils._openapi import write_openapi_snapshot
+
+OPENAPI_PATH_V1 = "/api/v1/openapi.json"
+
+
+def test_openapi_served_pre_compressed_with_etag() -> None:
+    """Test that the schema is served like FastAPI does, pre-compressed and revalidated via ETag."""
+    client = TestClient(api)
+
+    response = client.get(OPENAPI_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {**create_version_app("v1").openapi(), "servers": [{"url": "/api/v1"}]}
+    etag = response.headers["etag"]
+
+    response = client.get(OPENAPI_PATH_V1, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.get(OPENAPI_PATH_V1, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] != etag
+
+
+def test_openapi_snapshot_is_read_instead_of_generating(tmp_path: Path) -> None:
+    """Test that snapshots round-trip the schemas, and are served instead of generating the schema."""
+    write_openapi_snapshot(tmp_path)
+    with mock.patch("template_demo.utils._openapi.OPENAPI_SNAPSHOT_DIR", tmp_path):
+        assert load_openapi_snapshot("v1") == create_version_app("v1").openapi()
+        assert load_openapi_snapshot("v0") is None
+
+        app = FastAPI()
+        cached = CachedOpenAPI(app, "v1")
+        response = TestClient(app).get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.json()["paths"] == create_version_app("v1").openapi()["paths"]
+    assert gzip.decompress(cached.document("").variants["gzip"]) == cached.document("").variants["identity"]
+    assert [route.path for route in app.routes].count("/openapi.json") == 1  # type: ignore[attr-defined]
+
+
+def test_openapi_generated_in_background_on_startup() -> None:
+    """Test that the documents of all API versions are generated on startup."""
+    with TestClient(api):
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and not all(
+            f"/api/{version}" in cached._documents for version, cached in api.state.cached_openapi.items()
+        ):
+            time.sleep(0.05)
+    for version, cached in api.state.cached_openapi.items():
+        document = cached._documents[f"/api/{version}"]
+        assert json.loads(document.variants["identity"])["info"]["version"] == API_VERSIONS[version]
@@ -0,0 +1,97 @@
+"""Tests for per-client rate limiting of HTTP requests."""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from template_demo.utils import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitBudget,
+    RateLimitMiddleware,
+    RateLimitSettings,
+    SQLiteRateLimitBackend,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> RateLimitBackend:
+    """Provide each rate limit backend."""
+    if request.param == "sqlite":
+        return SQLiteRateLimitBackend(tmp_path / "rate_limit.sqlite3")
+    return MemoryRateLimitBackend(max_keys=100)
+
+
+def test_token_bucket_allows_burst_then_refills(backend: RateLimitBackend) -> None:
+    """Test that buckets allow a burst of requests, then admit requests at the refill rate."""
+    assert [backend.acquire("client", 0.5, 3, 100.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert backend.acquire("client", 0.5, 3, 100.0) == pytest.approx(2.0)
+    assert backend.acquire("other", 0.5, 3, 100.0) == pytest.approx(0.0)
+
+    assert backend.acquire("client", 0.5, 3, 101.0) == pytest.approx(1.0)
+    assert backend.acquire("client", 0.5, 3, 102.0) == pytest.approx(0.0)
+    assert backend.acquire("client", 0.5, 3, 1000.0) == pytest.approx(0.0)
+    assert [backend.acquire("client", 0.5, 3, 1000.0) for _ in range(2)] == [0.0, 0.0]
+    assert backend.acquire("client", 0.5, 3, 1000.0) > 0
+
+
+def test_sqlite_backend_is_shared_by_processes_using_the_same_file(tmp_path: Path) -> None:
+    """Test that buckets in the sqlite backend hold across backends, e.g. of several workers."""
+    path = tmp_path / "rate_limit.sqlite3"
+    first, second = SQLiteRateLimitBackend(path), SQLiteRateLimitBackend(path)
+
+    assert first.acquire("client", 1.0, 2, 100.0) == pytest.approx(0.0)
+    assert second.acquire("client", 1.0, 2, 100.0) == pytest.approx(0.0)
+    assert first.acquire("client", 1.0, 2, 100.0) == pytest.approx(1.0)
+    assert second.acquire("client", 1.0, 2, 100.0) == pytest.approx(1.0)
+
+
+def test_memory_backend_forgets_least_recently_used_clients() -> None:
+    """Test that the memory backend keeps a bounded number of buckets."""
+    backend = MemoryRateLimitBackend(max_keys=1)
+    assert backend.acquire("first", 1.0, 1, 100.0) == pytest.approx(0.0)
+    assert backend.acquire("second", 1.0, 1, 100.0) == pytest.approx(0.0)
+    assert backend.acquire("first", 1.0, 1, 100.0) == pytest.approx(0.0)
+
+
+def test_rate_limit_middleware_limits_clients_per_route() -> None:
+    """Test that clients exceeding the budget of a route are rejected, identified by IP address."""
+    app = FastAPI()
+
+    @app.get("/v1/system/info")
+    def info() -> str:
+        return "info"
+
+    @app.get("/v1/hello")
+    def hello() -> str:
+        return "hello"
+
+    settings = RateLimitSettings(budgets={"/system/info": RateLimitBudget(requests_per_minute=1, burst=2)})
+    middleware = RateLimitMiddleware(app, settings, prefixes=["v1"])
+    client = TestClient(middleware)
+
+    assert [client.get("/v1/system/info").status_code for _ in range(2)] == [200, 200]
+    rejected = client.get("/v1/system/info")
+    assert rejected.status_code == 429
+    assert 0 < int(rejected.headers["retry-after"]) <= 60
+    assert TestClient(middleware, client=("10.0.0.2", 50000)).get("/v1/system/info").status_code == 200
+    assert all(client.get("/v1/hello").status_code == 200 for _ in range(5))
+    assert middleware.rejected == {"/system/info": 1}
+
+
+def test_rate_limit_middleware_ignores_presented_tokens() -> None:
+    """Test that clients cannot bypass their budget by presenting a different token with each request."""
+    app = FastAPI()
+
+    @app.get("/v1/system/info")
+    def info() -> str:
+        return "info"
+
+    settings = RateLimitSettings(budgets={"/system/info": RateLimitBudget(requests_per_minute=1, burst=2)})
+    client = TestClient(RateLimitMiddleware(app, settings, prefixes=["v1"]))
+
+    assert [client.get("/v1/system/info", params={"token": token}).status_code for token in "ab"] == [200, 200]
+    assert client.get("/v1/system/info", params={"token": "c"}).status_code == 429
+    assert client.get("/v1/system/info", headers={"Authorization": "Bearer d"}).status_code == 429
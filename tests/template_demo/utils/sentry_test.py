@@ -2,18 +2,27 @@
 
 import os
 import re
+import time
 from collections.abc import Generator
+from typing import Any
 from unittest import mock
 
 import pytest
+import sentry_sdk
+from fastapi.testclient import TestClient
 from pydantic import SecretStr
+from sentry_sdk.envelope import Envelope
+from sentry_sdk.transport import Transport
+from sentry_sdk.types import SamplingContext
 
-from template_demo.utils import get_logger
+from template_demo.api import create_app
+from template_demo.utils import SentrySettings, get_logger
 from template_demo.utils._sentry import (
     _ERR_MSG_INVALID_DOMAIN,
     _ERR_MSG_MISSING_NETLOC,
     _ERR_MSG_MISSING_SCHEME,
     _ERR_MSG_NON_HTTPS,
+    TransactionSampler,
     _validate_https_dsn,
     _validate_https_scheme,
     _validate_sentry_domain,
@@ -155,3 +164,158 @@ def test_sentry_initialize_with_valid_dsn(mock_environment: None) -> None:
 
         assert result is True  # Should return True when initialization is successful
         mock_sentry_init.assert_called_once()  # Should call sentry_sdk.init
+
+
+class _FakeTransport(Transport):
+    """Transport keeping envelopes in memory instead of sending them to Sentry."""
+
+    def __init__(self, options: dict[str, Any] | None = None) -> None:
+        super().__init__(options)
+        self.envelopes: list[Envelope] = []
+
+    def capture_envelope(self, envelope: Envelope) -> None:
+        self.envelopes.append(envelope)
+
+    def transactions(self) -> list[str]:
+        events = [envelope.get_transaction_event() for envelope in self.envelopes]
+        return [event["transaction"] for event in events if event is not None]
+
+
+@pytest.fixture
+def fake_transport(mock_environment: None) -> Generator[_FakeTransport, None, None]:
+    """Fixture to capture envelopes of Sentry initialized via sentry_initialize with a fake transport.
+
+    Yields:
+        _FakeTransport: The transport keeping captured envelopes.
+    """
+    transport = _FakeTransport()
+    init = sentry_sdk.init
+    with mock.patch("sentry_sdk.init", side_effect=lambda **kwargs: init(**kwargs, transport=transport)):
+        yield transport
+    sentry_sdk.get_client().close()
+    sentry_sdk.get_global_scope().set_client(None)
+
+
+def _run_transaction(name: str, status_code: int = 200, duration: float = 0.0) -> None:
+    with sentry_sdk.start_transaction(name=name, op="http.server") as transaction:
+        transaction.set_http_status(status_code)
+        if duration:
+            time.sleep(duration)
+
+
+def _initialize_with(**settings: object) -> None:
+    with mock.patch(
+        "template_demo.utils._sentry.load_settings",
+        return_value=SentrySettings.model_validate({"dsn": VALID_DSN, **settings}),
+    ):
+        assert sentry_initialize() is True
+
+
+def test_sentry_sampling_down_samples_health_probes(fake_transport: _FakeTransport) -> None:
+    """Test that health probes are dropped with a zero health rate while other routes are kept."""
+    _initialize_with(traces_sample_rate=1.0, traces_sample_rate_health=0.0)
+
+    _run_transaction("/api/v1/healthz")
+    _run_transaction("/api/v2/system/health")
+    _run_transaction("/api/v1/hello/world")
+    sentry_sdk.flush()
+
+    assert fake_transport.transactions() == ["/api/v1/hello/world"]
+
+
+def test_sentry_sampling_keeps_errors_and_slow_transactions(fake_transport: _FakeTransport) -> None:
+    """Test that server errors and slow transactions are kept even if the route rate is zero."""
+    _initialize_with(traces_sample_rate=0.0, traces_keep_errors=True, traces_slow_threshold=0.05)
+
+    _run_transaction("/api/v1/hello/fast")
+    _run_transaction("/api/v1/hello/client-error", status_code=404)
+    _run_transaction("/api/v1/hello/server-error", status_code=500)
+    _run_transaction("/api/v1/hello/slow", duration=0.06)
+    sentry_sdk.flush()
+
+    assert fake_transport.transactions() == ["/api/v1/hello/server-error", "/api/v1/hello/slow"]
+
+
+def test_sentry_sampling_by_route(fake_transport: _FakeTransport) -> None:
+    """Test that the rate of the longest matching route prefix applies."""
+    _initialize_with(
+        traces_sample_rate=0.0,
+        traces_sample_rates_by_route={"/api/v1": 0.0, "/api/v1/hello": 1.0},
+    )
+
+    _run_transaction("/api/v1/hello/world")
+    _run_transaction("/api/v1/system/info")
+    _run_transaction("/api/v2/hello/world")
+    sentry_sdk.flush()
+
+    assert fake_transport.transactions() == ["/api/v1/hello/world"]
+
+
+@pytest.mark.parametrize("traces_keep_errors", [False, True])
+def test_sentry_sampling_by_route_of_app_requests(fake_transport: _FakeTransport, traces_keep_errors: bool) -> None:
+    """Test that routes are matched by path for requests to the app, named by full URL when sampled."""
+    rates: dict[str, float] = {}
+    traces_sampler = TransactionSampler.traces_sampler
+
+    def record(sampler: TransactionSampler, sampling_context: SamplingContext) -> float:
+        rate = traces_sampler(sampler, sampling_context)
+        rates[sampling_context["transaction_context"]["name"]] = rate
+        return rate
+
+    with mock.patch.object(TransactionSampler, "traces_sampler", record):
+        _initialize_with(
+            traces_sample_rate=0.0,
+            traces_sample_rates_by_route={"/api/v1/hello": 1.0},
+            traces_keep_errors=traces_keep_errors,
+        )
+    client = TestClient(create_app())
+    client.get("/api/v1/hello/world")
+    client.get("/api/v1/system/info?token=wrong")
+    sentry_sdk.flush()
+
+    expected_rates = [1.0, 1.0] if traces_keep_errors else [1.0, 0.0]
+    assert rates == dict(
+        zip(
+            ["http://testserver/api/v1/hello/world", "http://testserver/api/v1/system/info"],
+            expected_rates,
+            strict=True,
+        )
+    )
+    assert fake_transport.transactions() == ["/hello/world"]
+
+
+def test_sentry_sampling_adapts_to_budget() -> None:
+    """Test that rates are lowered to the budget of sampled transactions per minute after a window of traffic."""
+    sampler = TransactionSampler(
+        SentrySettings.model_validate({"traces_sample_rate": 0.5, "traces_target_per_minute": 10})
+    )
+    context: SamplingContext = {"transaction_context": {"name": "/api/v1/hello/world"}, "parent_sampled": None}
+
+    with mock.patch("template_demo.utils._sentry.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = sampler._window_started_at
+        for _ in range(99):
+            sampler.traces_sampler(context)
+        assert sampler.route_rate("/api/v1/hello/world") == pytest.approx(0.5)
+        mock_monotonic.return_value = sampler._window_started_at + 60
+        sampler.traces_sampler(context)
+
+    assert sampler.route_rate("/api/v1/hello/world") == pytest.approx(0.1)
+    assert sampler.route_rate("/api/v1/healthz") == pytest.approx(0.001)
+
+
+def test_sentry_profiles_only_transactions_to_be_kept() -> None:
+    """Test that profiles are not recorded for health probes and transactions to be dropped."""
+    sampler = TransactionSampler(
+        SentrySettings.model_validate({
+            "traces_sample_rate": 0.5,
+            "profiles_sample_rate": 1.0,
+            "traces_keep_errors": True,
+        })
+    )
+
+    def context(name: str, trace_id: str) -> SamplingContext:
+        return {"transaction_context": {"name": name, "trace_id": trace_id}, "parent_sampled": None}
+
+    assert sampler.profiles_sampler(context("/api/v1/hello/world", "0" * 32)) == pytest.approx(1.0)
+    assert sampler.profiles_sampler(context("/api/v1/hello/world", "f" * 32)) == pytest.approx(0.0)
+    assert sampler.profiles_sampler(context("/api/v1/healthz", "0" * 32)) == pytest.approx(0.0)
@@ -0,0 +1,103 @@
+"""Tests for single-flight coalescing of concurrent calls."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from template_demo.utils import single_flight
+
+
+def test_concurrent_calls_share_one_call() -> None:
+    """Test that concurrent sync calls with the same arguments share one call, while others run on their own."""
+    release = threading.Event()
+    calls = []
+
+    @single_flight()
+    def compute(value: int, factor: int = 2) -> int:
+        calls.append(value)
+        release.wait(5)
+        return value * factor
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(compute, 21), executor.submit(compute, value=21), executor.submit(compute, 21, 2)]
+        other = executor.submit(compute, 1)
+        while len(calls) < 2:
+            release.wait(0.01)
+        release.wait(0.05)
+        release.set()
+        assert [future.result(5) for future in futures] == [42, 42, 42]
+        assert other.result(5) == 2
+    assert sorted(calls) == [1, 21]
+
+    assert compute(21) == 42
+    assert sorted(calls) == [1, 21, 21]
+
+
+def test_exception_is_shared_and_not_kept() -> None:
+    """Test that callers joining a failing call receive its exception, and later calls compute afresh."""
+    release = threading.Event()
+    calls: list[None] = []
+
+    @single_flight()
+    def fail() -> None:
+        calls.append(None)
+        release.wait(5)
+        raise ValueError
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(fail)]
+        while not calls:
+            release.wait(0.01)
+        futures.append(executor.submit(fail))
+        release.wait(0.05)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(5)
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        fail()
+    assert len(calls) == 2
+
+
+def test_methods_share_calls_across_instances() -> None:
+    """Test that the instance is not part of the key of methods."""
+
+    class Service:
+        calls = 0
+
+        @single_flight()
+        def health(self) -> str:  # noqa: PLR6301
+            Service.calls += 1
+            threading.Event().wait(0.1)
+            return "UP"
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert list(executor.map(lambda _: Service().health(), range(3))) == ["UP"] * 3
+    assert Service.calls == 1
+
+
+async def test_async_calls_share_one_call_despite_cancellation() -> None:
+    """Test that concurrent async calls share one call, which a cancelled caller does not cancel."""
+    release = asyncio.Event()
+    calls = []
+
+    @single_flight()
+    async def compute(value: int) -> int:
+        calls.append(value)
+        await release.wait()
+        return value * 2
+
+    cancelled = asyncio.create_task(compute(21))
+    joined = asyncio.create_task(compute(21))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await joined == 42
+    assert cancelled.cancelled()
+    assert calls == [21]
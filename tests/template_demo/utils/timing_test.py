@@ -0,0 +1,128 @@
+"""Tests for request timing and trace context."""
+
+import asyncio
+from collections.abc import Generator
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from template_demo.api import api
+from template_demo.utils import (
+    InMemorySpanExporter,
+    RequestTiming,
+    TimingMiddleware,
+    TimingSettings,
+    add_span_exporter,
+    remove_span_exporter,
+)
+
+HELLO_WORLD_PATH_V1 = "/api/v1/hello/world"
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+PARENT_SPAN_ID = "b7ad6b7169203331"
+TRACEPARENT = f"00-{TRACE_ID}-{PARENT_SPAN_ID}-01"
+
+
+@pytest.fixture
+def exporter() -> Generator[InMemorySpanExporter, None, None]:
+    """Provide an in-memory span exporter registered for the duration of the test.
+
+    Yields:
+        InMemorySpanExporter: The registered exporter.
+    """
+    exporter = InMemorySpanExporter()
+    add_span_exporter(exporter)
+    yield exporter
+    remove_span_exporter(exporter)
+
+
+def test_timing_server_timing_header_and_span(exporter: InMemorySpanExporter) -> None:
+    """Test that phases are exposed via Server-Timing and exported as span within the propagated trace."""
+    response = TestClient(api).get(HELLO_WORLD_PATH_V1, headers={"traceparent": TRACEPARENT, "x-request-id": "req-1"})
+
+    assert response.status_code == 200
+    assert response.headers["x-request-id"] == "req-1"
+    metrics = [metric.split(";")[0] for metric in response.headers["server-timing"].split(", ")]
+    assert metrics == ["routing", "dependencies", "handler", "serialization", "total"]
+
+    spans = [span for span in exporter.get_finished_spans() if span.request_id == "req-1"]
+    assert len(spans) == 1
+    span = spans[0]
+    assert span.name == f"GET {HELLO_WORLD_PATH_V1}"
+    assert span.trace_id == TRACE_ID
+    assert span.parent_span_id == PARENT_SPAN_ID
+    assert span.status_code == 200
+    assert list(span.phases) == ["routing", "dependencies", "handler", "serialization"]
+    assert all(duration >= 0 for duration in span.phases.values())
+    assert sum(span.phases.values()) <= span.duration
+
+
+def test_timing_unmatched_route_reports_total_only(exporter: InMemorySpanExporter) -> None:
+    """Test that requests not reaching a route only report the total duration."""
+    response = TestClient(api).get("/api/v1/does-not-exist", headers={"x-request-id": "req-404"})
+
+    assert response.status_code == 404
+    assert response.headers["server-timing"].startswith("total;dur=")
+    span = next(span for span in exporter.get_finished_spans() if span.request_id == "req-404")
+    assert span.phases == {}
+    assert span.status_code == 404
+
+
+def test_timing_from_headers_starts_new_trace_on_invalid_input() -> None:
+    """Test that malformed traceparent and request id headers are replaced."""
+    timing = RequestTiming.from_headers([(b"traceparent", b"00-invalid-01"), (b"x-request-id", b"bad id\n")])
+
+    assert len(timing.trace_id) == 32
+    assert timing.trace_id != TRACE_ID
+    assert timing.parent_span_id is None
+    assert len(timing.request_id) == 32
+
+
+def test_timing_middleware_disabled_passes_through() -> None:
+    """Test that the middleware neither adds headers nor exports spans when disabled."""
+    sent: list[dict] = []
+
+    async def app(scope: dict, receive: object, send: mock.AsyncMock) -> None:
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+
+    async def send(message: dict) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    middleware = TimingMiddleware(app, settings=TimingSettings(enabled=False))  # type: ignore[arg-type]
+    with mock.patch("template_demo.utils._timing._export") as mock_export:
+        asyncio.run(middleware({"type": "http", "method": "GET", "path": "/", "headers": []}, mock.AsyncMock(), send))
+
+    assert sent == [{"type": "http.response.start", "status": 204, "headers": []}]
+    mock_export.assert_not_called()
+
+
+def test_timing_failing_exporter_does_not_break_request(exporter: InMemorySpanExporter) -> None:
+    """Test that an exporter raising an exception neither fails the request nor starves other exporters."""
+    failing = mock.Mock()
+    failing.export.side_effect = RuntimeError("boom")
+    add_span_exporter(failing)
+    try:
+        response = TestClient(api).get(HELLO_WORLD_PATH_V1, headers={"x-request-id": "req-failing"})
+    finally:
+        remove_span_exporter(failing)
+
+    assert response.status_code == 200
+    failing.export.assert_called_once()
+    assert any(span.request_id == "req-failing" for span in exporter.get_finished_spans())
+
+
+def test_timing_middleware_skips_span_without_exporters() -> None:
+    """Test that the middleware does not build spans if no exporter is registered."""
+
+    async def app(scope: dict[str, object], receive: object, send: mock.AsyncMock) -> None:
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+
+    middleware = TimingMiddleware(app, settings=TimingSettings())
+    with mock.patch("template_demo.utils._timing.TimingSpan") as mock_span:
+        asyncio.run(
+            middleware(
+                {"type": "http", "method": "GET", "path": "/", "headers": []}, mock.AsyncMock(), mock.AsyncMock()
+            )
+        )
+
+    mock_span.assert_not_called()
@@ -0,0 +1,49 @@
+"""Tests for the warm worker pool."""
+
+import asyncio
+from collections.abc import Generator
+
+import pytest
+
+from template_demo.hello import Service
+from template_demo.utils import (
+    WorkerPoolSettings,
+    _worker_pool,
+    run_service_in_worker,
+    start_worker_pool,
+    stop_worker_pool,
+)
+
+
+@pytest.fixture
+def no_cached_services() -> Generator[None, None, None]:
+    """Forget service instances cached by the current process before and after the test."""
+    _worker_pool._services.clear()
+    yield
+    _worker_pool._services.clear()
+
+
+@pytest.mark.usefixtures("no_cached_services")
+def test_worker_pool_falls_back_to_thread_and_reuses_service() -> None:
+    """Test that without a running pool work runs in-process, instantiating the service once."""
+    results = asyncio.run(_run_twice())
+
+    assert results == [Service().get_hello_world()] * 2
+    assert list(_worker_pool._services) == [Service]
+
+
+@pytest.mark.usefixtures("no_cached_services")
+def test_worker_pool_runs_service_in_worker() -> None:
+    """Test that a started pool runs the service in a warm worker process."""
+    start_worker_pool(WorkerPoolSettings(size=1, preload=["template_demo.hello"]))
+    try:
+        results = asyncio.run(_run_twice())
+    finally:
+        stop_worker_pool()
+
+    assert results == [Service().get_hello_world()] * 2
+    assert _worker_pool._services == {}
+
+
+async def _run_twice() -> list[str]:
+    return [await run_service_in_worker(Service, "get_hello_world") for _ in range(2)]